@@ -0,0 +1,114 @@
+# backend/benchmark/cold_start_benchmark.py
+#
+# Cold start: engine könyvtár-szkennelés (régi CustomEngineLoader / FusionEngine
+# viselkedés) vs. lazy EngineRegistry. Minden mérés friss Python folyamatban fut.
+#
+#   python -m backend.benchmark.cold_start_benchmark [--repeat 5] [--constructions 3]
+#
+# Oszlopok: medián idő, betöltött modulok száma, nehéz függőségek
+# (torch / tensorflow / cv2 / pytesseract) a folyamatban.
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+import statistics
+
+
+RUNNER = """
+import sys, time, json
+t0 = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - t0
+heavy = [m for m in ("torch", "tensorflow", "cv2", "pytesseract") if m in sys.modules]
+print(json.dumps({{"seconds": elapsed, "modules": len(sys.modules), "heavy": heavy}}))
+"""
+
+# a régi viselkedés: os.listdir + import + fájlnévből kitalált osztály példányosítása
+SCAN = """
+import os, importlib
+for _ in range({n}):
+    for f in sorted(os.listdir(os.path.join("backend", "engine"))):
+        if not f.endswith(".py") or f.startswith("__") or "custom_engine_loader" in f:
+            continue
+        name = f[:-3]
+        try:
+            module = importlib.import_module("backend.engine." + name)
+            getattr(module, "".join(p.capitalize() for p in name.split("_")))({})
+        except Exception:
+            pass
+"""
+
+SCENARIOS = [
+    ("scan (régi), 1 konstrukció", SCAN.replace("{n}", "1")),
+    ("scan (régi), N konstrukció", SCAN),
+    ("registry: 1 engine", """
+from backend.core.engine_registry import get_engine
+get_engine("PoissonEngine", {})
+"""),
+    ("registry: load_all", """
+from backend.core.engine_registry import EngineRegistry
+EngineRegistry.shared().load_all({})
+"""),
+    ("registry: N loader + N fusion", """
+from backend.engine.custom_engine_loader import CustomEngineLoader
+from backend.core.fusion_engine import FusionEngine
+for _ in range({n}):
+    CustomEngineLoader({}).load_all_engines()
+    FusionEngine({}).engines
+"""),
+    ("chat_api import", """
+import backend.server.chat_api
+"""),
+    ("cli (backend.main) import", """
+import backend.main
+"""),
+]
+
+
+def run_once(body, cwd):
+    proc = subprocess.run(
+        [sys.executable, "-c", RUNNER.format(body=body)],
+        cwd=cwd, capture_output=True, text=True
+    )
+    lines = proc.stdout.strip().splitlines()
+    if proc.returncode != 0 or not lines:
+        err = (proc.stderr.strip().splitlines() or ["?"])[-1]
+        return None, err
+    return json.loads(lines[-1]), None
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Engine registry cold start benchmark")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--constructions", type=int, default=3,
+                    help="hány loader / FusionEngine / pipeline konstrukció egy folyamatban")
+    ap.add_argument("--root", default=os.getcwd(), help="repo gyökér (ahol a backend/ van)")
+    args = ap.parse_args(argv)
+
+    print(f"repeat: {args.repeat}   N = {args.constructions}")
+    print(f"{'scenario':<32} {'median s':>9} {'modules':>8}  heavy")
+
+    for name, body in SCENARIOS:
+        body = body.replace("{n}", str(args.constructions))
+
+        runs, err = [], None
+        for _ in range(args.repeat):
+            res, err = run_once(body, args.root)
+            if res is None:
+                break
+            runs.append(res)
+
+        if not runs:
+            print(f"{name:<32} {'hiba':>9}           {err}")
+            continue
+
+        median = statistics.median(r["seconds"] for r in runs)
+        print(f"{name:<32} {median:>9.3f} {runs[-1]['modules']:>8}  {','.join(runs[-1]['heavy']) or '-'}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
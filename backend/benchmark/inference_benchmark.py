@@ -0,0 +1,101 @@
+# backend/benchmark/inference_benchmark.py
+#
+# LSTM / GNN engine: meccsenkénti (batch=1) vs. slate szintű batch-elt inferencia.
+#
+#   python -m backend.benchmark.inference_benchmark [--matches 2000] [--batch 256]
+#
+# Kis, véletlen súlyú PyTorch modelleket használ (a valós modellek
+# architektúrájához hasonló bemeneti alakkal); PyTorch szükséges.
+
+import sys
+import time
+import argparse
+
+import numpy as np
+
+from backend.engine.lstm_rnn_engine import LSTM_RNN_Engine
+from backend.engine.gnn_engine import GNN_Engine
+
+
+def build_models(torch):
+    nn = torch.nn
+
+    class SeqNet(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.lstm = nn.LSTM(3, 32, batch_first=True)
+            self.head = nn.Linear(32, 1)
+
+        def forward(self, x):
+            out, _ = self.lstm(x)
+            return torch.sigmoid(self.head(out[:, -1]))
+
+    graph_net = nn.Sequential(
+        nn.Linear(11, 64), nn.ReLU(),
+        nn.Linear(64, 32), nn.ReLU(),
+        nn.Linear(32, 1), nn.Sigmoid()
+    )
+
+    return SeqNet().eval(), graph_net.eval()
+
+
+def build_slate(n, rng):
+    return {
+        f"m{i}": {
+            "form_sequence": list(rng.uniform(0, 1, 10)),
+            "xg_sequence": list(rng.uniform(0.3, 2.5, 10)),
+            "goals_sequence": list(rng.integers(0, 4, 10).astype(float)),
+            "rating_home": float(rng.uniform(0.8, 1.2)),
+            "rating_away": float(rng.uniform(0.8, 1.2)),
+            "xg_home": float(rng.uniform(0.5, 2.5)),
+            "xg_away": float(rng.uniform(0.5, 2.5)),
+        }
+        for i in range(n)
+    }
+
+
+def timed(engine, slate, batch):
+    engine.max_batch_size = batch
+    start = time.perf_counter()
+    out = engine.predict(slate)
+    return time.perf_counter() - start, out
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="LSTM/GNN batched inference benchmark")
+    ap.add_argument("--matches", type=int, default=2000)
+    ap.add_argument("--batch", type=int, default=256)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args(argv)
+
+    try:
+        import torch
+    except ImportError:
+        print("PyTorch nincs telepítve – a benchmark nem futtatható.")
+        return 1
+
+    torch.manual_seed(args.seed)
+    seq_net, graph_net = build_models(torch)
+    slate = build_slate(args.matches, np.random.default_rng(args.seed))
+
+    engines = [("LSTM_RNN", LSTM_RNN_Engine({}), seq_net), ("GNN", GNN_Engine({}), graph_net)]
+
+    print(f"matches: {args.matches}   max_batch_size: {args.batch}")
+    print(f"{'engine':<10} {'per-match/s':>12} {'batched/s':>12} {'speedup':>9} {'max |diff|':>11}")
+
+    for name, engine, model in engines:
+        engine.model = model
+
+        loop_s, loop_out = timed(engine, slate, 1)
+        batch_s, batch_out = timed(engine, slate, args.batch)
+
+        diff = max(abs(loop_out[m]["probability"] - batch_out[m]["probability"]) for m in slate)
+
+        print(f"{name:<10} {args.matches / loop_s:>12.0f} {args.matches / batch_s:>12.0f} "
+              f"{loop_s / batch_s:>8.1f}x {diff:>11.2e}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+# backend/benchmark/parser_benchmark.py
+#
+# HTML parse benchmark mentett fixture oldalakon.
+#
+#   python -m backend.benchmark.parser_benchmark [fixture_dir] [--repeat N]
+#
+# Minden .html fájlra: parse idő (ms/oldal) és peak memória (KB)
+#   • html.parser   teljes fa
+#   • html.parser   célzott részfa (SoupStrainer)
+#   • lxml          teljes fa            (ha telepítve)
+#   • lxml          célzott részfa       (ha telepítve)
+#
+# Ha a könyvtár üres / nem létezik → szintetikus TippmixPro oldalt mér.
+
+import os
+import sys
+import time
+import argparse
+import importlib.util
+import tracemalloc
+
+from backend.scraper.html_parser import parse_html, only
+
+
+DEFAULT_FIXTURES = os.path.join("backend", "data", "fixtures", "html")
+
+# fájlnév előtag → releváns részfa (a scraperek ugyanezt szűrik)
+TARGETS = {
+    "tippmix_event": only(["div", "button"], "market", "odd-button"),
+    "tippmix_offer": only("div", "match-item"),
+    "oddsportal": only("div", "eventRow"),
+}
+DEFAULT_TARGET = only(["div", "button"], "market", "odd-button", "match-item", "eventRow")
+
+
+def synthetic_event_page(markets=60, filler=400):
+    """TippmixPro-szerű esemény oldal sok irreleváns markuppal."""
+    parts = ["<html><head><script>var x = 1;</script></head><body>"]
+    for i in range(filler):
+        parts.append(f'<div class="nav-item"><a href="/x/{i}"><span>Menü {i}</span></a></div>')
+    for m in range(markets):
+        parts.append(f'<div class="market"><div class="market-title">Piac {m} 1X2</div>')
+        for label, value in (("1", 1.85), ("X", 3.40), ("2", 4.20)):
+            parts.append(
+                f'<button class="odd-button"><span class="label">{label}</span>'
+                f'<span class="value">{value}</span></button>'
+            )
+        parts.append("</div>")
+    parts.append("</body></html>")
+    return "".join(parts)
+
+
+def load_pages(fixture_dir):
+    pages = []
+    if os.path.isdir(fixture_dir):
+        for name in sorted(os.listdir(fixture_dir)):
+            if name.endswith(".html"):
+                with open(os.path.join(fixture_dir, name), encoding="utf-8", errors="replace") as f:
+                    pages.append((name, f.read()))
+
+    if not pages:
+        pages.append(("synthetic_tippmix_event.html", synthetic_event_page()))
+
+    return pages
+
+
+def target_for(name):
+    for prefix, strainer in TARGETS.items():
+        if name.startswith(prefix):
+            return strainer
+    return DEFAULT_TARGET
+
+
+def measure(html, parser, strainer, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse_html(html, strainer, parser=parser)
+    elapsed = (time.perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    parse_html(html, strainer, parser=parser)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed * 1000, peak / 1024
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="HTML parse benchmark")
+    ap.add_argument("fixture_dir", nargs="?", default=DEFAULT_FIXTURES)
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args(argv)
+
+    parsers = ["html.parser"]
+    if importlib.util.find_spec("lxml"):
+        parsers.append("lxml")
+
+    pages = load_pages(args.fixture_dir)
+
+    print(f"{'page':<36} {'KB':>7} {'parser':<12} {'mode':<8} {'ms/page':>9} {'peak KB':>9}")
+
+    for name, html in pages:
+        size = len(html.encode("utf-8")) / 1024
+        for parser in parsers:
+            for mode, strainer in (("full", None), ("subtree", target_for(name))):
+                ms, peak = measure(html, parser, strainer, args.repeat)
+                print(f"{name[:36]:<36} {size:>7.1f} {parser:<12} {mode:<8} {ms:>9.2f} {peak:>9.0f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+# backend/benchmark/pipeline_benchmark.py
+#
+# MasterPipeline slate wall time: soros vs. staged párhuzamos mód, meccsszám függvényében.
+# A scraperek a record/replay transporton futnak (offline, konfigurálható latency).
+#
+#   python -m backend.benchmark.pipeline_benchmark --sizes 10 50 200 \
+#          --latency 0.08 --io-workers 16 --model-workers 8
+#
+# A report / ROI mentés kimarad (MasterPipeline.evaluate).
+
+import sys
+import time
+import argparse
+
+from backend.scraper.http_cache import HttpCache
+from backend.scraper.rate_limiter import HostGuardRegistry
+from backend.scraper.replay_transport import install_replay
+from backend.pipeline.master_pipeline import MasterPipeline
+from backend.benchmark.scraper_benchmark import DEFAULT_FIXTURES, SAMPLE_SLATE
+
+
+def build_slate(n):
+    matches = []
+    for i in range(n):
+        base = SAMPLE_SLATE[i % len(SAMPLE_SLATE)]
+        matches.append({
+            "id": f"bench-{i}",
+            "home": base["home"],
+            "away": base["away"],
+            "stats": {"home": {"xG": 1.4}, "away": {"xG": 1.1}, "match": {}},
+        })
+    return matches
+
+
+def build_pipeline(args, parallel):
+    config = {
+        "pipeline": {
+            "parallel": parallel,
+            "io_workers": args.io_workers,
+            "model_workers": args.model_workers,
+            "seed": args.seed,
+        },
+        "closing_line": {"seed": args.seed},
+    }
+    pipeline = MasterPipeline(config)
+
+    for session in (pipeline.odds.session, pipeline.markets.session, pipeline.tippmix.session):
+        install_replay(session, args.fixtures, mode="replay",
+                       latency=args.latency, jitter=args.jitter, seed=args.seed)
+
+    return pipeline
+
+
+def timed(pipeline, matches):
+    HttpCache.shared().clear()
+    start = time.perf_counter()
+    tips, _ = pipeline.evaluate(matches)
+    return time.perf_counter() - start, tips
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="MasterPipeline sequential vs staged parallel benchmark")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 200])
+    ap.add_argument("--fixtures", default=DEFAULT_FIXTURES)
+    ap.add_argument("--latency", type=float, default=0.05)
+    ap.add_argument("--jitter", type=float, default=0.02)
+    ap.add_argument("--io-workers", type=int, default=16)
+    ap.add_argument("--model-workers", type=int, default=4)
+    ap.add_argument("--seed", type=int, default=42)
+    args = ap.parse_args(argv)
+
+    # replay alatt a rate limiter csak torzítaná a mérést
+    HostGuardRegistry.shared({"rate_limit": {"enabled": False}})
+
+    sequential = build_pipeline(args, parallel=False)
+    parallel = build_pipeline(args, parallel=True)
+
+    print(f"{'matches':>8} {'sequential s':>13} {'parallel s':>11} {'speedup':>8} {'tips':>5} {'saved s':>8} {'identical':>10}")
+
+    for n in args.sizes:
+        matches = build_slate(n)
+
+        seq_s, seq_tips = timed(sequential, matches)
+        par_s, par_tips = timed(parallel, matches)
+
+        same = [t.get("odds") for t in seq_tips] == [t.get("odds") for t in par_tips]
+        print(f"{n:>8} {seq_s:>13.2f} {par_s:>11.2f} {seq_s / par_s:>7.1f}x {len(par_tips):>5} "
+              f"{parallel.filter_stats['estimated_saved_s']:>8.2f} {str(same):>10}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
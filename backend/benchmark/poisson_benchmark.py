@@ -0,0 +1,61 @@
+# backend/benchmark/poisson_benchmark.py
+#
+# PoissonEngine: meccsenkénti (Python ciklus) vs. vektorizált slate út.
+#
+#   python -m backend.benchmark.poisson_benchmark [--sizes 1000 100000]
+#
+# A meccsenkénti utat legfeljebb --loop-cap meccsen mérjük, nagyobb
+# slate-re lineárisan extrapolálunk (jelölve).
+
+import sys
+import time
+import argparse
+
+import numpy as np
+
+from backend.engine.poisson_engine import PoissonEngine
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Poisson per-match vs batch benchmark")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000])
+    ap.add_argument("--loop-cap", type=int, default=2000)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args(argv)
+
+    engine = PoissonEngine({})
+    rng = np.random.default_rng(args.seed)
+
+    print(f"{'matches':>9} {'loop s':>10} {'batch s':>10} {'speedup':>9} {'max |diff|':>11}")
+
+    for n in args.sizes:
+        xg_home = rng.uniform(0.4, 2.8, n)
+        xg_away = rng.uniform(0.3, 2.4, n)
+        rows = [{"xg_home": h, "xg_away": a} for h, a in zip(xg_home, xg_away)]
+
+        lams = [engine._lambdas(r) for r in rows]
+        lam_h = np.array([l[0] for l in lams])
+        lam_a = np.array([l[1] for l in lams])
+
+        # meccsenkénti út
+        m = min(n, args.loop_cap)
+        start = time.perf_counter()
+        loop = [engine._calculate_poisson_prob(r) for r in rows[:m]]
+        loop_s = (time.perf_counter() - start) * n / m
+
+        # vektorizált út
+        start = time.perf_counter()
+        batch = engine.predict_batch(lam_h, lam_a)
+        batch_s = time.perf_counter() - start
+
+        diff = float(np.max(np.abs(np.array(loop) - batch["home"][:m])))
+        note = "*" if m < n else " "
+
+        print(f"{n:>9} {loop_s:>9.3f}{note} {batch_s:>10.4f} {loop_s / batch_s:>8.0f}x {diff:>11.2e}")
+
+    print("* extrapolált a --loop-cap méretű mintából")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+# backend/benchmark/scraper_benchmark.py
+#
+# Scraper réteg throughput benchmark – teljesen offline, rögzített fixture-ökön.
+#
+#   Rögzítés (élő oldalakról, egyszer):
+#     python -m backend.benchmark.scraper_benchmark --record --slate slate.json
+#
+#   Visszajátszás (CI):
+#     python -m backend.benchmark.scraper_benchmark --slate slate.json \
+#            --latency 0.08 --jitter 0.04
+#
+# slate.json: [{"match_id": "...", "home": "...", "away": "..."}, ...]
+#
+# Riport: meccs/mp, p50/p95 meccsenkénti latency, átvitt byte-ok, kérésszám.
+
+import sys
+import json
+import time
+import argparse
+import os
+
+import numpy as np
+
+from backend.scraper.http_cache import HttpCache
+from backend.scraper.rate_limiter import HostGuardRegistry
+from backend.scraper.replay_transport import install_replay
+from backend.scraper.odds_aggregator import OddsAggregator
+from backend.scraper.tippmixpro_scraper import TippmixProScraper
+from backend.scraper.market_odds_aggregator import MarketOddsAggregator
+from backend.scraper.result_scraper import ResultScraper
+
+
+DEFAULT_FIXTURES = os.path.join("backend", "data", "fixtures", "replay")
+
+SAMPLE_SLATE = [
+    {"match_id": "1", "home": "Liverpool", "away": "Arsenal"},
+    {"match_id": "2", "home": "Chelsea", "away": "Tottenham"},
+    {"match_id": "3", "home": "Barcelona", "away": "Real Madrid"},
+    {"match_id": "4", "home": "Bayern", "away": "Dortmund"},
+    {"match_id": "5", "home": "Juventus", "away": "Inter"},
+    {"match_id": "6", "home": "Milan", "away": "Napoli"},
+]
+
+
+def load_slate(path):
+    if not path:
+        return SAMPLE_SLATE
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def build_scrapers(config):
+    return {
+        "odds": OddsAggregator(config),
+        "tippmix": TippmixProScraper(config),
+        "markets": MarketOddsAggregator(config),
+        "results": ResultScraper(config),
+    }
+
+
+def run(slate, scrapers):
+    """Meccsenként a teljes scraper kör; vissza: latency lista (mp)."""
+    latencies = []
+    for m in slate:
+        start = time.perf_counter()
+
+        scrapers["odds"].get_aggregated_odds(m["home"], m["away"])
+        scrapers["tippmix"].check_match(m["home"], m["away"])
+        scrapers["markets"].get_markets(m["home"], m["away"])
+        scrapers["results"].get_result(m["match_id"])
+
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Scraper throughput benchmark (record/replay)")
+    ap.add_argument("--fixtures", default=DEFAULT_FIXTURES)
+    ap.add_argument("--slate", default=None)
+    ap.add_argument("--record", action="store_true")
+    ap.add_argument("--latency", type=float, default=0.05)
+    ap.add_argument("--jitter", type=float, default=0.02)
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--no-cache", action="store_true", help="HttpCache kikapcsolása")
+    ap.add_argument("--rate-limit", action="store_true", help="host rate limiter bekapcsolva")
+    args = ap.parse_args(argv)
+
+    # replay alatt a rate limiter csak torzítaná a mérést
+    if not args.rate_limit:
+        HostGuardRegistry.shared({"rate_limit": {"enabled": False}})
+
+    slate = load_slate(args.slate)
+    scrapers = build_scrapers({})
+
+    HttpCache.shared().clear()
+
+    mode = "record" if args.record else "replay"
+    adapters = []
+    for s in scrapers.values():
+        adapters.append(install_replay(
+            s.session, args.fixtures, mode=mode,
+            latency=args.latency, jitter=args.jitter, seed=args.seed
+        ))
+        if args.no_cache:
+            s.session.ttl = 0
+
+    wall_start = time.perf_counter()
+    latencies = run(slate, scrapers)
+    wall = time.perf_counter() - wall_start
+
+    scrapers["odds"].close()
+
+    totals = {"requests": 0, "bytes": 0, "missing": 0, "recorded": 0}
+    for a in adapters:
+        for k, v in a.stats().items():
+            totals[k] += v
+
+    lat_ms = np.array(latencies) * 1000
+    cache = HttpCache.shared().stats()
+
+    print(f"mode            : {mode}")
+    print(f"matches         : {len(slate)}")
+    print(f"wall time       : {wall:.3f} s")
+    print(f"throughput      : {len(slate) / wall:.2f} matches/s")
+    print(f"latency p50     : {np.percentile(lat_ms, 50):.1f} ms")
+    print(f"latency p95     : {np.percentile(lat_ms, 95):.1f} ms")
+    print(f"requests        : {totals['requests']}  (missing fixtures: {totals['missing']})")
+    print(f"bytes           : {totals['bytes']}")
+    print(f"cache hit ratio : {cache['hit_ratio']}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+# backend/core/batch_inference.py
+
+import numpy as np
+
+
+def _torch_context(torch):
+    # inference_mode: torch >= 1.9; régebbin no_grad
+    ctx = getattr(torch, "inference_mode", None)
+    return ctx() if ctx is not None else torch.no_grad()
+
+
+def _first_output(out, n):
+    """Modell kimenet → (n,) tömb (az első kimeneti oszlop)."""
+    out = np.asarray(out, dtype=float).reshape(n, -1)
+    return out[:, 0]
+
+
+def predict_batched(model, inputs, max_batch_size=256):
+    """
+    (N, ...) bemenet → (N,) modell kimenet, max_batch_size-os forward
+    passokban (nem meccsenként egyesével).
+
+        • Keras:   model.predict(chunk, batch_size=len(chunk))
+        • PyTorch: model(tensor) torch.inference_mode alatt
+
+    Hibát nem nyel el – a fallbacket a hívó engine kezeli.
+    """
+    inputs = np.asarray(inputs, dtype=np.float32)
+    n = len(inputs)
+    out = np.empty(n)
+    if n == 0:
+        return out
+
+    step = max(1, int(max_batch_size or n))
+
+    if hasattr(model, "predict"):  # KERAS
+        for start in range(0, n, step):
+            chunk = inputs[start:start + step]
+            try:
+                pred = model.predict(chunk, batch_size=len(chunk), verbose=0)
+            except TypeError:
+                pred = model.predict(chunk, batch_size=len(chunk))
+            out[start:start + len(chunk)] = _first_output(pred, len(chunk))
+        return out
+
+    import torch  # PYTORCH
+
+    with _torch_context(torch):
+        for start in range(0, n, step):
+            chunk = torch.from_numpy(inputs[start:start + step])
+            pred = model(chunk).detach().cpu().numpy()
+            out[start:start + len(chunk)] = _first_output(pred, len(chunk))
+
+    return out
@@ -0,0 +1,45 @@
+# backend/core/engine_kernels.py
+#
+# Közös normalize / confidence / risk kernelek az engine-eknek.
+# Teljes probability tömbökön futnak egy NumPy menetben (skalárra is jók);
+# az engine-ek csak az együtthatóikat deklarálják osztályattribútumként:
+#
+#     QUALITY_KEY = "data_quality"       # adatminőség mező a bemenetben
+#     QUALITY_DEFAULT = 0.85
+#     CONF_WEIGHTS = {"quality": 0.5, "stability": 0.5}   (+ opcionális "prob")
+#     RISK_WEIGHTS = {"prob": 0.6, "conf": 0.4}
+
+import numpy as np
+
+
+def normalize(prob, scaling=1.0, lo=0.01, hi=0.99):
+    """prob · scaling, [lo, hi] közé vágva."""
+    return np.clip(np.asarray(prob, dtype=float) * scaling, lo, hi)
+
+
+def stability(prob):
+    """Minél távolabb van 0.5-től, annál kisebb: 1 − |p − 0.5|."""
+    return 1 - np.abs(np.asarray(prob, dtype=float) - 0.5)
+
+
+def confidence(prob, quality, weights, min_conf=0.0):
+    """
+    conf = quality·w_q + stability·w_s + prob·w_p, [min_conf, 1] közé vágva.
+    A hiányzó súly 0.
+    """
+    prob = np.asarray(prob, dtype=float)
+    conf = (
+        np.asarray(quality, dtype=float) * weights.get("quality", 0.0) +
+        stability(prob) * weights.get("stability", 0.0) +
+        prob * weights.get("prob", 0.0)
+    )
+    return np.clip(conf, min_conf, 1.0)
+
+
+def risk(prob, conf, weights):
+    """risk = (1 − prob)·w_p + (1 − conf)·w_c, [0, 1] közé vágva."""
+    r = (
+        (1 - np.asarray(prob, dtype=float)) * weights.get("prob", 0.5) +
+        (1 - np.asarray(conf, dtype=float)) * weights.get("conf", 0.5)
+    )
+    return np.clip(r, 0.0, 1.0)
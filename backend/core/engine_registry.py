@@ -0,0 +1,161 @@
+# backend/core/engine_registry.py
+
+import json
+import hashlib
+import importlib
+import threading
+
+from backend.utils.logger import get_logger
+
+
+# ======================================================================
+# MANIFEST: engine név → (modul, osztály, config szekció)
+# ----------------------------------------------------------------------
+# A könyvtár-szkennelés (os.listdir + fájlnévből kitalált osztálynév)
+# helyett: semmi nem importálódik, amíg nem kérik az adott engine-t.
+# A config szekció az, amit az engine a saját configjából olvas – ez
+# adja a singleton kulcs ujjlenyomatát.
+# ======================================================================
+MANIFEST = {
+    "PoissonEngine": ("backend.engine.poisson_engine", "PoissonEngine", "poisson"),
+    "MonteCarloV3Engine": ("backend.engine.montecarlo_v3_engine", "MonteCarloV3Engine", "montecarlo"),
+    "GNN_Engine": ("backend.engine.gnn_engine", "GNN_Engine", "gnn"),
+    "LSTM_RNN_Engine": ("backend.engine.lstm_rnn_engine", "LSTM_RNN_Engine", "lstm"),
+    "GameflowEngine": ("backend.engine.gameflow_engine", "GameflowEngine", "gameflow"),
+    "InjuryEngine": ("backend.engine.injury_engine", "InjuryEngine", "injury"),
+    "ScorePredEngine": ("backend.engine.score_pred_engine", "ScorePredEngine", "score_pred"),
+    "PublicMoneyEngine": ("backend.engine.public_money_engine", "PublicMoneyEngine", "public"),
+    "PsychologicalBiasEngine": ("backend.engine.psychological_bias_engine", "PsychologicalBiasEngine", "psybias"),
+    "QuantumSynthEngine": ("backend.engine.quantum_synth_engine", "QuantumSynthEngine", "quantum"),
+    "OddsmakerEmulatorEngine": ("backend.engine.oddsmaker_emulator_engine", "OddsmakerEmulatorEngine", "odds_emulator"),
+    "CrossMarketArbitrageEngine": ("backend.engine.cross_market_arbitrage_engine", "CrossMarketArbitrageEngine", "cross_market"),
+    "MarketMicrostructureEngine": ("backend.engine.market_microstructure_engine", "MarketMicrostructureEngine", "market_micro"),
+    "GameStateProjectionEngine": ("backend.engine.game_state_projection_engine", "GameStateProjectionEngine", "game_state"),
+    "DataQualityEngine": ("backend.engine.data_quality_engine", "DataQualityEngine", "data_quality"),
+    "ConfidenceCalibrationEngine": ("backend.engine.confidence_calibration_engine", "ConfidenceCalibrationEngine", "calibration"),
+    "ClosingLinePredictor": ("backend.engine.closing_line_predictor_engine", "ClosingLinePredictor", "closing_line"),
+    "TrendEngine": ("backend.engine.trend_engine", "TrendEngine", "trend"),
+    "WeatherEngine": ("backend.engine.weather_engine", "WeatherEngine", "weather"),
+    "TemporaryEngine": ("backend.engine.temporary_engine", "TemporaryEngine", "temporary"),
+    "LiveEngine": ("backend.engine.live_engine", "LiveEngine", None),
+    "DeepValueEngine": ("backend.engine.deep_value.deep_value_engine", "DeepValueEngine", "deep_value"),
+    "OCREngine": ("backend.engine.ocr_engine", "OCREngine", None),
+}
+
+# nehéz függőségű engine-ek (torch, cv2, pytesseract) – load_all() kihagyja,
+# csak név szerinti kérésre töltődnek be
+ON_DEMAND = frozenset({"DeepValueEngine", "OCREngine"})
+
+
+class EngineRegistry:
+    """
+    ENGINE REGISTRY – LAZY EDITION
+    ------------------------------
+    Feladata:
+        • folyamat-szintű engine registry a MANIFEST alapján
+        • az engine modul importja az első kéréskor történik
+        • példányok megosztott singletonok: kulcs = név + a config
+          szekció ujjlenyomata (eltérő config → külön példány)
+        • sikertelen import / példányosítás → None + errors bejegyzés,
+          a hívó dönt a fallbackről (pl. TemporaryEngine)
+
+    Használat:
+        registry = EngineRegistry.shared()
+        poisson = registry.get("PoissonEngine", config)
+        engines = registry.load_all(config)
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, manifest=None):
+        self.manifest = dict(manifest or MANIFEST)
+        self.logger = get_logger()
+
+        self._lock = threading.RLock()
+        self._classes = {}       # név → osztály
+        self._instances = {}     # (név, ujjlenyomat) → példány
+        self.errors = {}         # név → hibaüzenet
+
+    @classmethod
+    def shared(cls):
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    # ------------------------------------------------------------------
+    # MANIFEST
+    # ------------------------------------------------------------------
+    def names(self, include_on_demand=False):
+        return [n for n in self.manifest if include_on_demand or n not in ON_DEMAND]
+
+    def engine_class(self, name):
+        """Az engine osztálya – itt importálódik a modul (egyszer)."""
+        with self._lock:
+            if name in self._classes:
+                return self._classes[name]
+
+            module_name, class_name, _ = self.manifest[name]
+            engine_class = getattr(importlib.import_module(module_name), class_name)
+
+            self._classes[name] = engine_class
+            return engine_class
+
+    def _fingerprint(self, name, config):
+        section = self.manifest[name][2]
+        data = config.get(section, {}) if section else config
+        raw = json.dumps(data, sort_keys=True, default=str)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:12]
+
+    # ------------------------------------------------------------------
+    # PÉLDÁNYOK
+    # ------------------------------------------------------------------
+    def get(self, name, config=None):
+        """Megosztott engine példány, vagy None (ismeretlen név / betöltési hiba)."""
+        config = config or {}
+
+        if name not in self.manifest:
+            self.logger.warning(f"[EngineRegistry] Ismeretlen engine: {name}")
+            return None
+
+        key = (name, self._fingerprint(name, config))
+
+        with self._lock:
+            if key in self._instances:
+                return self._instances[key]
+
+            try:
+                instance = self.engine_class(name)(config)
+            except Exception as e:
+                self.errors[name] = str(e)
+                self.logger.error(f"[EngineRegistry] {name} betöltése sikertelen: {e}")
+                return None
+
+            self.errors.pop(name, None)
+            self._instances[key] = instance
+            return instance
+
+    def load_all(self, config=None, include_on_demand=False):
+        """{név: példány} minden betölthető engine-re (ON_DEMAND nélkül)."""
+        engines = {}
+        for name in self.names(include_on_demand):
+            instance = self.get(name, config)
+            if instance is not None:
+                engines[name] = instance
+        return engines
+
+    def loaded(self):
+        """A már importált engine-ek nevei."""
+        with self._lock:
+            return sorted(self._classes)
+
+    def clear(self):
+        with self._lock:
+            self._instances = {}
+            self.errors = {}
+
+
+def get_engine(name, config=None):
+    """EngineRegistry.shared().get(name, config) rövidítés."""
+    return EngineRegistry.shared().get(name, config)
@@ -0,0 +1,264 @@
+# backend/core/engine_scheduler.py
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from backend.utils.logger import get_logger
+from backend.core.match_frame import MatchFrame
+
+
+class EngineScheduler:
+    """
+    ENGINE SCHEDULER – DAG EDITION
+    ------------------------------
+    Feladata:
+        • az engine-ek deklarált bemenetei / kimenete alapján függőségi
+          gráf (DAG) építése – topologikus sorrend, körfigyelés
+        • a független engine-ek párhuzamos futtatása (thread pool);
+          egy node akkor indul, amikor minden bemenete elkészült
+        • közös köztes eredmények (pl. match_frame) egyszeri számítása,
+          minden fogyasztó ugyanazt a példányt kapja
+        • hibás / hiányzó node → TemporaryEngine fallback output
+        • kritikus út + szűk keresztmetszet (bottleneck engine) riport
+
+    Engine deklaráció (osztályattribútumok):
+        DAG_OUTPUT = "poisson"              # a kimenet neve a gráfban
+        DAG_INPUTS = ("match_frame",)       # források / más node-ok kimenetei
+        DAG_METHOD = "predict"              # opcionális, alapból "predict"
+
+        Egy bemenet  → method(érték)
+        Több bemenet → method({bemenet_név: érték})
+
+    Használat:
+        scheduler = EngineScheduler.from_engines(config, engines, fallback=temp_engine)
+        outputs = scheduler.run({"match_data": match_data})
+        scheduler.last_report["bottleneck"]
+    """
+
+    # beépített köztes node-ok: név → (bemenetek, függvény)
+    INTERMEDIATES = {
+        "match_frame": (("match_data",), MatchFrame.from_dict),
+    }
+
+    def __init__(self, config=None, fallback=None):
+        self.config = config or {}
+        self.logger = get_logger()
+
+        c = self.config.get("engine_scheduler", {})
+        self.parallel = c.get("parallel", True)
+        self.workers = c.get("workers", 8)
+
+        self.fallback = fallback
+        self.nodes = {}          # név → {"fn", "inputs", "engine"}
+        self.last_report = None
+
+    # ======================================================================
+    # GRÁF ÉPÍTÉS
+    # ======================================================================
+    @classmethod
+    def from_engines(cls, config, engines, fallback=None):
+        scheduler = cls(config, fallback)
+        for engine in engines:
+            scheduler.add_engine(engine)
+        return scheduler
+
+    def add(self, name, fn, inputs=(), engine=None):
+        if name in self.nodes:
+            self.logger.warning(f"[EngineScheduler] Duplikált node felülírva: {name}")
+        self.nodes[name] = {"fn": fn, "inputs": tuple(inputs), "engine": engine or name}
+
+    def add_engine(self, engine):
+        """DAG_OUTPUT nélküli engine nem kerül a gráfba (False)."""
+        name = getattr(engine, "DAG_OUTPUT", None)
+        if not name:
+            return False
+
+        method = getattr(engine, getattr(engine, "DAG_METHOD", "predict"), None)
+        if method is None:
+            self.logger.error(f"[EngineScheduler] {type(engine).__name__}: nincs DAG metódus")
+            return False
+
+        self.add(name, method, getattr(engine, "DAG_INPUTS", ("match_data",)), type(engine).__name__)
+        return True
+
+    def _resolve(self, sources):
+        """Igényelt köztes node-ok hozzáadása + hiányzó bemenetek listája."""
+        for node in list(self.nodes.values()):
+            for name in node["inputs"]:
+                if name in self.INTERMEDIATES and name not in self.nodes and name not in sources:
+                    inputs, fn = self.INTERMEDIATES[name]
+                    self.add(name, fn, inputs)
+
+        return sorted({
+            name
+            for node in self.nodes.values()
+            for name in node["inputs"]
+            if name not in self.nodes and name not in sources
+        })
+
+    def _topo_order(self):
+        indeg = {n: 0 for n in self.nodes}
+        dependents = {n: [] for n in self.nodes}
+
+        for n, node in self.nodes.items():
+            for dep in node["inputs"]:
+                if dep in self.nodes:
+                    indeg[n] += 1
+                    dependents[dep].append(n)
+
+        ready = [n for n, d in indeg.items() if d == 0]
+        order = []
+        while ready:
+            n = ready.pop(0)
+            order.append(n)
+            for m in dependents[n]:
+                indeg[m] -= 1
+                if indeg[m] == 0:
+                    ready.append(m)
+
+        if len(order) != len(self.nodes):
+            cycle = sorted(n for n, d in indeg.items() if d > 0)
+            raise ValueError(f"EngineScheduler: körkörös függőség: {cycle}")
+
+        return order, dependents
+
+    # ======================================================================
+    # FUTTATÁS
+    # ======================================================================
+    def run(self, sources):
+        """
+        sources: {"match_data": {...}, ...}
+        Vissza: {engine_output_név: output} – a források, a hiányzó
+        bemenetek fallbackjei és a köztes node-ok (INTERMEDIATES) nélkül
+        """
+        memo = dict(sources)
+        missing = self._resolve(memo)
+        order, dependents = self._topo_order()
+        timings = {}
+
+        # hiányzó bemenet → fallback output, a fogyasztó node ettől még fut
+        for name in missing:
+            self.logger.warning(f"[EngineScheduler] Hiányzó bemenet: {name} → TemporaryEngine")
+            memo[name] = self._fallback_output(name, memo)
+
+        start = time.perf_counter()
+
+        if not self.parallel or self.workers <= 1 or len(order) <= 1:
+            for name in order:
+                self._run_node(name, memo, timings, start)
+        else:
+            self._run_parallel(order, dependents, memo, timings, start)
+
+        wall = time.perf_counter() - start
+        self.last_report = self._report(order, timings, wall, missing)
+
+        b = self.last_report["bottleneck"]
+        if b:
+            self.logger.info(
+                f"[EngineScheduler] {len(order)} node, {wall:.3f}s "
+                f"(soros: {self.last_report['serial_s']:.3f}s), bottleneck: {b} "
+                f"({timings[b]['seconds']:.3f}s)"
+            )
+
+        return {
+            name: memo[name]
+            for name in order
+            if name not in self.INTERMEDIATES and name not in sources
+        }
+
+    def _run_parallel(self, order, dependents, memo, timings, start):
+        waiting = {
+            n: sum(1 for d in self.nodes[n]["inputs"] if d in self.nodes)
+            for n in order
+        }
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(order))) as pool:
+            futures = {
+                pool.submit(self._run_node, n, memo, timings, start): n
+                for n in order if waiting[n] == 0
+            }
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for f in done:
+                    n = futures.pop(f)
+                    for m in dependents[n]:
+                        waiting[m] -= 1
+                        if waiting[m] == 0:
+                            futures[pool.submit(self._run_node, m, memo, timings, start)] = m
+
+    def _run_node(self, name, memo, timings, origin):
+        node = self.nodes[name]
+        inputs = node["inputs"]
+        t0 = time.perf_counter()
+
+        try:
+            if len(inputs) == 1:
+                out = node["fn"](memo[inputs[0]])
+            else:
+                out = node["fn"]({i: memo[i] for i in inputs})
+            status = "ok"
+        except Exception as e:
+            self.logger.error(f"[EngineScheduler] {node['engine']} hiba → TemporaryEngine: {e}")
+            out = self._fallback_output(name, memo)
+            status = "fallback"
+
+        t1 = time.perf_counter()
+        memo[name] = out
+        timings[name] = {
+            "engine": node["engine"],
+            "start_s": round(t0 - origin, 4),
+            "seconds": t1 - t0,
+            "status": status,
+        }
+
+    def _fallback_output(self, name, memo):
+        if self.fallback is None:
+            return {}
+
+        match_ids = memo.get("match_data") or {}
+        if match_ids:
+            return {match_id: self.fallback.analyze(name) for match_id in match_ids}
+        return self.fallback.analyze(name)
+
+    # ======================================================================
+    # KRITIKUS ÚT / BOTTLENECK
+    # ======================================================================
+    def _report(self, order, timings, wall, missing):
+        """
+        Kritikus út: a függőségi láncok közül a legnagyobb összidejű
+        (ez alá a párhuzamos futás sem mehet). Bottleneck: a kritikus út
+        leglassabb node-ja.
+        """
+        finish = {}
+        via = {}
+        for n in order:
+            deps = [d for d in self.nodes[n]["inputs"] if d in self.nodes]
+            prev = max(deps, key=lambda d: finish[d], default=None)
+            finish[n] = timings[n]["seconds"] + (finish[prev] if prev else 0.0)
+            via[n] = prev
+
+        path = []
+        node = max(finish, key=finish.get, default=None)
+        while node:
+            path.append(node)
+            node = via[node]
+        path.reverse()
+
+        bottleneck = max(path, key=lambda n: timings[n]["seconds"], default=None)
+        serial = sum(t["seconds"] for t in timings.values())
+
+        return {
+            "wall_s": round(wall, 4),
+            "serial_s": round(serial, 4),
+            "critical_path": path,
+            "critical_path_s": round(finish[path[-1]], 4) if path else 0.0,
+            "bottleneck": bottleneck,
+            "bottleneck_engine": timings[bottleneck]["engine"] if bottleneck else None,
+            "missing_inputs": missing,
+            "fallbacks": [n for n in order if timings[n]["status"] == "fallback"],
+            "nodes": {
+                n: {**timings[n], "seconds": round(timings[n]["seconds"], 4)}
+                for n in order
+            },
+        }
@@ -1,9 +1,8 @@
 # backend/core/fusion_engine.py
 
-import os
-import importlib
 import numpy as np
 from backend.utils.logger import get_logger
+from backend.core.engine_registry import EngineRegistry
 
 
 class FusionEngine:
@@ -11,7 +10,7 @@ class FusionEngine:
     FUSION ENGINE – PRO VERSION
     ---------------------------
     Feladata:
-        • automatikus engine-felderítés (backend/engine)
+        • engine-ek a registry manifestből, első használatkor betöltve
         • engine-ek futtatása hibatűrő módban
         • reliability metrika számítása
         • consensus score (engine-k egyezése)
@@ -23,19 +22,30 @@ class FusionEngine:
         self.config = config or {}
 
         self.logger = get_logger()
-        self.engine_dir = os.path.join("backend", "engine")
 
         self.max_engines = self.config.get("fusion", {}).get("max_engines", 50)
 
-        self.engines = self._load_engines()
+        # lazy: az engine-ek az első hozzáféréskor töltődnek be
+        self._engines = None
 
     # ======================================================================
-    # ENGINE AUTO-DETECTION
+    # ENGINE BETÖLTÉS (EngineRegistry)
     # ======================================================================
-    def _class_guess(self, filename):
-        """score_pred_engine → ScorePredEngine"""
-        base = filename.replace("_engine", "")
-        parts = base.split("_")
-        return "".join([p.capitalize() for p in parts]) + "Engine"
-
-    def _load_engines(self
+    @property
+    def engines(self):
+        if self._engines is None:
+            self._engines = self._load_engines()
+        return self._engines
+
+    def _load_engines(self):
+        """
+        {név: példány} a registry manifestből – a példányok megosztottak
+        a többi FusionEngine / loader / pipeline példánnyal.
+        """
+        engines = EngineRegistry.shared().load_all(self.config)
+
+        if len(engines) > self.max_engines:
+            engines = dict(list(engines.items())[:self.max_engines])
+
+        self.logger.info(f"[FusionEngine] {len(engines)} engine betöltve.")
+        return engines
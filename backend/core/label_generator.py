@@ -70,6 +70,13 @@ class LabelGenerator:
         # --- 5) clamp: [0,1] ---
         return float(np.clip(label, 0.0, 1.0))
 
+    @staticmethod
+    def result_value(result):
+        """"win" / "loss" / "push" (ResultScraper, BankrollUpdater) vagy 1/0 → float."""
+        if isinstance(result, str):
+            return {"win": 1.0, "loss": 0.0, "push": 0.5}.get(result.lower(), 0.0)
+        return float(result)
+
     # ======================================================================
     # Napi eredményekből label-ek generálása
     # ======================================================================
@@ -78,7 +85,7 @@ class LabelGenerator:
         results = [
             {
                 "match_id": "...",
-                "result": 1/0,
+                "result": "win" / "loss" / "push" (vagy 1/0),
                 "ev": 0.12,
                 "profit": +3.5,
                 "features": {...}
@@ -99,7 +106,7 @@ class LabelGenerator:
 
         for item in results:
             match_id = item["match_id"]
-            result = float(item.get("result", 0))
+            result = self.result_value(item.get("result", 0))
             ev = float(item.get("ev", 0.0))
             profit = float(item.get("profit", 0.0))
             features = item.get("features", {})
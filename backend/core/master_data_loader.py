@@ -2,6 +2,7 @@
 
 import datetime
 from backend.utils.logger import get_logger
+from backend.scraper.team_names import MatchIndex, normalize_team
 
 
 class MasterDataLoader:
@@ -26,42 +27,75 @@ class MasterDataLoader:
         self.flash = flash_scraper
         self.sofa = sofa_scraper
 
+        c = self.config.get("data_loader", {})
+        self.team_aliases = c.get("team_aliases", {})
+        self.fuzzy_threshold = c.get("fuzzy_threshold", 0.6)
+
+        # slate-szintű TippmixPro index (egyszer épül, minden meccs használja)
+        self._tmx_index = None
+        self._tmx_index_date = None
+
     # ============================================================
     #  Team normalization
     # ============================================================
     def _normalize_team(self, name: str):
-        name = name.lower()
-        replace = {
-            "fc": "",
-            "sc": "",
-            "cf": "",
-            " " : "",
-            "." : "",
-            "-" : "",
-        }
-        for k,v in replace.items():
-            name = name.replace(k,v)
-        return name
+        return normalize_team(name)
 
     # ============================================================
-    #  MATCH FINDER (Intl → TippmixPro)
+    #  SLATE INDEX (TippmixPro napi kínálat)
     # ============================================================
-    def _find_tmx_match(self, match):
-        """Bet365/Pinnacle match → TippmixPro equivalent"""
+    def reset_slate(self):
+        """Új slate előtt: a TippmixPro index újraépül a következő meccsnél."""
+        self._tmx_index = None
+        self._tmx_index_date = None
 
-        home = self._normalize_team(match["home"])
-        away = self._normalize_team(match["away"])
+    def _get_tmx_index(self):
+        today = datetime.date.today()
 
-        tmx_matches = self.tmx.get_today_matches()
+        if self._tmx_index is None or self._tmx_index_date != today:
+            index = MatchIndex(
+                aliases=self.team_aliases,
+                fuzzy_threshold=self.fuzzy_threshold
+            )
+            for m in self.tmx.get_today_matches():
+                index.add(m["home"], m["away"], m.get("date"), m)
 
-        for m in tmx_matches:
-            h = self._normalize_team(m["home"])
-            a = self._normalize_team(m["away"])
+            # üres kínálat (index_mode kikapcsolva / sikertelen crawl) nem kerül cache-be
+            if not len(index):
+                return index
 
-            if h == home and a == away:
-                return m
+            self._tmx_index = index
+            self._tmx_index_date = today
 
-        return None
+            self.logger.info(f"[MasterDataLoader] TippmixPro index: {len(index)} meccs")
+
+        return self._tmx_index
+
+    # ============================================================
+    #  MATCH FINDER (Intl → TippmixPro)
+    # ============================================================
+    def _find_tmx_match(self, match):
+        """
+        Bet365/Pinnacle match → TippmixPro equivalent
+            1) pontos normalizált kulcs (+ alias tábla)
+            2) fuzzy (trigram) fallback
+            3) napi kínálat híján: meccsenkénti TippmixPro keresés
+        """
+        index = self._get_tmx_index()
+        if len(index):
+            return index.find(match["home"], match["away"], match.get("date"))
+
+        event_url = self.tmx.search_match(match["home"], match["away"])
+        if not event_url:
+            return None
+
+        return {
+            "home": match["home"],
+            "away": match["away"],
+            "date": match.get("date"),
+            "event_url": event_url,
+            "tmx_id": event_url,
+        }
 
     # ============================================================
     #  Load all data for ONE match
@@ -0,0 +1,129 @@
+# backend/core/match_frame.py
+
+import numbers
+
+import numpy as np
+
+
+class MatchFrame:
+    """
+    MATCH FRAME – oszlopos meccs-jellemző konténer
+    ----------------------------------------------
+    Feladata:
+        • a match_data {match_id: {mező: érték}} dict oszlopos változata:
+          mezőnként egy (N,) float tömb, közös match_id indexszel
+        • hiányzó / nem numerikus érték → NaN; a col() tölti a defaultot
+        • az engine-ek predict_frame(frame) gyors útjának bemenete,
+          a dict alapú predict() csak vékony adapter fölötte
+
+    Használat:
+        frame = MatchFrame.from_dict(match_data)
+        xg = frame.col("xg_home", 1.2)
+        i = frame.index["match_123"]
+    """
+
+    def __init__(self, ids, columns, empty=None):
+        self.ids = list(ids)
+        self.index = {match_id: i for i, match_id in enumerate(self.ids)}
+        self.columns = {k: np.asarray(v, dtype=float) for k, v in columns.items()}
+        self.empty = (
+            np.asarray(empty, dtype=bool) if empty is not None
+            else np.zeros(len(self.ids), dtype=bool)
+        )
+
+    # ------------------------------------------------------------------
+    # ÉPÍTÉS
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_dict(cls, match_data, fields=None):
+        """
+        {match_id: {mező: érték}} → MatchFrame.
+        fields=None → minden numerikus mező, ami bármely meccsnél előfordul.
+        """
+        ids = list(match_data.keys())
+        rows = [match_data[i] or {} for i in ids]
+        n = len(ids)
+
+        if fields is None:
+            fields = []
+            seen = set()
+            for row in rows:
+                for k, v in row.items():
+                    if k not in seen and _is_number(v):
+                        seen.add(k)
+                        fields.append(k)
+
+        columns = {}
+        for k in fields:
+            col = np.full(n, np.nan)
+            for i, row in enumerate(rows):
+                v = row.get(k)
+                if _is_number(v):
+                    col[i] = v
+            columns[k] = col
+
+        return cls(ids, columns, empty=[not row for row in rows])
+
+    @classmethod
+    def from_columns(cls, ids, columns):
+        """Már oszlopos adatból (pl. feature store, DataFrame) – másolás nélkül."""
+        return cls(ids, columns)
+
+    # ------------------------------------------------------------------
+    # HOZZÁFÉRÉS
+    # ------------------------------------------------------------------
+    def __len__(self):
+        return len(self.ids)
+
+    def has(self, name):
+        return name in self.columns
+
+    def raw(self, name):
+        """Az oszlop NaN-okkal (hiányzó mező → csupa NaN)."""
+        col = self.columns.get(name)
+        if col is None:
+            return np.full(len(self.ids), np.nan)
+        return col
+
+    def col(self, name, default=0.0):
+        """Az oszlop, a hiányzó értékek helyén default-tal (mint data.get(name, default))."""
+        col = self.columns.get(name)
+        if col is None:
+            return np.full(len(self.ids), float(default))
+        return np.where(np.isnan(col), default, col)
+
+    def row(self, match_id):
+        """Egy meccs dict nézete (csak a nem-NaN mezők)."""
+        i = self.index[match_id]
+        return {k: float(v[i]) for k, v in self.columns.items() if not np.isnan(v[i])}
+
+
+def as_frame(match_data):
+    """MatchFrame-et változatlanul ad vissza, dict-et átalakít (közös frame újrahasznosítása)."""
+    if isinstance(match_data, MatchFrame):
+        return match_data
+    return MatchFrame.from_dict(match_data)
+
+
+def _is_number(v):
+    return isinstance(v, numbers.Number) and not isinstance(v, complex)
+
+
+# ======================================================================
+# ENGINE KIMENET: oszlopos eredmény → a megszokott dict formátum
+# ======================================================================
+def frame_outputs(frame, prob, conf, risk, meta, source):
+    """
+    (N,) probability / confidence / risk tömbök →
+        {match_id: {"probability", "confidence", "risk", "meta", "source"}}
+    """
+    return {
+        match_id: {
+            "probability": round(float(prob[i]), 4),
+            "confidence": round(float(conf[i]), 3),
+            "risk": round(float(risk[i]), 3),
+            "meta": dict(meta),
+            "source": source
+        }
+        for i, match_id in enumerate(frame.ids)
+    }
@@ -0,0 +1,60 @@
+# backend/core/mc_parallel.py
+
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+from backend.utils.logger import get_logger
+
+
+logger = get_logger()
+
+
+# ======================================================================
+# SHARDOK + FÜGGETLEN SEED STREAMEK
+# ======================================================================
+def spawn_seeds(seed, n):
+    """
+    n független SeedSequence egy gyökér seedből.
+    A shard i mindig az i. streamet kapja → az eredmény nem függ
+    attól, hány worker fut, csak a shard felosztástól.
+    """
+    return np.random.SeedSequence(seed).spawn(n)
+
+
+def shard_ranges(n, shard_size):
+    """[0, n) felosztása fix méretű [start, end) szeletekre."""
+    shard_size = max(1, int(shard_size))
+    return [(s, min(n, s + shard_size)) for s in range(0, n, shard_size)]
+
+
+def split_count(total, part):
+    """total szimuláció darabolása part méretű részekre (az utolsó maradék)."""
+    if not part or part >= total:
+        return [total]
+    parts = [part] * (total // part)
+    if total % part:
+        parts.append(total % part)
+    return parts
+
+
+# ======================================================================
+# FUTTATÁS
+# ======================================================================
+def run_shards(fn, payloads, workers=1):
+    """
+    fn(payload) minden shardra, eredmények shard-sorrendben.
+        • workers <= 1 → folyamaton belül, ugyanazokkal a shardokkal
+        • egyébként ProcessPoolExecutor; fn modul-szintű (picklable) kell legyen
+
+    Ha a process pool nem indul / összeomlik, soros futásra esünk vissza
+    (a shard seedek miatt ugyanazzal az eredménnyel).
+    """
+    if workers is None or workers <= 1 or len(payloads) <= 1:
+        return [fn(p) for p in payloads]
+
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(payloads))) as pool:
+            return list(pool.map(fn, payloads))
+    except Exception as e:
+        logger.error(f"[MCParallel] Process pool hiba, soros futás: {e}")
+        return [fn(p) for p in payloads]
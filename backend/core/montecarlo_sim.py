@@ -0,0 +1,216 @@
+# backend/core/montecarlo_sim.py
+
+import numpy as np
+
+from backend.core.mc_parallel import spawn_seeds, shard_ranges, split_count, run_shards
+
+
+# ======================================================================
+# SEGÉDEK
+# ======================================================================
+def goal_bins(max_goals):
+    """Összgól hisztogram hossza: 0 .. 2·max_goals."""
+    return 2 * max_goals + 1
+
+
+def _empty_counts(n, max_goals):
+    return {
+        "home": np.zeros(n, dtype=np.int64),
+        "draw": np.zeros(n, dtype=np.int64),
+        "away": np.zeros(n, dtype=np.int64),
+        "goals": np.zeros((n, goal_bins(max_goals)), dtype=np.int64),
+        "simulations": np.zeros(n, dtype=np.int64),
+    }
+
+
+# ======================================================================
+# EGY BLOKK: (meccs × szimuláció) mátrix egyetlen húzással
+# ======================================================================
+def _draw_block(rng, lh, la, sims, max_goals):
+    """
+    lh, la: (R,) λ-k → egész számlálók R meccsre, sims szimulációval.
+    Gólszám a max_goals-nál levágva (luck regression).
+    """
+    rows = len(lh)
+    k = goal_bins(max_goals)
+
+    hg = np.minimum(rng.poisson(lh[:, None], size=(rows, sims)), max_goals)
+    ag = np.minimum(rng.poisson(la[:, None], size=(rows, sims)), max_goals)
+
+    home = (hg > ag).sum(axis=1)
+    draw = (hg == ag).sum(axis=1)
+
+    # soronkénti bincount egyetlen hívással (sor-offsettel)
+    offs = np.arange(rows)[:, None] * k
+    goals = np.bincount((hg + ag + offs).ravel(), minlength=rows * k).reshape(rows, k)
+
+    return home, draw, sims - home - draw, goals
+
+
+# ======================================================================
+# SLATE SZIMULÁCIÓ
+# ======================================================================
+def simulate_counts(lam_home, lam_away, simulations, rng, max_goals=10, chunk_elems=2_000_000):
+    """
+    Teljes slate Monte Carlo, Python ciklus nélkül meccsenként.
+    A (meccs × szimuláció) mátrixot chunk_elems elemes blokkokban húzzuk,
+    hogy nagy slate-en se foglaljunk GB-os tömböt.
+
+    Vissza (egész számlálók, összefésülhetők):
+        {"home", "draw", "away", "simulations": (N,),
+         "goals": (N, 2G+1) összgól hisztogram}
+    """
+    lam_home = np.asarray(lam_home, dtype=float).ravel()
+    lam_away = np.asarray(lam_away, dtype=float).ravel()
+    n = len(lam_home)
+
+    counts = _empty_counts(n, max_goals)
+    if n == 0 or simulations <= 0:
+        return counts
+
+    sim_block = max(1, min(simulations, chunk_elems))
+    rows = max(1, chunk_elems // sim_block)
+
+    for start in range(0, n, rows):
+        end = min(n, start + rows)
+        done = 0
+
+        while done < simulations:
+            s = min(sim_block, simulations - done)
+            h, d, a, g = _draw_block(rng, lam_home[start:end], lam_away[start:end], s, max_goals)
+
+            counts["home"][start:end] += h
+            counts["draw"][start:end] += d
+            counts["away"][start:end] += a
+            counts["goals"][start:end] += g
+            done += s
+
+        counts["simulations"][start:end] = simulations
+
+    return counts
+
+
+def _merge_rows(counts, idx, h, d, a, g, sims):
+    counts["home"][idx] += h
+    counts["draw"][idx] += d
+    counts["away"][idx] += a
+    counts["goals"][idx] += g
+    counts["simulations"][idx] += sims
+
+
+# ======================================================================
+# ADAPTÍV SZIMULÁCIÓ (konfidencia-intervallum alapú leállás)
+# ======================================================================
+def ci_half_width(counts, z=1.96):
+    """
+    Binomiális CI félszélesség meccsenként:
+        z · sqrt(p(1−p)/n), a home/draw/away kimenetek maximuma.
+    """
+    n = np.maximum(counts["simulations"], 1)
+    hw = np.zeros(len(n))
+    for key in ("home", "draw", "away"):
+        p = counts[key] / n
+        hw = np.maximum(hw, z * np.sqrt(p * (1 - p) / n))
+    return np.where(counts["simulations"] > 0, hw, np.inf)
+
+
+def simulate_adaptive(lam_home, lam_away, max_simulations, rng, tolerance=0.005, z=1.96,
+                      step=2000, min_simulations=None, max_goals=10, chunk_elems=2_000_000):
+    """
+    Körönként step szimuláció a még nem konvergált meccseknek;
+    egy meccs kiesik, ha a CI félszélesség ≤ tolerance (és legalább
+    min_simulations lefutott), vagy elérte a max_simulations-t.
+
+    Vissza: simulate_counts formátum, meccsenkénti "simulations"-szel.
+    """
+    lam_home = np.asarray(lam_home, dtype=float).ravel()
+    lam_away = np.asarray(lam_away, dtype=float).ravel()
+    n = len(lam_home)
+
+    counts = _empty_counts(n, max_goals)
+    if n == 0 or max_simulations <= 0:
+        return counts
+
+    step = max(1, min(step, max_simulations))
+    min_simulations = min(max_simulations, min_simulations or step)
+    rows = max(1, chunk_elems // step)
+
+    active = np.arange(n)
+    while len(active):
+        s = int(min(step, max_simulations - counts["simulations"][active].min()))
+
+        for start in range(0, len(active), rows):
+            idx = active[start:start + rows]
+            h, d, a, g = _draw_block(rng, lam_home[idx], lam_away[idx], s, max_goals)
+            _merge_rows(counts, idx, h, d, a, g, s)
+
+        sims = counts["simulations"][active]
+        hw = ci_half_width({k: v[active] for k, v in counts.items()}, z)
+        keep = (sims < max_simulations) & ((hw > tolerance) | (sims < min_simulations))
+        active = active[keep]
+
+    return counts
+
+
+# ======================================================================
+# TÖBB FOLYAMATOS SZIMULÁCIÓ
+# ======================================================================
+def simulate_shard(payload):
+    """Process pool worker: egy shard (meccs-szelet × szimuláció-rész)."""
+    lam_home, lam_away, simulations, seed_seq, opts = payload
+    rng = np.random.default_rng(seed_seq)
+
+    opts = dict(opts)
+    if opts.pop("adaptive", False):
+        return simulate_adaptive(lam_home, lam_away, simulations, rng, **opts)
+
+    for key in ("tolerance", "z", "step", "min_simulations"):
+        opts.pop(key, None)
+    return simulate_counts(lam_home, lam_away, simulations, rng, **opts)
+
+
+def simulate_parallel(lam_home, lam_away, simulations, seed=None, workers=1,
+                      shard_size=256, sim_shard=None, adaptive=False, **opts):
+    """
+    Slate szimuláció shardokra bontva, ProcessPoolExecutor-on.
+
+    Shardok: shard_size meccs × sim_shard szimuláció (adaptív módban csak
+    meccs szerint). Minden shard saját SeedSequence streamet kap, a
+    számlálókat összeadjuk → adott seed mellett az eredmény bitre azonos
+    bármennyi workerrel (workers=1 is ugyanazokat a shardokat futtatja).
+    """
+    lam_home = np.asarray(lam_home, dtype=float).ravel()
+    lam_away = np.asarray(lam_away, dtype=float).ravel()
+    n = len(lam_home)
+    max_goals = opts.get("max_goals", 10)
+
+    counts = _empty_counts(n, max_goals)
+    if n == 0 or simulations <= 0:
+        return counts
+
+    sim_parts = [simulations] if adaptive else split_count(simulations, sim_shard)
+    tasks = [(a, b, s) for a, b in shard_ranges(n, shard_size) for s in sim_parts]
+    seeds = spawn_seeds(seed, len(tasks))
+
+    payloads = [
+        (lam_home[a:b], lam_away[a:b], s, seeds[i], {**opts, "adaptive": adaptive})
+        for i, (a, b, s) in enumerate(tasks)
+    ]
+
+    for (a, b, _), part in zip(tasks, run_shards(simulate_shard, payloads, workers)):
+        for key in counts:
+            counts[key][a:b] += part[key]
+
+    return counts
+
+
+def counts_to_probs(counts):
+    """Számlálók → valószínűségek (home/draw/away (N,), total_goals (N, 2G+1))."""
+    sims = np.maximum(counts["simulations"], 1)
+    return {
+        "home": counts["home"] / sims,
+        "draw": counts["draw"] / sims,
+        "away": counts["away"] / sims,
+        "total_goals": counts["goals"] / sims[:, None],
+        "simulations": counts["simulations"],
+    }
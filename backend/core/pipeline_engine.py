@@ -3,6 +3,7 @@
 import time
 import threading
 from backend.utils.logger import get_logger
+from backend.system.tracing import Tracer
 
 from backend.core.master_data_loader import MasterDataLoader
 from backend.core.fusion_engine import FusionEngine
@@ -39,6 +40,7 @@ class PipelineEngine:
         """
         self.config = config
         self.logger = get_logger()
+        self.tracer = Tracer.shared(config)
 
         # Core modules
         self.data_loader = MasterDataLoader(
@@ -64,43 +66,55 @@ class PipelineEngine:
         """
         Egyetlen meccs teljes AI tipp pipeline-ja.
         """
+        with self.tracer.span("PipelineEngine.process_match", match_id=match.get("match_id")):
+            return self._process_match(match)
+
+    def _process_match(self, match):
+        tr = self.tracer
 
         # 1) Adatok betöltése
-        m = self.data_loader.load_match_data(match)
+        with tr.span("process_match.load_data"):
+            m = self.data_loader.load_match_data(match)
 
         # 2) FusionEngine – multi-engine összevonás
-        fusion_out = self.fusion.fuse(m)
+        with tr.span("process_match.fusion"):
+            fusion_out = self.fusion.fuse(m)
 
         # 3) Meta Input Builder – meta feature vector
-        meta_input = self.meta_builder.build_meta_input(
-            fusion_out,
-            fusion_out["engine_outputs"],
-            m
-        )
+        with tr.span("process_match.meta_input"):
+            meta_input = self.meta_builder.build_meta_input(
+                fusion_out,
+                fusion_out["engine_outputs"],
+                m
+            )
 
         # 4) Meta Optimizer – engine súly frissítés
-        self.meta_optimizer.update_weights(
-            list(fusion_out["engine_outputs"].keys())
-        )
+        with tr.span("process_match.meta_optimizer"):
+            self.meta_optimizer.update_weights(
+                list(fusion_out["engine_outputs"].keys())
+            )
 
         # 5) Tipp kiválasztás
-        tip = self.selector.select(
-            fusion_out,
-            meta_input,
-            m
-        )
+        with tr.span("process_match.select"):
+            tip = self.selector.select(
+                fusion_out,
+                meta_input,
+                m
+            )
         if not tip:
             return None
 
         # 6) KombiEngine (ha több tipp)
-        kombik = self.kombi.generate_kombi([tip])
+        with tr.span("process_match.kombi"):
+            kombik = self.kombi.generate_kombi([tip])
 
         # 7) BankrollEngine – tét meghatározása
-        tip["stake"] = self.bankroll.calculate_stake(
-            tip["probability"],
-            tip["value_score"],
-            tip.get("risk", 0.5)
-        )
+        with tr.span("process_match.bankroll"):
+            tip["stake"] = self.bankroll.calculate_stake(
+                tip["probability"],
+                tip["value_score"],
+                tip.get("risk", 0.5)
+            )
 
         return {
             "match_id": match["match_id"],
@@ -0,0 +1,164 @@
+# backend/core/score_matrix.py
+
+import copy
+from functools import lru_cache
+
+import numpy as np
+
+
+TOTAL_LINES = (0.5, 1.5, 2.5, 3.5, 4.5, 5.5)
+HANDICAP_LINES = (-2.5, -2.0, -1.5, -1.0, -0.5, 0.0, 0.5, 1.0, 1.5, 2.0, 2.5)
+
+
+# ======================================================================
+# POISSON PMF TÁBLA
+# ======================================================================
+def _log_factorials(max_goals):
+    """[log 0!, log 1!, ..., log max_goals!]"""
+    return np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, max_goals + 1)))))
+
+
+def poisson_pmf_table(lams, max_goals):
+    """
+    λ vektor → (N, max_goals+1) PMF tábla egy lépésben:
+        P(k) = exp(k·log λ − λ − log k!)
+    λ <= 0 → elfajult eloszlás: P(0) = 1 (a log λ itt NaN-t adna)
+    """
+    lams = np.asarray(lams, dtype=float).reshape(-1, 1)
+    k = np.arange(max_goals + 1)
+    positive = lams > 0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        table = np.exp(k * np.log(np.where(positive, lams, 1.0)) - lams - _log_factorials(max_goals))
+
+    return np.where(positive, table, (k == 0).astype(float))
+
+
+# ======================================================================
+# SCORE MÁTRIXOK
+# ======================================================================
+def score_matrices(lam_home, lam_away, max_goals):
+    """
+    (N,) λ_home, λ_away → (N, G+1, G+1) score mátrixok
+    a két PMF tábla soronkénti külső szorzataként.
+        M[n, hg, ag] = P(home = hg) · P(away = ag)
+    """
+    ph = poisson_pmf_table(lam_home, max_goals)
+    pa = poisson_pmf_table(lam_away, max_goals)
+    return np.einsum("ni,nj->nij", ph, pa)
+
+
+def outcome_probs(lam_home, lam_away, max_goals=10, chunk_size=20000):
+    """
+    Teljes slate 1X2 valószínűségei egy vektorizált menetben.
+    A csonkolt (0..max_goals) mátrix összegére normalizálunk,
+    ugyanúgy, mint a meccsenkénti Poisson mag.
+
+    Vissza: (home, draw, away) – mind (N,) tömb
+    """
+    lam_home = np.asarray(lam_home, dtype=float).ravel()
+    lam_away = np.asarray(lam_away, dtype=float).ravel()
+    n = len(lam_home)
+
+    home = np.empty(n)
+    draw = np.empty(n)
+    away = np.empty(n)
+
+    g = max_goals + 1
+    home_mask = np.tril(np.ones((g, g), dtype=bool), -1)     # hg > ag
+    away_mask = np.triu(np.ones((g, g), dtype=bool), 1)      # hg < ag
+
+    # darabolva, hogy 100k+ meccsnél se foglaljunk GB-os mátrixot
+    for start in range(0, n, chunk_size):
+        end = min(n, start + chunk_size)
+        m = score_matrices(lam_home[start:end], lam_away[start:end], max_goals)
+
+        total = m.sum(axis=(1, 2))
+        total = np.where(total > 0, total, 1.0)
+
+        home[start:end] = m[:, home_mask].sum(axis=1) / total
+        away[start:end] = m[:, away_mask].sum(axis=1) / total
+        draw[start:end] = np.trace(m, axis1=1, axis2=2) / total
+
+    return home, draw, away
+
+
+# ======================================================================
+# PIACOK EGYETLEN SCORE MÁTRIXBÓL
+# ======================================================================
+def markets_from_matrix(m):
+    """
+    (G+1, G+1) score mátrix → minden piac:
+        • 1x2            {"home", "draw", "away"}
+        • totals         {2.5: {"over", "under"}, ...}
+        • asian_handicap {-1.5: {"win", "push", "lose"}, ...}  (hazai szemszög)
+        • btts           {"yes", "no"}
+        • correct_score  {"2-1": p, ...}
+    A csonkolt mátrixot 1-re normalizáljuk.
+    """
+    m = np.asarray(m, dtype=float)
+    total = m.sum()
+    if total > 0:
+        m = m / total
+
+    g = m.shape[0]
+    hg, ag = np.indices((g, g))
+    diff = hg - ag
+    goals = hg + ag
+
+    out = {
+        "1x2": {
+            "home": float(m[diff > 0].sum()),
+            "draw": float(m[diff == 0].sum()),
+            "away": float(m[diff < 0].sum()),
+        },
+        "totals": {},
+        "asian_handicap": {},
+        "btts": {},
+        "correct_score": {},
+    }
+
+    for line in TOTAL_LINES:
+        over = float(m[goals > line].sum())
+        out["totals"][line] = {"over": over, "under": 1.0 - over}
+
+    for line in HANDICAP_LINES:
+        adj = diff + line
+        out["asian_handicap"][line] = {
+            "win": float(m[adj > 0].sum()),
+            "push": float(m[adj == 0].sum()),
+            "lose": float(m[adj < 0].sum()),
+        }
+
+    yes = float(m[1:, 1:].sum())
+    out["btts"] = {"yes": yes, "no": 1.0 - yes}
+
+    for h in range(g):
+        for a in range(g):
+            out["correct_score"][f"{h}-{a}"] = float(m[h, a])
+
+    return out
+
+
+@lru_cache(maxsize=4096)
+def _cached_markets(lam_home, lam_away, max_goals):
+    m = score_matrices([lam_home], [lam_away], max_goals)[0]
+    return markets_from_matrix(m)
+
+
+def match_markets(lam_home, lam_away, max_goals=10):
+    """
+    Egy meccs teljes piac-készlete (λ_home, λ_away) alapján.
+    A mátrix egyszer épül; az eredményt a pontos λ-pár szerint
+    cache-eljük, így a Poisson / ScorePred / Prop engine-ek nem
+    számolják újra ugyanazt az eloszlást (kerekítés nélkül – a cache
+    nem változtathatja meg az eredményt).
+
+    Vissza: markets_from_matrix formátum (saját másolat, szabadon módosítható)
+    """
+    return copy.deepcopy(_cached_markets(float(lam_home), float(lam_away), int(max_goals)))
+
+
+def cache_info():
+    """lru_cache statisztika (hits, misses, maxsize, currsize)."""
+    return _cached_markets.cache_info()
@@ -1,7 +1,59 @@
 # backend/engine/closing_line_predictor_engine.py
 
+import os
 import numpy as np
 from backend.utils.logger import get_logger
+from backend.core.mc_parallel import spawn_seeds, shard_ranges, run_shards
+from backend.system.tracing import traced
+
+
+QUANTILES = (5, 25, 50, 75, 95)
+
+
+# ======================================================================
+# VEKTORIZÁLT DRIFT SZIMULÁCIÓ (modul-szintű → process poolból is hívható)
+# ======================================================================
+def simulate_closing(odds, drift, sharp, volatility, momentum, params, rng):
+    """
+    (N,) bemenetek → minden tipp összes drift pályája egyszerre.
+    A (tipp × szimuláció) mátrixot chunk_elems elemes blokkokban húzzuk.
+
+    Vissza: (mean (N,), quantiles (len(QUANTILES), N))
+    """
+    odds = np.asarray(odds, dtype=float)
+    n = len(odds)
+    sims = params["simulations"]
+
+    # determinisztikus rész tippenként
+    base = (
+        np.asarray(drift, dtype=float) +
+        np.asarray(sharp, dtype=float) * params["sharp_weight"] +
+        np.asarray(volatility, dtype=float) * params["volatility_weight"] +
+        np.asarray(momentum, dtype=float) * params["momentum_weight"]
+    )
+
+    mean = np.empty(n)
+    quant = np.empty((len(QUANTILES), n))
+    rows = max(1, params["chunk_elems"] // max(1, sims))
+
+    for start in range(0, n, rows):
+        end = min(n, start + rows)
+
+        noise = rng.normal(0, params["noise"], size=(end - start, sims))
+        d = np.clip(base[start:end, None] + noise, -params["max_drift"], params["max_drift"])
+        closing = np.maximum(1.01, odds[start:end, None] * (1 - d))
+
+        mean[start:end] = closing.mean(axis=1)
+        quant[:, start:end] = np.percentile(closing, QUANTILES, axis=1)
+
+    return mean, quant
+
+
+def _closing_shard(payload):
+    """Process pool worker: egy tipp-shard saját seed streammel."""
+    odds, drift, sharp, volatility, momentum, params, seed_seq = payload
+    return simulate_closing(odds, drift, sharp, volatility, momentum, params,
+                            np.random.default_rng(seed_seq))
 
 
 class ClosingLinePredictor:
@@ -28,6 +80,13 @@ class ClosingLinePredictor:
         self.momentum_weight = c.get("momentum_weight", 0.20)
         self.noise = c.get("noise", 0.03)                   # sztochasztikus zaj
         self.simulations = c.get("simulations", 500)        # Monte Carlo futások
+        self.seed = c.get("seed", None)                     # reprodukálhatóság
+        self.chunk_elems = c.get("chunk_elems", 2000000)
+
+        # több folyamatos mód (fix shardok → worker-számtól független eredmény)
+        self.parallel = c.get("parallel", False)
+        self.workers = c.get("workers", os.cpu_count() or 1)
+        self.shard_size = c.get("shard_size", 512)
 
     # ======================================================================
     # FAIR ODDS ESTIMATE
@@ -43,7 +102,8 @@ class ClosingLinePredictor:
     # ======================================================================
     def _simulate_drift(self, odds, drift, sharp, volatility, momentum):
         """
-        Egyetlen oddsmozgás-szimuláció
+        Egyetlen oddsmozgás-szimuláció (skalár referencia út;
+        a predict / predict_slate a vektorizált simulate_closing-ot használja)
         """
 
         # baseline drift
@@ -76,6 +136,7 @@ class ClosingLinePredictor:
     # ======================================================================
     # MAIN PREDICTOR
     # ======================================================================
+    @traced()
     def predict(self, data):
         """
         data:
@@ -88,45 +149,84 @@ class ClosingLinePredictor:
                 "probability": 0.61
             }
         """
+        return self.predict_slate({"tip": data})["tip"]
+
+    # ======================================================================
+    # SLATE PREDICTOR: minden tipp záró oddsa egy hívásban
+    # ======================================================================
+    def predict_slate(self, tips, rng=None):
+        """
+        tips: {tip_id: data}  (data formátum mint predict-nél)
+
+        Vissza: {tip_id: {expected_closing, fair_odds, clv,
+                          closing_quantiles {p5..p95}, clv_quantiles {p5..p95}, ...}}
+        """
+        ids = list(tips.keys())
+        if not ids:
+            return {}
+
+        rows = [tips[i] for i in ids]
+        odds = np.array([d.get("current_odds", 2.0) for d in rows], dtype=float)
+        drift = np.array([d.get("drift", 0) for d in rows], dtype=float)
+        sharp = np.array([d.get("sharp_money", 0) for d in rows], dtype=float)
+        volatility = np.array([d.get("volatility", 0) for d in rows], dtype=float)
+        momentum = np.array([d.get("momentum", 0) for d in rows], dtype=float)
+
+        mean, quant = self._simulate_slate(odds, drift, sharp, volatility, momentum, rng)
+
+        results = {}
+        for i, tip_id in enumerate(ids):
+            # fair odds baseline – biztonságosabb, stabilabb
+            fair_odds = self._fair_odds(rows[i].get("probability", 0.5))
+
+            expected_closing = float(mean[i])
+
+            results[tip_id] = {
+                "expected_closing": round(expected_closing, 4),
+                "fair_odds": round(fair_odds, 4) if fair_odds else None,
+                "clv": round(self.clv(odds[i], expected_closing), 4),
+                "closing_quantiles": {
+                    f"p{q}": round(float(quant[k, i]), 4) for k, q in enumerate(QUANTILES)
+                },
+                "clv_quantiles": {
+                    f"p{q}": round(self.clv(odds[i], quant[k, i]), 4) for k, q in enumerate(QUANTILES)
+                },
+                "volatility": float(volatility[i]),
+                "sharp": float(sharp[i]),
+                "momentum": float(momentum[i]),
+                "drift": float(drift[i]),
+            }
 
-        odds = data.get("current_odds", 2.0)
-        drift = data.get("drift", 0)
-        sharp = data.get("sharp_money", 0)
-        volatility = data.get("volatility", 0)
-        momentum = data.get("momentum", 0)
-        prob = data.get("probability", 0.5)
-
-        # fair odds baseline – biztonságosabb, stabilabb
-        fair_odds = self._fair_odds(prob)
-
-        simulations = []
-
-        for _ in range(self.simulations):
-            sim = self._simulate_drift(
-                odds=odds,
-                drift=drift,
-                sharp=sharp,
-                volatility=volatility,
-                momentum=momentum
-            )
-            simulations.append(sim)
-
-        # expected closing price
-        expected_closing = float(np.mean(simulations))
-
-        # CLV
-        clv = self.clv(odds, expected_closing)
-
-        return {
-            "expected_closing": round(expected_closing, 4),
-            "fair_odds": round(fair_odds, 4) if fair_odds else None,
-            "clv": round(clv, 4),
-            "volatility": float(volatility),
-            "sharp": float(sharp),
-            "momentum": float(momentum),
-            "drift": float(drift),
+        return results
+
+    def _simulate_slate(self, odds, drift, sharp, volatility, momentum, rng=None):
+        params = {
+            "simulations": self.simulations,
+            "sharp_weight": self.sharp_weight,
+            "volatility_weight": self.volatility_weight,
+            "momentum_weight": self.momentum_weight,
+            "noise": self.noise,
+            "max_drift": self.max_drift,
+            "chunk_elems": self.chunk_elems,
         }
 
+        if not (self.parallel and rng is None):
+            return simulate_closing(odds, drift, sharp, volatility, momentum, params,
+                                    rng or np.random.default_rng(self.seed))
+
+        # shardonként saját SeedSequence stream (lásd backend.core.mc_parallel)
+        shards = shard_ranges(len(odds), self.shard_size)
+        seeds = spawn_seeds(self.seed, len(shards))
+        payloads = [
+            (odds[a:b], drift[a:b], sharp[a:b], volatility[a:b], momentum[a:b], params, seeds[i])
+            for i, (a, b) in enumerate(shards)
+        ]
+        parts = run_shards(_closing_shard, payloads, self.workers)
+
+        mean = np.concatenate([p[0] for p in parts])
+        quant = np.concatenate([p[1] for p in parts], axis=1)
+        return mean, quant
+
     # ======================================================================
     # CLV CALCULATION
     # ======================================================================
@@ -15,6 +15,11 @@ class ConfidenceCalibrationEngine:
         • Stabil, konszolidált probability → FusionEngine sokkal pontosabb
     """
 
+    # engine DAG (EngineScheduler): a modell engine-ek kimenetére épül
+    DAG_OUTPUT = "calibration"
+    DAG_INPUTS = ("poisson", "mc3", "gnn", "lstm", "gameflow", "injury", "scorepredict")
+    DAG_METHOD = "calibrate_slate"
+
     def __init__(self, config=None):
         self.config = config or {}
         self.logger = get_logger()
@@ -126,3 +131,23 @@ class ConfidenceCalibrationEngine:
             "ece": round(best_ece, 4),
             "confidence": round(confidence, 3)
         }
+
+    # =====================================================================
+    # SLATE – engine DAG node
+    # =====================================================================
+    def calibrate_slate(self, engine_outputs):
+        """
+        engine_outputs = {engine: {match_id: {"probability": ...}}}
+        Vissza: {match_id: {engine: calibrate() eredmény}}
+        """
+        calibrated = {}
+
+        for engine, outs in engine_outputs.items():
+            if not isinstance(outs, dict):
+                continue
+            for match_id, out in outs.items():
+                prob = out.get("probability") if isinstance(out, dict) else None
+                if isinstance(prob, (int, float)):
+                    calibrated.setdefault(match_id, {})[engine] = self.calibrate(prob)
+
+        return calibrated
@@ -2,6 +2,7 @@
 
 import numpy as np
 from backend.utils.logger import get_logger
+from backend.system.tracing import traced
 
 class CrossMarketArbitrageEngine:
     """
@@ -16,6 +17,10 @@ class CrossMarketArbitrageEngine:
         • Risk-free arbitrage jelzése
     """
 
+    # engine DAG (EngineScheduler)
+    DAG_OUTPUT = "arbitrage"
+    DAG_INPUTS = ("match_data",)
+
     def __init__(self, config):
         self.config = config
         self.logger = get_logger()
@@ -33,6 +38,7 @@ class CrossMarketArbitrageEngine:
     # ----------------------------------------------------------------------
     # PUBLIC: fő hívás
     # ----------------------------------------------------------------------
+    @traced()
     def predict(self, match_data):
         outputs = {}
 
@@ -1,8 +1,8 @@
 # backend/engine/custom_engine_loader.py
 
-import os
-import importlib
 from backend.utils.logger import get_logger
+from backend.core.engine_registry import EngineRegistry
+from backend.core.engine_scheduler import EngineScheduler
 
 
 class CustomEngineLoader:
@@ -10,8 +10,9 @@ class CustomEngineLoader:
     CUSTOM ENGINE LOADER – PRO EDITION
     ----------------------------------
     Feladata:
-        • minden engine modul automatikus betöltése a /backend/engine könyvtárból
-        • engine-registry létrehozása
+        • engine-ek betöltése a folyamat-szintű EngineRegistry manifestjéből
+          (nincs könyvtár-szkennelés, a modul az első kéréskor importálódik)
+        • megosztott engine példányok (több loader / pipeline között is)
         • lazy-load (csak amikor szükséges)
         • dependency-k és fallback-ek kezelése
         • FusionEngine, MetaInputBuilder, SelectorEngine integráció
@@ -19,76 +20,19 @@ class CustomEngineLoader:
     Használat:
         loader = CustomEngineLoader(config)
         engines = loader.load_all_engines()
-        trend_engine = loader.get_engine("trend_engine")
+        trend_engine = loader.get_engine("TrendEngine")
     """
 
     def __init__(self, config=None, engine_path="backend/engine"):
         self.config = config or {}
-        self.engine_path = engine_path
+        self.engine_path = engine_path   # régi API; a manifest váltotta ki
         self.logger = get_logger()
+        self.engines = EngineRegistry.shared()
 
         self.registry = {}     # engine_name -> engine_instance
         self.errors = {}       # engine_name -> error message
         self.loaded = False
 
-    # =====================================================================
-    # FÁJL LISTÁZÓ
-    # =====================================================================
-    def _list_engine_files(self):
-        try:
-            files = os.listdir(self.engine_path)
-            engine_files = [
-                f for f in files
-                if f.endswith(".py")
-                and not f.startswith("__")
-                and "custom_engine_loader" not in f
-            ]
-            return engine_files
-        except Exception as e:
-            self.logger.error(f"[EngineLoader] Could not list engine directory: {e}")
-            return []
-
-    # =====================================================================
-    # MODULNÉV KÉPZÉSE
-    # =====================================================================
-    def _module_path(self, filename):
-        """
-        "trend_engine.py" → "backend.engine.trend_engine"
-        """
-        name = filename.replace(".py", "")
-        return f"backend.engine.{name}"
-
-    # =====================================================================
-    # ENGINE BETÖLTÉSE DINAMIKUS IMPORTTAL
-    # =====================================================================
-    def _load_engine(self, module_name, class_name):
-        try:
-            module = importlib.import_module(module_name)
-            engine_class = getattr(module, class_name)
-
-            config_section = self.config.get(class_name.replace("Engine", "").lower(), {})
-            instance = engine_class(config_section)
-
-            return instance
-
-        except Exception as e:
-            self.logger.error(
-                f"[EngineLoader] Could not load engine {class_name} from {module_name}: {e}"
-            )
-            return None
-
-    # =====================================================================
-    # CLASS NEVET VAGYOK KÉPZÉSE
-    # =====================================================================
-    def _guess_class_name(self, module_file):
-        """
-        "trend_engine.py" → "TrendEngine"
-        "weather_engine.py" → "WeatherEngine"
-        """
-        base = module_file.replace(".py", "")
-        parts = base.split("_")
-        return "".join([p.capitalize() for p in parts])
-
     # =====================================================================
     # ÖSSZES ENGINE BETÖLTÉSE
     # =====================================================================
@@ -96,19 +40,11 @@ class CustomEngineLoader:
         if self.loaded:
             return self.registry
 
-        engine_files = self._list_engine_files()
-
-        for file in engine_files:
-            module_name = self._module_path(file)
-            class_name = self._guess_class_name(file)
-
-            engine = self._load_engine(module_name, class_name)
-
-            if engine is None:
-                self.errors[class_name] = f"Failed to load {class_name}"
-                continue
-
-            self.registry[class_name] = engine
+        self.registry.update(self.engines.load_all(self.config))
+        self.errors.update({
+            name: err for name, err in self.engines.errors.items()
+            if name not in self.registry
+        })
 
         self.loaded = True
 
@@ -126,12 +62,16 @@ class CustomEngineLoader:
         """
         Példa: loader.get_engine("TrendEngine")
         """
-        if not self.loaded:
-            self.load_all_engines()
-
         if engine_name in self.registry:
             return self.registry[engine_name]
 
+        # csak a kért engine töltődik be, nem az összes
+        engine = self.engines.get(engine_name, self.config)
+        if engine is not None:
+            self.registry[engine_name] = engine
+            return engine
+
+        self.errors[engine_name] = self.engines.errors.get(engine_name, "unknown engine")
         self.logger.warning(f"[EngineLoader] Engine not found: {engine_name}")
         return None
 
@@ -154,6 +94,19 @@ class CustomEngineLoader:
         )
         return self.get_engine("TemporaryEngine")
 
+    # =====================================================================
+    # ENGINE DAG
+    # =====================================================================
+    def build_scheduler(self):
+        """
+        A betöltött engine-ekből (DAG_OUTPUT-tal rendelkezők) DAG scheduler,
+        TemporaryEngine fallbackkel.
+        """
+        engines = self.load_all_engines()
+        fallback = self.get_engine("TemporaryEngine")
+
+        return EngineScheduler.from_engines(self.config, engines.values(), fallback=fallback)
+
     # =====================================================================
     # ENGINE HIBA LISTA
     # =====================================================================
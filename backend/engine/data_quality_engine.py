@@ -18,6 +18,11 @@ class DataQualityEngine:
         • FusionEngine számára teljes quality_score visszaadás
     """
 
+    # engine DAG (EngineScheduler): a modell engine-ek kimenetére épül
+    DAG_OUTPUT = "data_quality"
+    DAG_INPUTS = ("poisson", "mc3", "gnn", "lstm", "gameflow", "injury", "scorepredict")
+    DAG_METHOD = "analyze_slate"
+
     def __init__(self, config=None):
         self.config = config or {}
         self.logger = get_logger()
@@ -202,3 +207,24 @@ class DataQualityEngine:
             "risk": round(risk, 3),
             "engines_checked": list(engine_outputs.keys())
         }
+
+    # ==========================================================================
+    # SLATE – engine DAG node
+    # ==========================================================================
+    def analyze_slate(self, engine_outputs):
+        """
+        engine_outputs = {engine: {match_id: output}}
+        Vissza: {match_id: analyze() eredmény az adott meccs engine outputjaira}
+        """
+        match_ids = {}
+        for outs in engine_outputs.values():
+            if isinstance(outs, dict):
+                match_ids.update(dict.fromkeys(outs))
+
+        return {
+            match_id: self.analyze({
+                engine: outs.get(match_id) if isinstance(outs, dict) else None
+                for engine, outs in engine_outputs.items()
+            })
+            for match_id in match_ids
+        }
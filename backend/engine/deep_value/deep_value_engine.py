@@ -4,7 +4,9 @@ import os
 import torch
 import numpy as np
 from backend.utils.logger import get_logger
+from backend.core.batch_inference import predict_batched
 from backend.engine.deep_value.train_value_model import DeepValueNet
+from backend.system.tracing import traced
 
 
 class DeepValueEngine:
@@ -29,6 +31,9 @@ class DeepValueEngine:
 
         self.device = "cpu"
 
+        # egy forward pass legfeljebb ennyi sorra
+        self.max_batch_size = config.get("deep_value", {}).get("max_batch_size", 1024)
+
         # model betöltése
         self.model = DeepValueNet(input_dim=self.input_dim)
         self.model.to(self.device)
@@ -47,15 +52,16 @@ class DeepValueEngine:
         self.model.eval()
 
     # ======================================================================
-    # FŐ PREDIKCIÓ
+    # FŐ PREDIKCIÓ (egy vektor)
     # ======================================================================
     def predict_value(self, meta_vector: np.ndarray):
         """
         meta_vector = MetaInputBuilder által generált végső input vektor
         """
+        out = self.predict_batch([meta_vector])
 
         # Fallback ha hibás dimenzió
-        if meta_vector is None or len(meta_vector) != self.input_dim:
+        if out["fallback"][0]:
             return {
                 "value_score": 0.5,
                 "confidence": 0.5,
@@ -63,24 +69,93 @@ class DeepValueEngine:
                 "source": "DeepValueEngine (fallback)"
             }
 
-        x = torch.tensor(meta_vector, dtype=torch.float32).to(self.device)
+        return {
+            "value_score": round(float(out["value_score"][0]), 4),
+            "confidence": round(float(out["confidence"][0]), 3),
+            "risk": round(float(out["risk"][0]), 3),
+            "source": "DeepValueEngine"
+        }
+
+    # ======================================================================
+    # SLATE PREDIKCIÓ: {match_id: feature vektor} → egy inferencia hívás
+    # ======================================================================
+    @traced()
+    def predict(self, fv_map):
+        """
+        fv_map: {match_id: {"features": fv}} vagy {match_id: fv}
+        Vissza: {match_id: {"value_score", "confidence", "risk", "source"}}
+        """
+        ids = list(fv_map.keys())
+        rows = [
+            v.get("features") if isinstance(v, dict) else v
+            for v in (fv_map[m] for m in ids)
+        ]
 
-        try:
-            with torch.no_grad():
-                val = float(self.model(x).cpu().numpy())
-        except:
-            val = 0.5
+        out = self.predict_batch(rows)
+
+        return {
+            match_id: {
+                "value_score": round(float(out["value_score"][i]), 4),
+                "confidence": round(float(out["confidence"][i]), 3),
+                "risk": round(float(out["risk"][i]), 3),
+                "source": "DeepValueEngine (fallback)" if out["fallback"][i] else "DeepValueEngine"
+            }
+            for i, match_id in enumerate(ids)
+        }
+
+    # ======================================================================
+    # BATCH: (N × input_dim) mátrix → egy forward pass
+    # ======================================================================
+    def predict_batch(self, matrix):
+        """
+        matrix: (N, input_dim) tömb vagy N vektor listája.
+        Hibás dimenziójú / nem véges sor → fallback (0.5 / 0.5 / 0.5).
+
+        Vissza: {"value_score", "confidence", "risk": (N,) tömbök,
+                 "fallback": (N,) bool maszk}
+        """
+        x, valid = self._stack(matrix)
+        n = len(valid)
+
+        val = np.full(n, 0.5)
+
+        if valid.any():
+            try:
+                val[valid] = predict_batched(self.model, x[valid], self.max_batch_size)
+            except Exception as e:
+                self.logger.error(f"[DeepValueEngine] Inference error: {e}")
 
         # Hard clamp (biztonság)
-        val = max(0.01, min(0.99, val))
+        val = np.clip(val, 0.01, 0.99)
 
         # Confidence → minél távolabb 0.5-től, annál erősebb jel
-        confidence = min(1.0, 0.5 + abs(val - 0.5) * 1.2)
+        confidence = np.minimum(1.0, 0.5 + np.abs(val - 0.5) * 1.2)
         risk = 1 - confidence
 
-        return {
-            "value_score": round(val, 4),
-            "confidence": round(confidence, 3),
-            "risk": round(risk, 3),
-            "source": "DeepValueEngine"
-        }
+        val[~valid] = 0.5
+        confidence[~valid] = 0.5
+        risk[~valid] = 0.5
+
+        return {"value_score": val, "confidence": confidence, "risk": risk, "fallback": ~valid}
+
+    def _stack(self, matrix):
+        """Sorok → (N, input_dim) float32 mátrix + érvényességi maszk."""
+        if isinstance(matrix, np.ndarray) and matrix.ndim == 2 and matrix.shape[1] == self.input_dim:
+            x = matrix.astype(np.float32)
+            return x, np.isfinite(x).all(axis=1)
+
+        rows = list(matrix)
+
+        x = np.zeros((len(rows), self.input_dim), dtype=np.float32)
+        valid = np.zeros(len(rows), dtype=bool)
+
+        for i, row in enumerate(rows):
+            if row is None or len(row) != self.input_dim:
+                continue
+            try:
+                x[i] = np.asarray(row, dtype=np.float32)
+            except (TypeError, ValueError):
+                continue
+            valid[i] = np.isfinite(x[i]).all()
+
+        return x, valid
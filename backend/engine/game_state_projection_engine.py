@@ -2,6 +2,7 @@
 
 import numpy as np
 from backend.utils.logger import get_logger
+from backend.system.tracing import traced
 
 class GameStateProjectionEngine:
     """
@@ -23,6 +24,10 @@ class GameStateProjectionEngine:
             "probability" = következő 5 percben a jobb csapat javára történik pozitív esemény
     """
 
+    # engine DAG (EngineScheduler)
+    DAG_OUTPUT = "game_state"
+    DAG_INPUTS = ("match_data",)
+
     def __init__(self, config):
         self.config = config
         self.logger = get_logger()
@@ -42,6 +47,7 @@ class GameStateProjectionEngine:
     # ----------------------------------------------------------------------
     # MAIN PREDICTOR
     # ----------------------------------------------------------------------
+    @traced()
     def predict(self, match_data):
         outputs = {}
 
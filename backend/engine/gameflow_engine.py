@@ -2,6 +2,9 @@
 
 import numpy as np
 from backend.utils.logger import get_logger
+from backend.core import engine_kernels as kernels
+from backend.core.match_frame import as_frame, frame_outputs
+from backend.system.tracing import traced
 
 class GameflowEngine:
     """
@@ -16,6 +19,16 @@ class GameflowEngine:
         • Támogatja a FusionEngine és LiveEngine rétegeket
     """
 
+    # engine DAG (EngineScheduler)
+    DAG_OUTPUT = "gameflow"
+    DAG_INPUTS = ("match_frame",)
+
+    # normalize / confidence / risk együtthatók (backend.core.engine_kernels)
+    QUALITY_KEY = "data_quality"
+    QUALITY_DEFAULT = 0.85
+    CONF_WEIGHTS = {"quality": 0.7, "stability": 0.3}
+    RISK_WEIGHTS = {"prob": 0.5, "conf": 0.5}
+
     def __init__(self, config):
         self.config = config
         self.logger = get_logger()
@@ -31,41 +44,46 @@ class GameflowEngine:
         self.min_conf = config.get("gameflow", {}).get("min_confidence", 0.60)
 
     # ----------------------------------------------------------------------
-    # PUBLIC PREDICTOR
+    # PUBLIC PREDICTOR (dict adapter)
     # ----------------------------------------------------------------------
+    @traced()
     def predict(self, match_data):
-        outputs = {}
-
-        for match_id, data in match_data.items():
-            try:
-                prob = self._flow_core(data)
-            except Exception as e:
-                self.logger.error(f"[Gameflow] Hiba, fallback: {e}")
-                prob = self.fallback_prob
-
-            prob = self._normalize(prob)
-            conf = self._confidence(prob, data)
-            risk = self._risk(prob, conf)
-
-            outputs[match_id] = {
-                "probability": round(prob, 4),
-                "confidence": round(conf, 3),
-                "risk": round(risk, 3),
-                "meta": {
-                    "flow_scaling": self.flow_scaling,
-                    "momentum_weight": self.momentum_weight,
-                    "press_weight": self.press_weight,
-                    "pace_weight": self.pace_weight
-                },
-                "source": "Gameflow"
-            }
-
-        return outputs
+        frame = as_frame(match_data)
+        out = self.predict_frame(frame)
+
+        return frame_outputs(
+            frame, out["probability"], out["confidence"], out["risk"],
+            meta={
+                "flow_scaling": self.flow_scaling,
+                "momentum_weight": self.momentum_weight,
+                "press_weight": self.press_weight,
+                "pace_weight": self.pace_weight
+            },
+            source="Gameflow"
+        )
+
+    # ----------------------------------------------------------------------
+    # BATCH: teljes slate oszlopos bemenetből
+    # ----------------------------------------------------------------------
+    def predict_frame(self, frame):
+        try:
+            prob = self._flow_core(frame)
+        except Exception as e:
+            self.logger.error(f"[Gameflow] Hiba, fallback: {e}")
+            prob = np.full(len(frame), self.fallback_prob)
+
+        prob = kernels.normalize(np.where(np.isfinite(prob), prob, self.fallback_prob))
+        conf = kernels.confidence(
+            prob, frame.col(self.QUALITY_KEY, self.QUALITY_DEFAULT), self.CONF_WEIGHTS, self.min_conf
+        )
+        risk = kernels.risk(prob, conf, self.RISK_WEIGHTS)
+
+        return {"probability": prob, "confidence": conf, "risk": risk}
 
     # ----------------------------------------------------------------------
     # GAMEFLOW MAG – TEMPÓ + MOMENTUM + PRESSING
     # ----------------------------------------------------------------------
-    def _flow_core(self, data):
+    def _flow_core(self, frame):
         """
         A Gameflow a következő komponensekből épül fel:
             • pace_index       (game speed)
@@ -75,11 +93,11 @@ class GameflowEngine:
             • pressing_away
         """
 
-        pace = data.get("pace", 1.0)
-        momentum_home = data.get("momentum_home", 0.5)
-        momentum_away = data.get("momentum_away", 0.5)
-        press_home = data.get("press_home", 0.5)
-        press_away = data.get("press_away", 0.5)
+        pace = frame.col("pace", 1.0)
+        momentum_home = frame.col("momentum_home", 0.5)
+        momentum_away = frame.col("momentum_away", 0.5)
+        press_home = frame.col("press_home", 0.5)
+        press_away = frame.col("press_away", 0.5)
 
         # flow iránya
         flow = (
@@ -91,26 +109,4 @@ class GameflowEngine:
         # probability konverzió
         prob = 0.5 + (flow * self.flow_scaling)
 
-        return float(prob)
-
-    # ----------------------------------------------------------------------
-    # NORMALIZÁLÁS
-    # ----------------------------------------------------------------------
-    def _normalize(self, p):
-        return float(max(0.01, min(0.99, p)))
-
-    # ----------------------------------------------------------------------
-    # CONFIDENCE
-    # ----------------------------------------------------------------------
-    def _confidence(self, prob, data):
-        stability = 1 - abs(prob - 0.5)
-        data_quality = data.get("data_quality", 0.85)
-
-        conf = (stability * 0.3 + data_quality * 0.7)
-        return float(max(self.min_conf, min(1.0, conf)))
-
-    # ----------------------------------------------------------------------
-    # RISK
-    # ----------------------------------------------------------------------
-    def _risk(self, prob, conf):
-        return float(min(1.0, max(0.0, (1 - prob) * 0.5 + (1 - conf) * 0.5)))
+        return prob
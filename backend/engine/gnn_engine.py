@@ -2,6 +2,9 @@
 
 import numpy as np
 from backend.utils.logger import get_logger
+from backend.core import engine_kernels as kernels
+from backend.core.batch_inference import predict_batched
+from backend.system.tracing import traced
 
 class GNN_Engine:
     """
@@ -20,6 +23,16 @@ class GNN_Engine:
         • stabilizált output generálására
     """
 
+    # engine DAG (EngineScheduler)
+    DAG_OUTPUT = "gnn"
+    DAG_INPUTS = ("match_data",)
+
+    # normalize / confidence / risk együtthatók (backend.core.engine_kernels)
+    QUALITY_KEY = "data_quality"
+    QUALITY_DEFAULT = 0.85
+    CONF_WEIGHTS = {"quality": 0.6, "prob": 0.4}
+    RISK_WEIGHTS = {"prob": 0.5, "conf": 0.5}
+
     def __init__(self, config):
         self.config = config
         self.logger = get_logger()
@@ -34,6 +47,9 @@ class GNN_Engine:
         self.scaling = config.get("gnn", {}).get("scaling", 1.08)
         self.min_conf = config.get("gnn", {}).get("min_confidence", 0.57)
 
+        # egy forward pass legfeljebb ennyi meccsre
+        self.max_batch_size = config.get("gnn", {}).get("max_batch_size", 256)
+
     # ----------------------------------------------------------------------
     # MODEL LOADER
     # ----------------------------------------------------------------------
@@ -70,34 +86,42 @@ class GNN_Engine:
     # ----------------------------------------------------------------------
     # PUBLIC: CSAPATSZINTŰ PREDIKCIÓ
     # ----------------------------------------------------------------------
+    @traced()
     def predict(self, match_data):
         outputs = {}
 
-        for match_id, data in match_data.items():
+        ids = list(match_data.keys())
+        inputs = {}
 
+        for match_id in ids:
             # gráf input előkészítés
-            g_input = self._prepare_graph_input(data)
-
             try:
-                if self.model:
-                    prob = self._predict_model(g_input)
-                else:
-                    prob = self._fallback_pred(data)
+                inputs[match_id] = self._prepare_graph_input(match_data[match_id])
             except Exception as e:
-                self.logger.error(f"[GNN] Hiba, fallback: {e}")
-                prob = self._fallback_pred(data)
+                self.logger.error(f"[GNN] Hibás gráf input ({match_id}) → fallback: {e}")
 
-            # normalizálás
-            prob = self._normalize(prob)
+        # egyetlen (max_batch_size-onként darabolt) forward pass a slate-re
+        model_probs = {}
+        if self.model and inputs:
+            model_ids = list(inputs.keys())
+            model_probs = dict(zip(model_ids, self._predict_model(np.stack([inputs[m] for m in model_ids]))))
 
-            # metrics
-            conf = self._confidence(prob, data)
-            risk = self._risk(prob, conf)
+        probs = [
+            model_probs[m] if m in model_probs else self._fallback_pred(match_data[m])
+            for m in ids
+        ]
 
+        # normalizálás + metrics a teljes slate-re egyszerre
+        probs = kernels.normalize(probs, self.scaling)
+        quality = [match_data[m].get(self.QUALITY_KEY, self.QUALITY_DEFAULT) for m in ids]
+        confs = kernels.confidence(probs, quality, self.CONF_WEIGHTS, self.min_conf)
+        risks = kernels.risk(probs, confs, self.RISK_WEIGHTS)
+
+        for i, match_id in enumerate(ids):
             outputs[match_id] = {
-                "probability": round(prob, 4),
-                "confidence": round(conf, 3),
-                "risk": round(risk, 3),
+                "probability": round(float(probs[i]), 4),
+                "confidence": round(float(confs[i]), 3),
+                "risk": round(float(risks[i]), 3),
                 "meta": {
                     "embedding_size": 16,
                     "model_loaded": self.model is not None
@@ -144,21 +168,16 @@ class GNN_Engine:
     # ----------------------------------------------------------------------
     # MODEL PREDIKCIÓ
     # ----------------------------------------------------------------------
-    def _predict_model(self, g_input):
+    def _predict_model(self, g_inputs):
         """
-        Ha a modell létezik, futtatjuk rajta.
+        (N, 11) gráf input stack → (N,) probability, egy forward pass
+        max_batch_size-onként (Keras predict / torch.inference_mode).
         """
         try:
-            if hasattr(self.model, "predict"):  # Keras
-                p = float(self.model.predict(g_input.reshape(1, -1))[0][0])
-                return p
-            else:  # PyTorch
-                import torch
-                tens = torch.tensor(g_input, dtype=torch.float32).unsqueeze(0)
-                p = float(self.model(tens).detach().numpy()[0][0])
-                return p
-        except:
-            return self.base_prob
+            return predict_batched(self.model, g_inputs, self.max_batch_size)
+        except Exception as e:
+            self.logger.error(f"[GNN] Modell hiba → fallback: {e}")
+            return np.full(len(g_inputs), self.base_prob)
 
     # ----------------------------------------------------------------------
     # FALLBACK PREDIKCIÓ
@@ -166,24 +185,3 @@ class GNN_Engine:
     def _fallback_pred(self, data):
         noise = np.random.uniform(-self.variance, self.variance) * 0.25
         return self.base_prob + noise
-
-    # ----------------------------------------------------------------------
-    # NORMALIZÁLÁS
-    # ----------------------------------------------------------------------
-    def _normalize(self, p):
-        p *= self.scaling
-        return float(max(0.01, min(0.99, p)))
-
-    # ----------------------------------------------------------------------
-    # CONFIDENCE
-    # ----------------------------------------------------------------------
-    def _confidence(self, prob, data):
-        quality = data.get("data_quality", 0.85)
-        conf = prob * 0.4 + quality * 0.6
-        return float(max(self.min_conf, min(1.0, conf)))
-
-    # ----------------------------------------------------------------------
-    # RISK
-    # ----------------------------------------------------------------------
-    def _risk(self, prob, conf):
-        return float(min(1.0, max(0.0, (1 - prob) * 0.5 + (1 - conf) * 0.5)))
@@ -2,6 +2,9 @@
 
 import numpy as np
 from backend.utils.logger import get_logger
+from backend.core import engine_kernels as kernels
+from backend.core.match_frame import as_frame, frame_outputs
+from backend.system.tracing import traced
 
 class InjuryEngine:
     """
@@ -15,6 +18,16 @@ class InjuryEngine:
         • sérülés-intenzitási faktor (impact_score)
     """
 
+    # engine DAG (EngineScheduler)
+    DAG_OUTPUT = "injury"
+    DAG_INPUTS = ("match_frame",)
+
+    # normalize / confidence / risk együtthatók (backend.core.engine_kernels)
+    QUALITY_KEY = "injury_data_quality"
+    QUALITY_DEFAULT = 0.75
+    CONF_WEIGHTS = {"quality": 0.6, "stability": 0.4}
+    RISK_WEIGHTS = {"prob": 0.5, "conf": 0.5}
+
     def __init__(self, config):
         self.config = config
         self.logger = get_logger()
@@ -27,39 +40,44 @@ class InjuryEngine:
         self.fallback_prob = 0.52
 
     # ----------------------------------------------------------------------
-    # PUBLIC: fő injury predikció
+    # PUBLIC: fő injury predikció (dict adapter)
     # ----------------------------------------------------------------------
+    @traced()
     def predict(self, match_data):
-        outputs = {}
-
-        for match_id, data in match_data.items():
-            try:
-                prob = self._injury_core(data)
-            except Exception as e:
-                self.logger.error(f"[Injury] Hiba → fallback: {e}")
-                prob = self.fallback_prob
-
-            prob = self._normalize(prob)
-            conf = self._confidence(prob, data)
-            risk = self._risk(prob, conf)
-
-            outputs[match_id] = {
-                "probability": round(prob, 4),
-                "confidence": round(conf, 3),
-                "risk": round(risk, 3),
-                "meta": {
-                    "injury_scaling": self.scaling,
-                    "depth_scaling": self.depth_scaling
-                },
-                "source": "Injury"
-            }
-
-        return outputs
+        frame = as_frame(match_data)
+        out = self.predict_frame(frame)
+
+        return frame_outputs(
+            frame, out["probability"], out["confidence"], out["risk"],
+            meta={
+                "injury_scaling": self.scaling,
+                "depth_scaling": self.depth_scaling
+            },
+            source="Injury"
+        )
+
+    # ----------------------------------------------------------------------
+    # BATCH: teljes slate oszlopos bemenetből
+    # ----------------------------------------------------------------------
+    def predict_frame(self, frame):
+        try:
+            prob = self._injury_core(frame)
+        except Exception as e:
+            self.logger.error(f"[Injury] Hiba → fallback: {e}")
+            prob = np.full(len(frame), self.fallback_prob)
+
+        prob = kernels.normalize(np.where(np.isfinite(prob), prob, self.fallback_prob))
+        conf = kernels.confidence(
+            prob, frame.col(self.QUALITY_KEY, self.QUALITY_DEFAULT), self.CONF_WEIGHTS, self.min_conf
+        )
+        risk = kernels.risk(prob, conf, self.RISK_WEIGHTS)
+
+        return {"probability": prob, "confidence": conf, "risk": risk}
 
     # ----------------------------------------------------------------------
     # INJURY MAG – LINEUP DROPOUT MODEL
     # ----------------------------------------------------------------------
-    def _injury_core(self, data):
+    def _injury_core(self, frame):
         """
         Bemenő jellemzők:
 
@@ -73,14 +91,14 @@ class InjuryEngine:
         Ezek alapján számolunk strength-drop értéket.
         """
 
-        injury_home = data.get("injury_home_weight", 0.0)
-        injury_away = data.get("injury_away_weight", 0.0)
+        injury_home = frame.col("injury_home_weight", 0.0)
+        injury_away = frame.col("injury_away_weight", 0.0)
 
-        missing_home = data.get("missing_key_home", 0)      # 0-3
-        missing_away = data.get("missing_key_away", 0)
+        missing_home = frame.col("missing_key_home", 0)     # 0-3
+        missing_away = frame.col("missing_key_away", 0)
 
-        depth_home = data.get("depth_home", 0.8)            # csapat mélység 0-1
-        depth_away = data.get("depth_away", 0.8)
+        depth_home = frame.col("depth_home", 0.8)           # csapat mélység 0-1
+        depth_away = frame.col("depth_away", 0.8)
 
         # KOMBINÁLT HATÁS: (sérülés + hiány + csapatmélység)
         home_drop = (
@@ -99,26 +117,4 @@ class InjuryEngine:
         prob_shift = (away_drop - home_drop) * self.scaling
         prob = 0.5 + prob_shift
 
-        return float(prob)
-
-    # ----------------------------------------------------------------------
-    # NORMALIZÁLÁS
-    # ----------------------------------------------------------------------
-    def _normalize(self, p):
-        return float(max(0.01, min(0.99, p)))
-
-    # ----------------------------------------------------------------------
-    # CONFIDENCE
-    # ----------------------------------------------------------------------
-    def _confidence(self, prob, data):
-        injury_quality = data.get("injury_data_quality", 0.75)
-        stability = 1 - abs(prob - 0.5)
-
-        conf = injury_quality * 0.6 + stability * 0.4
-        return float(max(self.min_conf, min(1.0, conf)))
-
-    # ----------------------------------------------------------------------
-    # RISK
-    # ----------------------------------------------------------------------
-    def _risk(self, prob, conf):
-        return float(min(1.0, max(0.0, (1 - prob) * 0.5 + (1 - conf) * 0.5)))
+        return prob
@@ -2,6 +2,9 @@
 
 import numpy as np
 from backend.utils.logger import get_logger
+from backend.core import engine_kernels as kernels
+from backend.core.batch_inference import predict_batched
+from backend.system.tracing import traced
 
 class LSTM_RNN_Engine:
     """
@@ -18,6 +21,16 @@ class LSTM_RNN_Engine:
         • meta adatok FusionEngine-hez
     """
 
+    # engine DAG (EngineScheduler)
+    DAG_OUTPUT = "lstm"
+    DAG_INPUTS = ("match_data",)
+
+    # normalize / confidence / risk együtthatók (backend.core.engine_kernels)
+    QUALITY_KEY = "data_quality"
+    QUALITY_DEFAULT = 0.8
+    CONF_WEIGHTS = {"quality": 0.5, "prob": 0.5}
+    RISK_WEIGHTS = {"prob": 0.6, "conf": 0.4}
+
     def __init__(self, config):
         self.config = config
         self.logger = get_logger()
@@ -34,6 +47,9 @@ class LSTM_RNN_Engine:
 
         self.min_conf = config.get("lstm", {}).get("min_confidence", 0.58)
 
+        # egy forward pass legfeljebb ennyi meccsre
+        self.max_batch_size = config.get("lstm", {}).get("max_batch_size", 256)
+
     # --------------------------------------------------------
     # MODEL BETÖLTÉSE (HA VAN)
     # --------------------------------------------------------
@@ -64,34 +80,43 @@ class LSTM_RNN_Engine:
     # --------------------------------------------------------
     # FŐ PREDIKCIÓ
     # --------------------------------------------------------
+    @traced()
     def predict(self, match_data):
         outputs = {}
 
-        for match_id, data in match_data.items():
-
-            seq = self._prepare_sequence(data)
+        ids = list(match_data.keys())
+        seqs = {}
 
+        for match_id in ids:
             try:
-                if self.model:
-                    prob = self._predict_model(seq)
-                else:
-                    prob = self._fallback_pred(data)
-            except:
-                prob = self._fallback_pred(data)
-
-            # normalizálás
-            prob = self._normalize(prob)
+                seqs[match_id] = self._prepare_sequence(match_data[match_id])
+            except Exception as e:
+                self.logger.error(f"[LSTM] Hibás idősor ({match_id}) → fallback: {e}")
+
+        # egyetlen (max_batch_size-onként darabolt) forward pass a slate-re
+        model_probs = {}
+        if self.model and seqs:
+            model_ids = list(seqs.keys())
+            model_probs = dict(zip(model_ids, self._predict_model(np.stack([seqs[m] for m in model_ids]))))
+
+        probs = [
+            model_probs[m] if m in model_probs else self._fallback_pred(match_data[m])
+            for m in ids
+        ]
 
-            # metrics
-            conf = self._confidence(prob, data)
-            risk = self._risk(prob, conf)
+        # normalizálás + metrics
+        probs = kernels.normalize(probs, self.scaling)
+        quality = [match_data[m].get(self.QUALITY_KEY, self.QUALITY_DEFAULT) for m in ids]
+        confs = kernels.confidence(probs, quality, self.CONF_WEIGHTS, self.min_conf)
+        risks = kernels.risk(probs, confs, self.RISK_WEIGHTS)
 
+        for i, match_id in enumerate(ids):
             outputs[match_id] = {
-                "probability": round(prob, 4),
-                "confidence": round(conf, 3),
-                "risk": round(risk, 3),
+                "probability": round(float(probs[i]), 4),
+                "confidence": round(float(confs[i]), 3),
+                "risk": round(float(risks[i]), 3),
                 "meta": {
-                    "sequence_len": len(seq),
+                    "sequence_len": len(seqs[match_id]) if match_id in seqs else 0,
                     "model_loaded": self.model is not None
                 },
                 "source": "LSTM_RNN"
@@ -125,18 +150,16 @@ class LSTM_RNN_Engine:
     # --------------------------------------------------------
     # MODELL FUTTATÁSA
     # --------------------------------------------------------
-    def _predict_model(self, seq):
+    def _predict_model(self, seqs):
+        """
+        (N, 10, 3) idősor-stack → (N,) probability, egy forward pass
+        max_batch_size-onként (Keras predict / torch.inference_mode).
+        """
         try:
-            if hasattr(self.model, "predict"):  # KERAS
-                p = float(self.model.predict(seq.reshape(1, seq.shape[0], seq.shape[1]))[0][0])
-                return p
-            else:  # PYTORCH
-                import torch
-                tens = torch.tensor(seq, dtype=torch.float32).unsqueeze(0)
-                p = float(self.model(tens).detach().numpy()[0][0])
-                return p
-        except:
-            return self.fallback_center
+            return predict_batched(self.model, seqs, self.max_batch_size)
+        except Exception as e:
+            self.logger.error(f"[LSTM] Modell hiba → fallback: {e}")
+            return np.full(len(seqs), self.fallback_center)
 
     # --------------------------------------------------------
     # FALLBACK PREDIKCIÓ
@@ -145,24 +168,3 @@ class LSTM_RNN_Engine:
         base = self.fallback_center
         noise = np.random.uniform(-self.fallback_spread, self.fallback_spread) * 0.25
         return base + noise
-
-    # --------------------------------------------------------
-    # NORMALIZÁLÁS
-    # --------------------------------------------------------
-    def _normalize(self, p):
-        p *= self.scaling
-        return float(max(0.01, min(0.99, p)))
-
-    # --------------------------------------------------------
-    # CONFIDENCE
-    # --------------------------------------------------------
-    def _confidence(self, prob, data):
-        quality = data.get("data_quality", 0.8)
-        conf = prob * 0.5 + quality * 0.5
-        return float(max(self.min_conf, min(1.0, conf)))
-
-    # --------------------------------------------------------
-    # RISK
-    # --------------------------------------------------------
-    def _risk(self, prob, conf):
-        return float(min(1.0, max(0.0, (1 - prob) * 0.6 + (1 - conf) * 0.4)))
@@ -2,6 +2,7 @@
 
 import numpy as np
 from backend.utils.logger import get_logger
+from backend.system.tracing import traced
 
 class MarketMicrostructureEngine:
     """
@@ -21,6 +22,10 @@ class MarketMicrostructureEngine:
             - orderbook-style trend analízis
     """
 
+    # engine DAG (EngineScheduler)
+    DAG_OUTPUT = "market"
+    DAG_INPUTS = ("match_data",)
+
     def __init__(self, config):
         self.config = config
         self.logger = get_logger()
@@ -44,6 +49,7 @@ class MarketMicrostructureEngine:
     # ----------------------------------------------------------------------
     # PUBLIC PREDICTOR
     # ----------------------------------------------------------------------
+    @traced()
     def predict(self, match_data):
         outputs = {}
         for match_id, data in match_data.items():
@@ -1,7 +1,13 @@
 # backend/engine/montecarlo_v3_engine.py
 
+import os
 import numpy as np
 from backend.utils.logger import get_logger
+from backend.core import engine_kernels as kernels
+from backend.core.montecarlo_sim import (
+    simulate_counts, simulate_adaptive, simulate_parallel, counts_to_probs, ci_half_width
+)
+from backend.system.tracing import traced
 
 class MonteCarloV3Engine:
     """
@@ -17,6 +23,16 @@ class MonteCarloV3Engine:
         • luck-regression (extrém score-ok kisimítása)
     """
 
+    # engine DAG (EngineScheduler)
+    DAG_OUTPUT = "mc3"
+    DAG_INPUTS = ("match_data",)
+
+    # normalize / confidence / risk együtthatók (backend.core.engine_kernels)
+    QUALITY_KEY = "data_quality"
+    QUALITY_DEFAULT = 0.85
+    CONF_WEIGHTS = {"quality": 0.5, "stability": 0.5}
+    RISK_WEIGHTS = {"prob": 0.6, "conf": 0.4}
+
     def __init__(self, config):
         self.config = config
         self.logger = get_logger()
@@ -33,12 +49,36 @@ class MonteCarloV3Engine:
         # rating súly
         self.rating_weight = config.get("montecarlo", {}).get("rating_weight", 0.5)
 
+        # reprodukálhatóság: azonos seed → azonos szimuláció
+        self.seed = config.get("montecarlo", {}).get("seed", None)
+
+        # (meccs × szimuláció) blokk mérete egy húzásnál
+        self.chunk_elems = config.get("montecarlo", {}).get("chunk_elems", 2000000)
+
+        # adaptív mód: chunkonként szimulál, és leáll, ha a CI elég szűk
+        #   (self.simulations ilyenkor a felső korlát)
+        self.adaptive = config.get("montecarlo", {}).get("adaptive", False)
+        self.tolerance = config.get("montecarlo", {}).get("tolerance", 0.005)
+        self.ci_z = config.get("montecarlo", {}).get("ci_z", 1.96)
+        self.adaptive_step = config.get("montecarlo", {}).get("adaptive_step", 2000)
+        self.min_simulations = config.get("montecarlo", {}).get("min_simulations", 2000)
+
+        # több folyamatos mód: fix méretű shardok, shardonként saját seed stream
+        #   → az eredmény nem függ a workerek számától
+        self.parallel = config.get("montecarlo", {}).get("parallel", False)
+        self.workers = config.get("montecarlo", {}).get("workers", os.cpu_count() or 1)
+        self.shard_size = config.get("montecarlo", {}).get("shard_size", 256)
+        self.sim_shard = config.get("montecarlo", {}).get("sim_shard", None)
+
+        self.min_conf = config.get("montecarlo", {}).get("min_confidence", 0.55)
+
         # fallback
         self.fallback_prob = 0.50
 
     # ----------------------------------------------------------------------
     # PUBLIC: fő Monte Carlo futtatás
     # ----------------------------------------------------------------------
+    @traced()
     def predict(self, match_data):
         """
         Bemenet: match_data[match_id] = adatok
@@ -56,25 +96,64 @@ class MonteCarloV3Engine:
 
         results = {}
 
+        # 1) lambdák, 2) egyetlen (meccs × szimuláció) menet a teljes slate-re
+        ids = []
+        lam_h = []
+        lam_a = []
+        failed = set()
+
         for match_id, data in match_data.items():
             try:
-                prob = self._run_simulation(data)
+                lh, la = self._lambdas(data)
             except Exception as e:
                 self.logger.error(f"[MonteCarlo] Hiba, fallback: {e}")
-                prob = self.fallback_prob
-
-            prob = float(max(0.01, min(0.99, prob)))
-
-            confidence = self._confidence(prob, data)
-            risk = self._risk(prob, confidence)
+                lh, la = 1.0, 1.0
+                failed.add(match_id)
+
+            ids.append(match_id)
+            lam_h.append(lh)
+            lam_a.append(la)
+
+        try:
+            batch = self.predict_batch(lam_h, lam_a) if ids else None
+        except Exception as e:
+            self.logger.error(f"[MonteCarlo] Szimulációs hiba, fallback: {e}")
+            batch = None
+            failed.update(ids)
+
+        # normalize / confidence / risk a teljes slate-re egyszerre
+        probs = kernels.normalize([
+            self.fallback_prob if match_id in failed else batch["home"][i]
+            for i, match_id in enumerate(ids)
+        ])
+        quality = [match_data[m].get(self.QUALITY_KEY, self.QUALITY_DEFAULT) for m in ids]
+        confs = kernels.confidence(probs, quality, self.CONF_WEIGHTS, self.min_conf)
+        risks = kernels.risk(probs, confs, self.RISK_WEIGHTS)
+
+        for i, match_id in enumerate(ids):
+            if match_id in failed:
+                dist = {"draw_prob": None, "away_prob": None, "total_goals": None,
+                        "simulations_run": 0, "ci_half_width": None}
+            else:
+                dist = {
+                    "draw_prob": round(float(batch["draw"][i]), 4),
+                    "away_prob": round(float(batch["away"][i]), 4),
+                    "total_goals": [round(float(p), 4) for p in batch["total_goals"][i]],
+                    "simulations_run": int(batch["simulations"][i]),
+                    "ci_half_width": round(float(batch["ci_half_width"][i]), 5),
+                }
 
             results[match_id] = {
-                "probability": round(prob, 4),
-                "confidence": round(confidence, 3),
-                "risk": round(risk, 3),
+                "probability": round(float(probs[i]), 4),
+                "confidence": round(float(confs[i]), 3),
+                "risk": round(float(risks[i]), 3),
                 "meta": {
                     "simulations": self.simulations,
-                    "variance_boost": self.variance_boost
+                    "variance_boost": self.variance_boost,
+                    "seed": self.seed,
+                    "adaptive": self.adaptive,
+                    "parallel": self.parallel,
+                    **dist
                 },
                 "source": "MonteCarloV3"
             }
@@ -82,9 +161,52 @@ class MonteCarloV3Engine:
         return results
 
     # ----------------------------------------------------------------------
-    # MONTE CARLO MAG: több tízezer szimuláció
+    # BATCH: teljes slate egy vektorizált menetben
     # ----------------------------------------------------------------------
-    def _run_simulation(self, data):
+    def predict_batch(self, lambda_home, lambda_away, rng=None):
+        """
+        λ_home, λ_away tömbök → szimulált eloszlások.
+        Seedelt numpy Generator; ha nincs megadva, self.seed-ből készül,
+        így azonos seed mellett a teljes slate eredménye reprodukálható.
+        Adaptív módban meccsenként eltérő szimulációszám futhat.
+        Párhuzamos módban (montecarlo.parallel) a slate shardokra bomlik és
+        process poolon fut; ekkor a seed a shard streamek gyökere.
+
+        Vissza:
+            {"home", "draw", "away", "simulations", "ci_half_width": (N,),
+             "total_goals": (N, 2·max_goals+1)}
+        """
+        opts = {"max_goals": self.max_goals, "chunk_elems": self.chunk_elems}
+        adaptive_opts = {
+            "tolerance": self.tolerance, "z": self.ci_z,
+            "step": self.adaptive_step, "min_simulations": self.min_simulations
+        }
+
+        if self.parallel and rng is None:
+            counts = simulate_parallel(
+                lambda_home, lambda_away, self.simulations, seed=self.seed,
+                workers=self.workers, shard_size=self.shard_size, sim_shard=self.sim_shard,
+                adaptive=self.adaptive, **opts, **adaptive_opts
+            )
+        elif self.adaptive:
+            counts = simulate_adaptive(
+                lambda_home, lambda_away, self.simulations,
+                rng or np.random.default_rng(self.seed), **opts, **adaptive_opts
+            )
+        else:
+            counts = simulate_counts(
+                lambda_home, lambda_away, self.simulations,
+                rng or np.random.default_rng(self.seed), **opts
+            )
+
+        out = counts_to_probs(counts)
+        out["ci_half_width"] = ci_half_width(counts, self.ci_z)
+        return out
+
+    # ----------------------------------------------------------------------
+    # LAMBDA SZÁMÍTÁS
+    # ----------------------------------------------------------------------
+    def _lambdas(self, data):
 
         # bemeneti faktorok
         xg_home = data.get("xg_home", 1.2)
@@ -110,51 +232,17 @@ class MonteCarloV3Engine:
         lambda_home = max(0.2, min(5.0, lambda_home))
         lambda_away = max(0.2, min(5.0, lambda_away))
 
-        # szimulációk
-        home_wins = 0
-        draws = 0
-        away_wins = 0
-
-        for _ in range(self.simulations):
-            home_goals = np.random.poisson(lambda_home)
-            away_goals = np.random.poisson(lambda_away)
-
-            # luck regression – extrém eredmények letompítása
-            if home_goals > self.max_goals:
-                home_goals = self.max_goals
-            if away_goals > self.max_goals:
-                away_goals = self.max_goals
-
-            if home_goals > away_goals:
-                home_wins += 1
-            elif home_goals == away_goals:
-                draws += 1
-            else:
-                away_wins += 1
-
-        # kimenet → valószínűség "1-es kimenetre"
-        total = home_wins + draws + away_wins
-        if total == 0:
-            return self.fallback_prob
-
-        return home_wins / total
+        return lambda_home, lambda_away
 
     # ----------------------------------------------------------------------
-    # CONFIDENCE
+    # MONTE CARLO MAG: egy meccs (vektorizált)
     # ----------------------------------------------------------------------
-    def _confidence(self, prob, data):
-        quality = data.get("data_quality", 0.85)
-        stability = 1 - abs(0.5 - prob)  # minél távolabb 0.5-től → annál stabilabb
-
-        conf = quality * 0.5 + stability * 0.5
-
-        return float(max(0.55, min(1.0, conf)))
+    def _run_simulation(self, data):
+        lambda_home, lambda_away = self._lambdas(data)
+        batch = self.predict_batch([lambda_home], [lambda_away])
 
-    # ----------------------------------------------------------------------
-    # RISK
-    # ----------------------------------------------------------------------
-    def _risk(self, prob, confidence):
-        base = (1 - prob)
-        risk = base * 0.6 + (1 - confidence) * 0.4
+        # kimenet → valószínűség "1-es kimenetre"
+        if batch["simulations"][0] == 0:
+            return self.fallback_prob
 
-        return float(max(0.0, min(1.0, risk)))
+        return float(batch["home"][0])
@@ -2,6 +2,7 @@
 
 import numpy as np
 from backend.utils.logger import get_logger
+from backend.system.tracing import traced
 
 class OddsmakerEmulatorEngine:
     """
@@ -15,6 +16,10 @@ class OddsmakerEmulatorEngine:
         • Value mismatch → saját probability vs booki implied probability
     """
 
+    # engine DAG (EngineScheduler)
+    DAG_OUTPUT = "odds_engine"
+    DAG_INPUTS = ("match_data",)
+
     def __init__(self, config):
         self.config = config
         self.logger = get_logger()
@@ -31,6 +36,7 @@ class OddsmakerEmulatorEngine:
     # ----------------------------------------------------------------------
     # PUBLIC PREDICTION
     # ----------------------------------------------------------------------
+    @traced()
     def predict(self, match_data):
         outputs = {}
 
@@ -1,7 +1,12 @@
 # backend/engine/poisson_engine.py
 
+import math
 import numpy as np
 from backend.utils.logger import get_logger
+from backend.core.score_matrix import outcome_probs, match_markets
+from backend.core import engine_kernels as kernels
+from backend.core.match_frame import as_frame
+from backend.system.tracing import traced
 
 class PoissonEngine:
     """
@@ -16,6 +21,16 @@ class PoissonEngine:
         • confidence + risk számítás
     """
 
+    # engine DAG (EngineScheduler)
+    DAG_OUTPUT = "poisson"
+    DAG_INPUTS = ("match_frame",)
+
+    # normalize / confidence / risk együtthatók (backend.core.engine_kernels)
+    QUALITY_KEY = "data_quality"
+    QUALITY_DEFAULT = 0.80
+    CONF_WEIGHTS = {"quality": 0.5, "stability": 0.5}
+    RISK_WEIGHTS = {"prob": 0.6, "conf": 0.4}
+
     def __init__(self, config):
         self.config = config
         self.logger = get_logger()
@@ -36,29 +51,22 @@ class PoissonEngine:
     # ----------------------------------------------------------------------
     # PUBLIC: fő Poisson predikció
     # ----------------------------------------------------------------------
+    @traced()
     def predict(self, match_data):
-        outputs = {}
-
-        for match_id, data in match_data.items():
-
-            try:
-                prob = self._calculate_poisson_prob(data)
-            except Exception as e:
-                self.logger.error(f"[Poisson] Hiba, fallback: {e}")
-                prob = 0.50
-
-            prob = self._normalize(prob)
-
-            conf = self._confidence(prob, data)
-            risk = self._risk(prob, conf)
+        frame = as_frame(match_data)
+        out = self.predict_frame(frame)
 
+        outputs = {}
+        for i, match_id in enumerate(frame.ids):
             outputs[match_id] = {
-                "probability": round(prob, 4),
-                "confidence": round(conf, 3),
-                "risk": round(risk, 3),
+                "probability": round(float(out["probability"][i]), 4),
+                "confidence": round(float(out["confidence"][i]), 3),
+                "risk": round(float(out["risk"][i]), 3),
                 "meta": {
                     "variance_boost": self.variance_boost,
-                    "scaling": self.scaling
+                    "scaling": self.scaling,
+                    "draw_prob": round(float(out["draw"][i]), 4),
+                    "away_prob": round(float(out["away"][i]), 4)
                 },
                 "source": "Poisson"
             }
@@ -66,14 +74,87 @@ class PoissonEngine:
         return outputs
 
     # ----------------------------------------------------------------------
-    # POISSON MAG
+    # FRAME: oszlopos bemenet → lambdák → egyetlen vektorizált Poisson menet
     # ----------------------------------------------------------------------
-    def _calculate_poisson_prob(self, data):
+    def predict_frame(self, frame):
+        n = len(frame)
+        try:
+            with np.errstate(invalid="ignore", over="ignore"):
+                lam_h, lam_a = self._lambdas_frame(frame)
+
+            # nem véges lambda (pl. inf xG · 0 rating) → csak az a meccs megy fallbackre
+            valid = np.isfinite(lam_h) & np.isfinite(lam_a)
+            if not valid.all():
+                self.logger.error(f"[Poisson] Hibás lambda, fallback: {[frame.ids[i] for i in np.flatnonzero(~valid)]}")
+                lam_h = np.where(valid, lam_h, self.fallback_lambda)
+                lam_a = np.where(valid, lam_a, self.fallback_lambda)
+
+            batch = self.predict_batch(lam_h, lam_a)
+            prob = np.where(valid, batch["home"], 0.50)
+            draw = np.where(valid, batch["draw"], np.nan)
+            away = np.where(valid, batch["away"], np.nan)
+        except Exception as e:
+            self.logger.error(f"[Poisson] Hiba, fallback: {e}")
+            prob = np.full(n, 0.50)
+            draw = np.full(n, np.nan)
+            away = np.full(n, np.nan)
+
+        prob = kernels.normalize(prob, self.scaling)
+        conf = kernels.confidence(
+            prob, frame.col(self.QUALITY_KEY, self.QUALITY_DEFAULT), self.CONF_WEIGHTS, self.min_conf
+        )
+        risk = kernels.risk(prob, conf, self.RISK_WEIGHTS)
+
+        return {"probability": prob, "confidence": conf, "risk": risk, "draw": draw, "away": away}
+
+    # ----------------------------------------------------------------------
+    # BATCH: teljes slate egy vektorizált menetben
+    # ----------------------------------------------------------------------
+    def predict_batch(self, lambda_home, lambda_away):
         """
-        Klasszikus Poisson logika:
-            P(home_goals > away_goals)
+        λ_home, λ_away tömbök → 1X2 valószínűség tömbök.
+        A score mátrixok a PMF táblák külső szorzatából jönnek
+        (backend.core.score_matrix), nincs meccsenkénti Python ciklus.
+
+        Vissza: {"home": (N,), "draw": (N,), "away": (N,)}
+        """
+        home, draw, away = outcome_probs(lambda_home, lambda_away, self.max_goals)
+        return {"home": home, "draw": draw, "away": away}
+
+    # ----------------------------------------------------------------------
+    # PIACOK: 1X2, O/U, AH, BTTS, correct score
+    # ----------------------------------------------------------------------
+    def markets(self, data):
+        """
+        Egy meccs teljes piac-készlete ugyanabból a score mátrixból,
+        amiből a probability jön (közös, λ-pár szerint cache-elt szolgáltatás).
         """
+        lambda_home, lambda_away = self._lambdas(data)
+        return match_markets(lambda_home, lambda_away, self.max_goals)
+
+    # ----------------------------------------------------------------------
+    # LAMBDA SZÁMÍTÁS
+    # ----------------------------------------------------------------------
+    def _lambdas_frame(self, frame):
+        """_lambdas oszlopos változata (hiányzó / 0 xG → fallback lambda)."""
+        xg_home = frame.col("xg_home", 0.0)
+        xg_away = frame.col("xg_away", 0.0)
+
+        att_h = frame.col("attack_home", 1.0)
+        def_h = frame.col("defense_home", 1.0)
+        att_a = frame.col("attack_away", 1.0)
+        def_a = frame.col("defense_away", 1.0)
+        pace = frame.col("pace", 1.0)
 
+        lambda_home = np.where(xg_home != 0, xg_home * att_h * def_a, self.fallback_lambda)
+        lambda_away = np.where(xg_away != 0, xg_away * att_a * def_h, self.fallback_lambda)
+
+        lambda_home = lambda_home * pace * self.variance_boost
+        lambda_away = lambda_away * pace * self.variance_boost
+
+        return np.clip(lambda_home, 0.1, 5.0), np.clip(lambda_away, 0.1, 5.0)
+
+    def _lambdas(self, data):
         # xG paraméterek
         xg_home = data.get("xg_home", None)
         xg_away = data.get("xg_away", None)
@@ -105,6 +186,19 @@ class PoissonEngine:
         lambda_home = max(0.1, min(5.0, lambda_home))
         lambda_away = max(0.1, min(5.0, lambda_away))
 
+        return lambda_home, lambda_away
+
+    # ----------------------------------------------------------------------
+    # POISSON MAG (meccsenkénti referencia út)
+    # ----------------------------------------------------------------------
+    def _calculate_poisson_prob(self, data):
+        """
+        Klasszikus Poisson logika:
+            P(home_goals > away_goals)
+        """
+
+        lambda_home, lambda_away = self._lambdas(data)
+
         # Gólmátrix
         total_prob = 0
         home_win_prob = 0
@@ -131,30 +225,4 @@ class PoissonEngine:
     # POISSON PROBABILITY
     # ----------------------------------------------------------------------
     def _poisson_p(self, goals, lam):
-        return (lam ** goals) * np.exp(-lam) / np.math.factorial(goals)
-
-    # ----------------------------------------------------------------------
-    # NORMALIZÁLÁS
-    # ----------------------------------------------------------------------
-    def _normalize(self, p):
-        p *= self.scaling
-        return float(max(0.01, min(0.99, p)))
-
-    # ----------------------------------------------------------------------
-    # CONFIDENCE
-    # ----------------------------------------------------------------------
-    def _confidence(self, prob, data):
-        # adatminőség
-        quality = data.get("data_quality", 0.80)
-
-        # minél távolabb van 0.5-től → annál erősebb jel
-        stability = 1 - abs(0.5 - prob)
-
-        conf = quality * 0.5 + stability * 0.5
-        return float(max(self.min_conf, min(1.0, conf)))
-
-    # ----------------------------------------------------------------------
-    # RISK
-    # ----------------------------------------------------------------------
-    def _risk(self, prob, conf):
-        return float(min(1.0, max(0.0, (1 - prob) * 0.6 + (1 - conf) * 0.4)))
+        return (lam ** goals) * np.exp(-lam) / math.factorial(goals)
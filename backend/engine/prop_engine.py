@@ -2,6 +2,8 @@
 
 import math
 
+from backend.core.score_matrix import match_markets
+
 class PropEngine:
     """
     PROP ENGINE
@@ -17,6 +19,7 @@ class PropEngine:
 
     def __init__(self, config):
         self.config = config
+        self.max_goals = config.get("prop", {}).get("max_goals", 10)
 
     # -----------------------------------------------------------
     # FAIR VALUE számítás prop piacokra
@@ -38,10 +41,9 @@ class PropEngine:
     def _expected_corners(self, stats):
         return max(6, min(14, stats.get("corners_per_game", 9.5)))
 
-    # BTTS model
-    def _btts_probability(self, home_xg, away_xg):
-        # egyszerű multiplikatív modell
-        return max(0.05, min(0.95, (home_xg * away_xg) / 3))
+    # Goal markets – közös score mátrixból (Poisson, λ = xG)
+    def _goal_markets(self, home_xg, away_xg):
+        return match_markets(home_xg, away_xg, self.max_goals)
 
     # -----------------------------------------------------------
     # FŐ FÜGGVÉNY: prop value generálás
@@ -51,6 +53,7 @@ class PropEngine:
 
         home_xg = self._expected_goals(model_stats["home"])
         away_xg = self._expected_goals(model_stats["away"])
+        goal_markets = self._goal_markets(home_xg, away_xg)
 
         # **********************
         # TOTALS → O/U 2.5, 3.5
@@ -58,7 +61,7 @@ class PropEngine:
         totals = markets["totals"]
 
         # Over 2.5 probability
-        prob_over25 = max(0.05, min(0.95, (home_xg + away_xg) / 3.0))
+        prob_over25 = max(0.05, min(0.95, goal_markets["totals"][2.5]["over"]))
         val_over25 = self._value(prob_over25, totals["over25"])
 
         results.append({
@@ -85,7 +88,7 @@ class PropEngine:
         # BTTS
         # **********************
         btts = markets["btts"]
-        prob_btts = self._btts_probability(home_xg, away_xg)
+        prob_btts = max(0.05, min(0.95, goal_markets["btts"]["yes"]))
         val_btts_yes = self._value(prob_btts, btts["yes"])
 
         results.append({
@@ -101,15 +104,15 @@ class PropEngine:
         # **********************
         handicap = markets["handicap"]
 
-        # Example: +1.5 handicp
-        prob_plus15 = min(0.95, home_xg + 1.5 > away_xg)
+        # Home +1.5 (fél-vonal → nincs push)
+        prob_plus15 = min(0.95, goal_markets["asian_handicap"][1.5]["win"])
         val_plus15 = self._value(prob_plus15, handicap["+1.5"])
 
         results.append({
             "market": "Home +1.5",
             "type": "handicap",
             "odds": handicap["+1.5"],
-            "prob": float(prob_plus15),
+            "prob": round(prob_plus15, 3),
             "value": round(val_plus15, 3)
         })
 
@@ -2,6 +2,9 @@
 
 import numpy as np
 from backend.utils.logger import get_logger
+from backend.core import engine_kernels as kernels
+from backend.core.match_frame import as_frame, frame_outputs
+from backend.system.tracing import traced
 
 class PsychologicalBiasEngine:
     """
@@ -20,6 +23,16 @@ class PsychologicalBiasEngine:
         "probability" = korrigált value probability, ahol a tömeg hibája számít.
     """
 
+    # engine DAG (EngineScheduler)
+    DAG_OUTPUT = "psych_bias"
+    DAG_INPUTS = ("match_frame",)
+
+    # normalize / confidence / risk együtthatók (backend.core.engine_kernels)
+    QUALITY_KEY = "bias_data_quality"
+    QUALITY_DEFAULT = 0.8
+    CONF_WEIGHTS = {"quality": 0.55, "stability": 0.45}
+    RISK_WEIGHTS = {"prob": 0.5, "conf": 0.5}
+
     def __init__(self, config):
         self.config = config
         self.logger = get_logger()
@@ -38,35 +51,40 @@ class PsychologicalBiasEngine:
     # ----------------------------------------------------------------------
     # MAIN PREDICTOR
     # ----------------------------------------------------------------------
+    @traced()
     def predict(self, match_data):
-        outputs = {}
+        frame = as_frame(match_data)
+        out = self.predict_frame(frame)
 
-        for match_id, data in match_data.items():
-            try:
-                prob = self._bias_core(data)
-            except Exception as e:
-                self.logger.error(f"[PsyBias] ERROR → fallback: {e}")
-                prob = self.fallback_prob
+        return frame_outputs(
+            frame, out["probability"], out["confidence"], out["risk"],
+            meta={"psychological_bias": True},
+            source="PsychologicalBias"
+        )
 
-            prob = float(max(0.01, min(0.99, prob)))
+    # ----------------------------------------------------------------------
+    # BATCH: teljes slate oszlopos bemenetből
+    # ----------------------------------------------------------------------
+    def predict_frame(self, frame):
+        try:
+            prob = self._bias_core(frame)
+        except Exception as e:
+            self.logger.error(f"[PsyBias] ERROR → fallback: {e}")
+            prob = np.full(len(frame), self.fallback_prob)
 
-            conf = self._confidence(prob, data)
-            risk = self._risk(prob, conf)
+        prob = kernels.normalize(np.where(np.isfinite(prob), prob, self.fallback_prob))
 
-            outputs[match_id] = {
-                "probability": round(prob, 4),
-                "confidence": round(conf, 3),
-                "risk": round(risk, 3),
-                "meta": {"psychological_bias": True},
-                "source": "PsychologicalBias"
-            }
+        conf = kernels.confidence(
+            prob, frame.col(self.QUALITY_KEY, self.QUALITY_DEFAULT), self.CONF_WEIGHTS, self.min_conf
+        )
+        risk = kernels.risk(prob, conf, self.RISK_WEIGHTS)
 
-        return outputs
+        return {"probability": prob, "confidence": conf, "risk": risk}
 
     # ----------------------------------------------------------------------
     # CORE LOGIC – BIAS KEZELÉS
     # ----------------------------------------------------------------------
-    def _bias_core(self, data):
+    def _bias_core(self, frame):
         """
         Várt input:
             • fav_popularity          (0–1)
@@ -76,11 +94,11 @@ class PsychologicalBiasEngine:
             • hype_factor            (0–1)
         """
 
-        fav_pop = data.get("fav_popularity", 0.50)
-        long_pop = data.get("longshot_popularity", 0.50)
-        recency = data.get("recency_strength", 0.50)
-        herding = data.get("herding_strength", 0.50)
-        hype = data.get("hype_factor", 0.50)
+        fav_pop = frame.col("fav_popularity", 0.50)
+        long_pop = frame.col("longshot_popularity", 0.50)
+        recency = frame.col("recency_strength", 0.50)
+        herding = frame.col("herding_strength", 0.50)
+        hype = frame.col("hype_factor", 0.50)
 
         # Kedvencre túl sok fogadás → fade signal
         fav_effect = (0.5 - fav_pop) * self.fav_scaling
@@ -107,21 +125,3 @@ class PsychologicalBiasEngine:
 
         prob = 0.5 + prob_shift
         return prob
-
-    # ----------------------------------------------------------------------
-    # CONFIDENCE
-    # ----------------------------------------------------------------------
-    def _confidence(self, prob, data):
-        data_q = data.get("bias_data_quality", 0.8)
-        stability = 1 - abs(prob - 0.5)
-
-        conf = data_q * 0.55 + stability * 0.45
-        return float(max(self.min_conf, min(1.0, conf)))
-
-    # ----------------------------------------------------------------------
-    # RISK
-    # ----------------------------------------------------------------------
-    def _risk(self, prob, conf):
-        return float(min(1.0, max(0.0,
-            (1 - conf) * 0.5 + (1 - prob) * 0.5
-        )))
@@ -2,6 +2,9 @@
 
 import numpy as np
 from backend.utils.logger import get_logger
+from backend.core import engine_kernels as kernels
+from backend.core.match_frame import as_frame, frame_outputs
+from backend.system.tracing import traced
 
 class PublicMoneyEngine:
     """
@@ -15,6 +18,16 @@ class PublicMoneyEngine:
         • Market distortion jelzések
     """
 
+    # engine DAG (EngineScheduler)
+    DAG_OUTPUT = "public_money"
+    DAG_INPUTS = ("match_frame",)
+
+    # normalize / confidence / risk együtthatók (backend.core.engine_kernels)
+    QUALITY_KEY = "public_data_quality"
+    QUALITY_DEFAULT = 0.75
+    CONF_WEIGHTS = {"quality": 0.6, "stability": 0.4}
+    RISK_WEIGHTS = {"prob": 0.5, "conf": 0.5}
+
     def __init__(self, config):
         self.config = config
         self.logger = get_logger()
@@ -29,44 +42,48 @@ class PublicMoneyEngine:
         self.min_conf = config.get("public", {}).get("min_confidence", 0.60)
 
     # ----------------------------------------------------------------------
-    # PUBLIC PREDICTION
+    # PUBLIC PREDICTION (dict adapter)
     # ----------------------------------------------------------------------
+    @traced()
     def predict(self, match_data):
-        outputs = {}
-
-        for match_id, data in match_data.items():
-
-            try:
-                prob = self._public_core(data)
-            except Exception as e:
-                self.logger.error(f"[PublicMoney] Hiba → fallback: {e}")
-                prob = self.fallback_prob
+        frame = as_frame(match_data)
+        out = self.predict_frame(frame)
+
+        return frame_outputs(
+            frame, out["probability"], out["confidence"], out["risk"],
+            meta={
+                "public_scaling": self.public_scaling,
+                "sharp_scaling": self.sharp_scaling,
+                "odds_move_scaling": self.odds_move_scaling
+            },
+            source="PublicMoney"
+        )
 
-            # normalize
-            prob = self._normalize(prob)
+    # ----------------------------------------------------------------------
+    # BATCH: teljes slate oszlopos bemenetből
+    # ----------------------------------------------------------------------
+    def predict_frame(self, frame):
+        try:
+            prob = self._public_core(frame)
+        except Exception as e:
+            self.logger.error(f"[PublicMoney] Hiba → fallback: {e}")
+            prob = np.full(len(frame), self.fallback_prob)
 
-            # confidence + risk
-            conf = self._confidence(prob, data)
-            risk = self._risk(prob, conf)
+        # normalize
+        prob = kernels.normalize(np.where(np.isfinite(prob), prob, self.fallback_prob))
 
-            outputs[match_id] = {
-                "probability": round(prob, 4),
-                "confidence": round(conf, 3),
-                "risk": round(risk, 3),
-                "meta": {
-                    "public_scaling": self.public_scaling,
-                    "sharp_scaling": self.sharp_scaling,
-                    "odds_move_scaling": self.odds_move_scaling
-                },
-                "source": "PublicMoney"
-            }
+        # confidence + risk
+        conf = kernels.confidence(
+            prob, frame.col(self.QUALITY_KEY, self.QUALITY_DEFAULT), self.CONF_WEIGHTS, self.min_conf
+        )
+        risk = kernels.risk(prob, conf, self.RISK_WEIGHTS)
 
-        return outputs
+        return {"probability": prob, "confidence": conf, "risk": risk}
 
     # ----------------------------------------------------------------------
     # CORE LOGIC – PUBLIC vs SHARP MONEY
     # ----------------------------------------------------------------------
-    def _public_core(self, data):
+    def _public_core(self, frame):
         """
         Várt input:
             • public_pct (public money %)
@@ -76,13 +93,13 @@ class PublicMoneyEngine:
             • bookmaker_shift (true book % change)
         """
 
-        public_pct = data.get("public_pct", 0.50)       # 0–1
-        sharp_pct = data.get("sharp_pct", 0.50)         # 0–1
+        public_pct = frame.col("public_pct", 0.50)      # 0–1
+        sharp_pct = frame.col("sharp_pct", 0.50)        # 0–1
 
-        odds_open = data.get("odds_open", 2.00)
-        odds_now  = data.get("odds_now", 2.00)
+        odds_open = frame.col("odds_open", 2.00)
+        odds_now  = frame.col("odds_now", 2.00)
 
-        bookmaker_shift = data.get("bookmaker_shift", 0.0)  # 0–1
+        bookmaker_shift = frame.col("bookmaker_shift", 0.0)  # 0–1
 
         # PUBLIC BIAS (ha public túl nagy → ellenfogadás value)
         public_bias = (public_pct - 0.50) * -self.public_scaling
@@ -101,26 +118,4 @@ class PublicMoneyEngine:
         prob_shift = public_bias + sharp_bias + odds_move_effect + book_effect
 
         prob = 0.5 + prob_shift
-        return float(prob)
-
-    # ----------------------------------------------------------------------
-    # NORMALIZATION
-    # ----------------------------------------------------------------------
-    def _normalize(self, p):
-        return float(max(0.01, min(0.99, p)))
-
-    # ----------------------------------------------------------------------
-    # CONFIDENCE
-    # ----------------------------------------------------------------------
-    def _confidence(self, prob, data):
-        public_data_q = data.get("public_data_quality", 0.75)
-        stability = 1 - abs(prob - 0.5)
-
-        conf = (public_data_q * 0.6 + stability * 0.4)
-        return float(max(self.min_conf, min(1.0, conf)))
-
-    # ----------------------------------------------------------------------
-    # RISK
-    # ----------------------------------------------------------------------
-    def _risk(self, prob, conf):
-        return float(min(1.0, max(0.0, (1 - prob) * 0.5 + (1 - conf) * 0.5)))
+        return prob
@@ -2,6 +2,9 @@
 
 import numpy as np
 from backend.utils.logger import get_logger
+from backend.core import engine_kernels as kernels
+from backend.core.match_frame import as_frame, frame_outputs
+from backend.system.tracing import traced
 
 class QuantumSynthEngine:
     """
@@ -16,6 +19,16 @@ class QuantumSynthEngine:
         • ensemble friendly (FusionEngine kompatibilis)
     """
 
+    # engine DAG (EngineScheduler)
+    DAG_OUTPUT = "quantum_synth"
+    DAG_INPUTS = ("match_frame",)
+
+    # normalize / confidence / risk együtthatók (backend.core.engine_kernels)
+    QUALITY_KEY = "data_quality"
+    QUALITY_DEFAULT = 0.8
+    CONF_WEIGHTS = {"quality": 0.4, "prob": 0.6}
+    RISK_WEIGHTS = {"prob": 0.5, "conf": 0.5}
+
     def __init__(self, config):
         self.config = config
         self.logger = get_logger()
@@ -35,6 +48,7 @@ class QuantumSynthEngine:
     # ----------------------------------------------------------------------
     # PUBLIC – Fő futtatás
     # ----------------------------------------------------------------------
+    @traced()
     def predict(self, match_data):
         """
         Bemenet: match_data → összevont adatcsomag pipeline-ból
@@ -50,55 +64,54 @@ class QuantumSynthEngine:
             }
         """
 
-        outputs = {}
-
-        for match_id, data in match_data.items():
-
-            try:
-                prob = self._quantum_core(match_id, data)
-            except Exception as e:
-                self.logger.error(f"[Quantum] Hiba, fallback: {e}")
-                prob = self.fallback_prob
+        frame = as_frame(match_data)
+        out = self.predict_frame(frame)
 
-            # normalizálás
-            prob = self._normalize(prob)
-
-            # confidence + risk számítás
-            confidence = self._confidence(prob, data)
-            risk = self._risk(prob, confidence)
+        return frame_outputs(
+            frame, out["probability"], out["confidence"], out["risk"],
+            meta={
+                "scaling": self.scaling,
+                "noise_reduction": self.noise_reduction
+            },
+            source="QuantumSynth"
+        )
 
-            outputs[match_id] = {
-                "probability": round(prob, 4),
-                "confidence": round(confidence, 3),
-                "risk": round(risk, 3),
-                "meta": {
-                    "scaling": self.scaling,
-                    "noise_reduction": self.noise_reduction
-                },
-                "source": "QuantumSynth"
-            }
+    # ----------------------------------------------------------------------
+    # BATCH – teljes slate oszlopos bemenetből
+    # ----------------------------------------------------------------------
+    def predict_frame(self, frame):
+        try:
+            prob = self._quantum_core(frame)
+        except Exception as e:
+            self.logger.error(f"[Quantum] Hiba, fallback: {e}")
+            prob = np.full(len(frame), self.fallback_prob)
+
+        # normalizálás
+        prob = kernels.normalize(np.where(np.isfinite(prob), prob, self.fallback_prob), self.scaling)
+
+        # confidence + risk számítás
+        confidence = kernels.confidence(
+            prob, frame.col(self.QUALITY_KEY, self.QUALITY_DEFAULT), self.CONF_WEIGHTS, self.min_conf
+        )
+        risk = kernels.risk(prob, confidence, self.RISK_WEIGHTS)
 
-        return outputs
+        return {"probability": prob, "confidence": confidence, "risk": risk}
 
     # ----------------------------------------------------------------------
     # KVANTUM MAG (probability generátor)
     # ----------------------------------------------------------------------
-    def _quantum_core(self, match_id, data):
+    def _quantum_core(self, frame):
         """
         A kvantum mag fő prediktív logikája.
         Ez egy speciális kvantum-szintetizált súlyozott becslés.
         """
 
-        # Ha a data üres → fallback
-        if not data:
-            return self.fallback_prob
-
         # Fő bemeneti komponensek
-        form = data.get("form_factor", 0.5)
-        xg = data.get("xg_ratio", 0.5)
-        elo = data.get("elo_winprob", 0.5)
-        momentum = data.get("momentum_pre", 0.5)
-        h2h = data.get("h2h_strength", 0.5)
+        form = frame.col("form_factor", 0.5)
+        xg = frame.col("xg_ratio", 0.5)
+        elo = frame.col("elo_winprob", 0.5)
+        momentum = frame.col("momentum_pre", 0.5)
+        h2h = frame.col("h2h_strength", 0.5)
 
         # kvantum-szintézis súlyok
         weights = {
@@ -119,39 +132,7 @@ class QuantumSynthEngine:
         )
 
         # kvantum fluktuáció simuláció
-        noise = np.random.uniform(-0.05, 0.05) * (1 - self.noise_reduction)
+        noise = np.random.uniform(-0.05, 0.05, size=len(frame)) * (1 - self.noise_reduction)
 
-        return base + noise
-
-    # ----------------------------------------------------------------------
-    # NORMALIZÁLÁS
-    # ----------------------------------------------------------------------
-    def _normalize(self, prob):
-        """
-        Skálázás és korrekció, hogy stabil 0.01–0.99 között maradjon.
-        """
-        prob *= self.scaling
-        prob = max(0.01, min(0.99, prob))
-        return float(prob)
-
-    # ----------------------------------------------------------------------
-    # CONFIDENCE
-    # ----------------------------------------------------------------------
-    def _confidence(self, prob, data):
-        """
-        Confidence a kvantum mag stabilitása + input minősége alapján.
-        """
-        quality = data.get("data_quality", 0.8)
-        conf = prob * 0.6 + quality * 0.4
-
-        return float(max(self.min_conf, min(1.0, conf)))
-
-    # ----------------------------------------------------------------------
-    # RISK
-    # ----------------------------------------------------------------------
-    def _risk(self, prob, confidence):
-        """
-        Minél alacsonyabb a confidence, annál nagyobb a risk.
-        """
-        risk = (1 - prob) * 0.5 + (1 - confidence) * 0.5
-        return float(max(0.0, min(1.0, risk)))
+        # Ha a data üres → fallback
+        return np.where(frame.empty, self.fallback_prob, base + noise)
@@ -1,7 +1,10 @@
 # backend/engine/score_pred_engine.py
 
+import math
 import numpy as np
 from backend.utils.logger import get_logger
+from backend.core.score_matrix import match_markets
+from backend.system.tracing import traced
 
 class ScorePredEngine:
     """
@@ -16,6 +19,10 @@ class ScorePredEngine:
         • FusionEngine + ValueEngine támogatás
     """
 
+    # engine DAG (EngineScheduler)
+    DAG_OUTPUT = "scorepredict"
+    DAG_INPUTS = ("match_data",)
+
     def __init__(self, config):
         self.config = config
         self.logger = get_logger()
@@ -33,14 +40,17 @@ class ScorePredEngine:
     # ----------------------------------------------------------------------
     # PUBLIC: fő score predikció
     # ----------------------------------------------------------------------
+    @traced()
     def predict(self, match_data):
         outputs = {}
 
         for match_id, data in match_data.items():
             try:
-                prob = self._score_core(data)
+                markets = self._score_core(data)
+                prob = markets["1x2"]["home"]
             except Exception as e:
                 self.logger.error(f"[ScorePred] Hiba → fallback: {e}")
+                markets = None
                 prob = self.fallback_prob
 
             prob = float(max(0.01, min(0.99, prob)))
@@ -54,7 +64,8 @@ class ScorePredEngine:
                 "risk": round(risk, 3),
                 "meta": {
                     "max_goals": self.max_goals,
-                    "variance_boost": self.variance_boost
+                    "variance_boost": self.variance_boost,
+                    "markets": markets
                 },
                 "source": "ScorePred"
             }
@@ -67,6 +78,8 @@ class ScorePredEngine:
     def _score_core(self, data):
         """
         Score predikció Poisson + xG alapján.
+        Vissza: score_matrix.match_markets formátum (1x2, totals, AH, BTTS,
+        correct score).
 
         Input:
             xg_home, xg_away
@@ -89,32 +102,14 @@ class ScorePredEngine:
         lam_h = max(0.1, min(5.0, lam_h))
         lam_a = max(0.1, min(5.0, lam_a))
 
-        home_win_prob = 0
-        total_prob = 0
-
-        # 0–5 gólig score mátrix
-        for hg in range(self.max_goals + 1):
-            p_h = self._poisson(hg, lam_h)
-
-            for ag in range(self.max_goals + 1):
-                p_a = self._poisson(ag, lam_a)
-
-                p = p_h * p_a
-                total_prob += p
-
-                if hg > ag:
-                    home_win_prob += p
-
-        if total_prob == 0:
-            return self.fallback_prob
-
-        return home_win_prob / total_prob
+        # teljes piac-készlet egyetlen (cache-elt) score mátrixból
+        return match_markets(lam_h, lam_a, self.max_goals)
 
     # ----------------------------------------------------------
     # POISSON
     # ----------------------------------------------------------
     def _poisson(self, k, lam):
-        return (lam**k) * np.exp(-lam) / np.math.factorial(k)
+        return (lam**k) * np.exp(-lam) / math.factorial(k)
 
     # ----------------------------------------------------------
     # CONFIDENCE
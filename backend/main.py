@@ -4,6 +4,7 @@ import json
 import sys
 from pathlib import Path
 from backend.utils.logger import get_logger
+from backend.system.tracing import Tracer
 
 # Pipeline modul (HA tényleg master_pipeline helyett ensemble_pipeline van)
 try:
@@ -44,6 +45,9 @@ def main():
         logger.warning("[MAIN] Üres config -> alapértelmezett beállításokkal indul.")
         config = {}
 
+    # TRACING (config["tracing"]) – a @traced() engine-ek ezt olvassák
+    Tracer.shared(config)
+
     # PIPELINE INITIALIZATION
     try:
         pipeline = MasterPipeline(config)
@@ -4,8 +4,10 @@ from backend.core.fusion_engine import FusionEngine
 from backend.core.bayesian_updater import BayesianUpdater
 from backend.core.bias_engine import BiasEngine
 from backend.core.value_analyzer import ValueAnalyzer
-from backend.engine.deep_value_engine import DeepValueEngine
 from backend.core.feature_builder import FeatureBuilder
+from backend.core.engine_registry import get_engine
+from backend.system.tracing import traced, Tracer
+from backend.utils.logger import get_logger
 
 class EnsemblePipeline:
     """
@@ -18,15 +20,34 @@ class EnsemblePipeline:
         6) deep value engine (deep learning)
     """
 
+    # DeepValueEngine nélkül (nincs torch / betöltési hiba) semleges érték,
+    # mint a DeepValueEngine saját fallbackje
+    DEEP_FALLBACK = {
+        "value_score": 0.5,
+        "confidence": 0.5,
+        "risk": 0.5,
+        "source": "DeepValueEngine (fallback)"
+    }
+
     def __init__(self, config):
         self.config = config
+        self.logger = get_logger()
         self.fusion = FusionEngine(config)
         self.bayes = BayesianUpdater(config)
         self.bias = BiasEngine(config)
         self.value = ValueAnalyzer(config)
-        self.deep = DeepValueEngine(config)
+        self._deep = None
         self.builder = FeatureBuilder(config)
+        self.tracer = Tracer.shared(config)
+
+    @property
+    def deep(self):
+        # a DeepValueEngine (torch) csak az első deep value hívásnál töltődik be
+        if self._deep is None:
+            self._deep = get_engine("DeepValueEngine", self.config)
+        return self._deep
 
+    @traced(category="stage")
     def run(self, model_outputs, raw_odds):
         """
         model_outputs = {
@@ -37,30 +58,41 @@ class EnsemblePipeline:
         raw_odds = odds data
         """
 
+        tr = self.tracer
+
         # 1) Fusion layer (Layer 2)
-        fused = self.fusion.combine(model_outputs)
+        with tr.span("ensemble.fusion"):
+            fused = self.fusion.combine(model_outputs)
 
         # 2) Bayesian refinement (Layer 3)
-        posterior = self.bayes.update(fused)
+        with tr.span("ensemble.bayes"):
+            posterior = self.bayes.update(fused)
 
         # 3) Bias correction (Layer 4)
-        corrected = self.bias.apply(posterior)
+        with tr.span("ensemble.bias"):
+            corrected = self.bias.apply(posterior)
 
         # 4) Value analyzer (Layer 5)
-        for m_id in corrected:
-            corrected[m_id]["odds"] = raw_odds.get(m_id, {})
-        value_data = self.value.evaluate(corrected)
+        with tr.span("ensemble.value"):
+            for m_id in corrected:
+                corrected[m_id]["odds"] = raw_odds.get(m_id, {})
+            value_data = self.value.evaluate(corrected)
 
         # 5) Deep value engine (Layer 6)
         final = {}
         fv_map = {}
 
-        # feature input
-        for match_id, data in value_data.items():
-            fv = self.builder.build_feature_vector(model_outputs)
-            fv_map[match_id] = {"features": fv}
+        # feature input – meccsenként az engine-ek adott meccsre vonatkozó outputja
+        for match_id in value_data:
+            per_match = {
+                eng: outs.get(match_id, {}) if isinstance(outs, dict) else {}
+                for eng, outs in model_outputs.items()
+            }
+            fv_map[match_id] = {"features": self.builder.build_feature_vector(per_match)}
 
-        deep_pred = self.deep.predict(fv_map)
+        # egyetlen inferencia hívás a teljes slate-re
+        with tr.span("ensemble.deep_value", matches=len(fv_map)):
+            deep_pred = self._deep_predict(fv_map)
 
         # merge
         for match_id in value_data:
@@ -71,3 +103,15 @@ class EnsemblePipeline:
             }
 
         return final
+
+    def _deep_predict(self, fv_map):
+        deep = self.deep
+        if deep is None:
+            self.logger.warning("[Ensemble] DeepValueEngine nem elérhető → semleges deep value")
+            return {match_id: dict(self.DEEP_FALLBACK) for match_id in fv_map}
+
+        try:
+            return deep.predict(fv_map)
+        except Exception as e:
+            self.logger.error(f"[Ensemble] DeepValueEngine hiba → semleges deep value: {e}")
+            return {match_id: dict(self.DEEP_FALLBACK) for match_id in fv_map}
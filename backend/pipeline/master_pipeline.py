@@ -1,12 +1,21 @@
 # backend/pipeline/master_pipeline.py
 
+import os
+import time
+import zlib
+from contextlib import contextmanager
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from backend.utils.logger import get_logger
+from backend.system.tracing import Tracer
+
 from backend.scraper.odds_aggregator import OddsAggregator
 from backend.scraper.market_odds_aggregator import MarketOddsAggregator
 from backend.scraper.tippmixpro_scraper import TippmixProScraper
 
 from backend.pipeline.model_runner import ModelRunner
 
-from backend.engine.quantum_synth_engine import QuantumSynthEngine
 from backend.engine.fusion_engine import FusionEngine
 from backend.engine.bayesian_updater import BayesianUpdater
 from backend.engine.bias_engine import BiasEngine
@@ -18,7 +27,7 @@ from backend.engine.prop_tip_selector import PropTipSelector
 from backend.pipeline.odds_filter import OddsFilter
 from backend.engine.kombi_optimizer import KombiOptimizer
 
-from backend.engine.closing_line_predictor import ClosingLinePredictor
+from backend.engine.closing_line_predictor_engine import ClosingLinePredictor
 from backend.engine.sharp_money_tracker import SharpMoneyTracker
 
 from backend.engine.rl_stake_engine import RLStakeEngine
@@ -30,21 +39,28 @@ from backend.analysis.historical_roi_analyzer import HistoricalROIAnalyzer
 import datetime
 
 
-class MasterPipeline:
+# =============================================================
+# MODELL STAGE (CPU) – folyamaton belül vagy process pool workerben
+# =============================================================
+class ModelStage:
+    """
+    Egy meccs modell + ensemble + prop rétegei.
+    Process pool módban workerenként egyszer épül fel a configból
+    (_init_model_worker), így a modellek nem utaznak pickle-ben.
+    """
 
     def __init__(self, config):
         self.config = config
+        self.logger = get_logger()
+        self.tracer = Tracer.shared(config)
 
-        # Scrapers
-        self.odds = OddsAggregator()
-        self.markets = MarketOddsAggregator()
-        self.tippmix = TippmixProScraper()
+        # meccsenkénti seed → az eredmény nem függ attól, melyik worker futtatja
+        self.seed = config.get("pipeline", {}).get("seed", None)
 
         # Models
         self.runner = ModelRunner(config)
 
         # Ensemble
-        self.qse = QuantumSynthEngine(config)
         self.fusion = FusionEngine(config)
         self.bayes = BayesianUpdater(config)
         self.bias = BiasEngine(config)
@@ -54,6 +70,135 @@ class MasterPipeline:
         self.prop_engine = PropEngine(config)
         self.prop_selector = PropTipSelector(config)
 
+    def run(self, match, market_odds):
+        """Vissza: {"tip": value output, "prop_tips": [...]} vagy None hiba esetén."""
+        try:
+            if self.seed is not None:
+                np.random.seed(_match_seed(self.seed, match["id"]))
+
+            # Model outputok
+            with self.tracer.span("models.run_all"):
+                model_outputs = self.runner.run_all(match)
+
+            # Ensemble rétegek
+            with self.tracer.span("models.ensemble"):
+                f = self.fusion.combine(model_outputs)
+                b = self.bayes.update(f)
+                bc = self.bias.apply(b)
+                val = self.value.evaluate(bc)
+
+            # Prop piacok
+            with self.tracer.span("models.props"):
+                prop_raw = self.prop_engine.compute_prop_values(market_odds, match["stats"])
+                prop_tips = self.prop_selector.select(prop_raw)
+
+            return {"tip": val[match["id"]], "prop_tips": prop_tips}
+
+        except Exception as e:
+            self.logger.error(f"[MasterPipeline] Modell hiba ({match.get('id')}): {e}")
+            return None
+
+
+def _match_seed(seed, match_id):
+    return (zlib.crc32(str(match_id).encode("utf-8")) ^ int(seed)) & 0xFFFFFFFF
+
+
+_WORKER_STAGE = None
+
+
+def _init_model_worker(config):
+    global _WORKER_STAGE
+    _WORKER_STAGE = ModelStage(config)
+
+
+def _run_model_worker(job):
+    match, market_odds = job
+    return _WORKER_STAGE.run(match, market_odds)
+
+
+# =============================================================
+# SZŰRŐ KASZKÁD STATISZTIKA
+# =============================================================
+class _FilterStats:
+    """
+    Stage-enkénti be/ki meccsszám, eldobott darab és futásidő.
+    Becsült megtakarítás: a modell stage meccsenkénti átlagideje ×
+    a modellek előtt eldobott meccsek száma (+ a piac letöltés
+    átlagideje × az availability / odds sáv által eldobottak).
+    """
+
+    PRE_MODEL = ("availability", "odds_band", "markets")
+
+    def __init__(self, total, tracer):
+        self.total = total
+        self.tracer = tracer
+        self.remaining = total
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name):
+        row = {"stage": name, "in": self.remaining, "out": self.remaining, "dropped": 0, "seconds": 0.0}
+        start = time.perf_counter()
+
+        with self.tracer.span(f"pipeline.{name}", matches=row["in"]):
+            yield row   # a hívó beállítja: row["out"] = túlélők száma
+
+        row["seconds"] = round(time.perf_counter() - start, 4)
+        row["dropped"] = row["in"] - row["out"]
+        self.remaining = row["out"]
+        self.stages.append(row)
+
+    def _per_match(self, name):
+        row = next((r for r in self.stages if r["stage"] == name), None)
+        if not row or not row["in"]:
+            return 0.0
+        return row["seconds"] / row["in"]
+
+    def report(self):
+        dropped = {r["stage"]: r["dropped"] for r in self.stages}
+        pre_model = sum(dropped.get(n, 0) for n in self.PRE_MODEL)
+        pre_markets = dropped.get("availability", 0) + dropped.get("odds_band", 0)
+
+        model_s = self._per_match("models")
+        saved = model_s * pre_model + self._per_match("markets") * pre_markets
+
+        return {
+            "matches": self.total,
+            "survivors": self.remaining,
+            "stages": self.stages,
+            "model_seconds_per_match": round(model_s, 4),
+            "estimated_saved_s": round(saved, 4),
+        }
+
+
+class MasterPipeline:
+
+    def __init__(self, config):
+        self.config = config
+        self.logger = get_logger()
+        self.tracer = Tracer.shared(config)
+
+        # Párhuzamos mód:
+        #   • I/O (markets, TippmixPro, odds history) → korlátos thread pool
+        #   • modellek + ensemble → process pool (workerenként saját ModelStage)
+        # A kimenet sorrendje mindkét módban a bemeneti meccssorrend.
+        p = config.get("pipeline", {})
+        self.parallel = p.get("parallel", False)
+        self.io_workers = p.get("io_workers", 16)
+        self.model_workers = p.get("model_workers", os.cpu_count() or 1)
+
+        # piac nélküli meccs nem megy a modellekre
+        self.require_markets = p.get("require_markets", True)
+        self.filter_stats = None
+
+        # Scrapers
+        self.odds = OddsAggregator(config)
+        self.markets = MarketOddsAggregator(config)
+        self.tippmix = TippmixProScraper(config)
+
+        # Models + Ensemble + Props (CPU stage)
+        self.models = ModelStage(config)
+
         # Filters
         self.odds_filter = OddsFilter(config)
         self.kombi_optimizer = KombiOptimizer(config)
@@ -71,75 +216,205 @@ class MasterPipeline:
     # ---------------------------------------------------------
     # FŐ NAPI WORKFLOW
     # ---------------------------------------------------------
-    def run_daily(self):
+    def run_daily(self, matches=None):
 
         today = datetime.date.today().isoformat()
-
-        # 1) Odds letöltése
-        matches = self.odds.get_all_matches()
-
-        daily_tips = []
         bankroll_start = float(self.config.get("bankroll", 1000))
 
-        for match in matches:
+        with self.tracer.span("pipeline.run_daily"):
+            daily_tips, kombi = self.evaluate(matches)
 
-            # 2) Model outputok
-            model_outputs = self.runner.run_all(match)
+            # 11) Jelentés mentése
+            with self.tracer.span("pipeline.report"):
+                bankroll_end = bankroll_start  # (itt később eredményfrissítés)
+                self.report.save(today, daily_tips, kombi, bankroll_start, bankroll_end)
 
-            # 3) Ensemble rétegek
-            q = self.qse.combine(model_outputs)
-            f = self.fusion.combine(model_outputs)
-            b = self.bayes.update(f)
-            bc = self.bias.apply(b)
-            val = self.value.evaluate(bc)
+                # 12) ROI update
+                self.roi.record_day(today, bankroll_start, bankroll_end, daily_tips)
 
-            # 4) Prop piacok
-            market_odds = self.markets.get_markets(match["home"], match["away"])
-            prop_raw = self.prop_engine.compute_prop_values(market_odds, match["stats"])
-            prop_tips = self.prop_selector.select(prop_raw)
+        return {
+            "date": today,
+            "tips": daily_tips,
+            "kombi": kombi,
+            "filter_stats": self.filter_stats
+        }
 
-            # 5) TippmixPro availability
-            if not self.tippmix.is_available(match):
-                continue
+    # ---------------------------------------------------------
+    # SLATE KIÉRTÉKELÉS (mentés nélkül – benchmark is ezt hívja)
+    # ---------------------------------------------------------
+    def evaluate(self, matches=None):
+        """
+        Cheap-first szűrő kaszkád – a drága modell réteg csak a túlélőkön fut:
+            A) TippmixPro availability (1 oldal / meccs)
+            B) odds sáv (OddsFilter.precheck – nincs I/O)
+            C) piac jelenlét (market odds letöltés)
+            D) CPU: modellek + ensemble + prop
+            E) odds filter (1.60 alatti szűrés)
+            F) I/O: odds history, sharp + closing line (slate) + stake + magyarázat
+        Vissza: (daily_tips, kombi); a szűrő statisztika: self.filter_stats
+        """
 
-            # 6) Odds filter (1.60 alatti szűrés)
-            if not self.odds_filter.allow_tip(val[match["id"]]):
-                continue
+        # 1) Odds letöltése
+        if matches is None:
+            matches = self.odds.get_all_matches()
+        matches = list(matches)
 
-            tip = val[match["id"]]
+        bankroll_start = float(self.config.get("bankroll", 1000))
+        stats = _FilterStats(len(matches), self.tracer)
+
+        # A) TippmixPro availability (+ a TippmixPro oddsok ugyanabból a letöltésből)
+        with stats.stage("availability") as st:
+            fetched = self._map_io(self._fetch_availability, matches)
+            stage = [(m, f) for m, f in zip(matches, fetched) if f["available"]]
+            st["out"] = len(stage)
+
+        # B) odds sáv – hiányzó / ≤ 1.0 / sávon kívüli odds
+        with stats.stage("odds_band") as st:
+            stage = [
+                (m, f) for m, f in stage
+                if self.odds_filter.precheck(f["odds"] or m.get("odds"))
+            ]
+            st["out"] = len(stage)
+
+        # C) piac jelenlét
+        with stats.stage("markets") as st:
+            markets = self._map_io(lambda s: self._fetch_markets(s[0]), stage)
+            jobs = [
+                (m, mk) for (m, f), mk in zip(stage, markets)
+                if mk or not self.require_markets
+            ]
+            st["out"] = len(jobs)
+
+        # D) modellek + ensemble + prop piacok – csak a túlélőkön
+        with stats.stage("models") as st:
+            staged = self._run_models(jobs)
+            stage = [(m, res) for (m, _), res in zip(jobs, staged) if res is not None]
+            st["out"] = len(stage)
+
+        # E) odds filter (1.60 alatti szűrés)
+        with stats.stage("odds_filter") as st:
+            survivors = [(m, res["tip"]) for m, res in stage if self.odds_filter.allow_tip(res["tip"])]
+            st["out"] = len(survivors)
+
+        self.filter_stats = stats.report()
+        self.logger.info(
+            f"[MasterPipeline] Szűrő kaszkád: {len(matches)} → {len(survivors)} meccs, "
+            f"becsült megtakarítás {self.filter_stats['estimated_saved_s']:.2f}s"
+        )
+
+        # F) odds history a túlélőkre
+        with self.tracer.span("pipeline.odds_history", matches=len(survivors)):
+            histories = self._map_io(lambda s: self._fetch_history(s[0]), survivors)
+
+        # 7) Sharp money (a closing line a teljes slate-re egyben fut)
+        pending = []
+        with self.tracer.span("pipeline.sharp_money", tips=len(survivors)):
+            for (match, tip), odds_history in zip(survivors, histories):
+                sharp = self.sharp.analyze(odds_history)
+
+                tip["sharp_money"] = sharp["sharp_strength"]
+                tip["volatility"] = sharp.get("volatility", sharp.get("public_noise", 0.0))
+                tip["momentum"] = sharp["momentum"]
+
+                pending.append((tip, self._history_drift(odds_history)))
+
+        # 7/B) Closing line – minden tipp záró oddsa egy vektorizált hívásban
+        with self.tracer.span("pipeline.closing_line", tips=len(pending)):
+            clp_all = self.clp.predict_slate({
+                i: {
+                    "current_odds": tip["odds"],
+                    "drift": drift,
+                    "sharp_money": tip["sharp_money"],
+                    "volatility": tip["volatility"],
+                    "momentum": tip["momentum"],
+                    "probability": tip.get("probability", 0.5),
+                }
+                for i, (tip, drift) in enumerate(pending)
+            })
 
-            # 7) Closing line + sharp integration
-            odds_history = self.odds.get_odds_history(match["id"])
-            clp_res = self.clp.predict_closing_line(tip["odds"], odds_history)
-            sharp = self.sharp.analyze(odds_history)
+        daily_tips = []
+        for i, (tip, _) in enumerate(pending):
+            clp_res = clp_all[i]
 
             tip["expected_closing_line"] = clp_res["expected_closing"]
-            tip["clv"] = self.clp.clv(tip["odds"], clp_res["expected_closing"])
-            tip["sharp_money"] = sharp["sharp_strength"]
-            tip["volatility"] = sharp["volatility"]
-            tip["momentum"] = sharp["momentum"]
+            tip["clv"] = clp_res["clv"]
+            tip["closing_quantiles"] = clp_res["closing_quantiles"]
+            tip["clv_quantiles"] = clp_res["clv_quantiles"]
 
             # 8) Stake számítás
-            stake_data = self.rl_stake.compute_stake(bankroll_start, tip, self.roi.streaks())
-            tip["stake"] = stake_data["stake_amount"]
+            with self.tracer.span("pipeline.stake"):
+                stake_data = self.rl_stake.compute_stake(bankroll_start, tip, self.roi.streaks())
+                tip["stake"] = stake_data["stake_amount"]
 
             # 9) Coach magyarázat
-            tip["explanation"] = self.explainer.generate_explanation(tip)
+            with self.tracer.span("pipeline.explanation"):
+                tip["explanation"] = self.explainer.generate_explanation(tip)
 
             daily_tips.append(tip)
 
         # 10) Kombi tipp generálása
-        kombi = self.kombi_optimizer.optimize(daily_tips)
+        with self.tracer.span("pipeline.kombi"):
+            kombi = self.kombi_optimizer.optimize(daily_tips)
 
-        # 11) Jelentés mentése
-        bankroll_end = bankroll_start  # (itt később eredményfrissítés)
-        self.report.save(today, daily_tips, kombi, bankroll_start, bankroll_end)
+        return daily_tips, kombi
 
-        # 12) ROI update
-        self.roi.record_day(today, bankroll_start, bankroll_end, daily_tips)
+    # ---------------------------------------------------------
+    # I/O STAGE
+    # ---------------------------------------------------------
+    def _map_io(self, func, items):
+        """func minden elemre; párhuzamos módban korlátos thread poolon, sorrendtartóan."""
+        if not self.parallel or len(items) <= 1:
+            return [func(i) for i in items]
+
+        with ThreadPoolExecutor(max_workers=min(self.io_workers, len(items))) as pool:
+            return list(pool.map(func, items))
+
+    def _fetch_availability(self, match):
+        try:
+            res = self.tippmix.check_match(match["home"], match["away"])
+            return {"available": res["available"], "odds": res.get("odds", {})}
+        except Exception as e:
+            self.logger.error(f"[MasterPipeline] TippmixPro hiba ({match.get('id')}): {e}")
+            return {"available": False, "odds": {}}
+
+    def _fetch_markets(self, match):
+        try:
+            return self.markets.get_markets(match["home"], match["away"])
+        except Exception as e:
+            self.logger.error(f"[MasterPipeline] Market odds hiba ({match.get('id')}): {e}")
+            return {}
+
+    def _fetch_history(self, match):
+        try:
+            return self.odds.get_odds_history(match["id"])
+        except Exception as e:
+            self.logger.error(f"[MasterPipeline] Odds history hiba ({match.get('id')}): {e}")
+            return []
 
-        return {
-            "date": today,
-            "tips": daily_tips,
-            "kombi": kombi
-        }
+    # ---------------------------------------------------------
+    # CPU STAGE
+    # ---------------------------------------------------------
+    def _run_models(self, jobs):
+        """(match, market_odds) párok → ModelStage.run eredmények, bemeneti sorrendben."""
+        if not self.parallel or self.model_workers <= 1 or len(jobs) <= 1:
+            return [self.models.run(m, mk) for m, mk in jobs]
+
+        workers = min(self.model_workers, len(jobs))
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_model_worker,
+                initargs=(self.config,)
+            ) as pool:
+                return list(pool.map(_run_model_worker, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+        except Exception as e:
+            self.logger.error(f"[MasterPipeline] Process pool hiba, soros futás: {e}")
+            return [self.models.run(m, mk) for m, mk in jobs]
+
+    # ---------------------------------------------------------
+    # SEGÉD: odds history → relatív drift (pozitív = rövidülő odds)
+    # ---------------------------------------------------------
+    def _history_drift(self, odds_history):
+        if not odds_history or len(odds_history) < 2 or not odds_history[0]:
+            return 0.0
+        return float((odds_history[0] - odds_history[-1]) / odds_history[0])
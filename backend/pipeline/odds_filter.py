@@ -11,17 +11,48 @@ class OddsFilter:
         - risk < 0.38
         - fair_value_edge > +0.07
         - expected_closing > current_odds
+
+    precheck(): olcsó, modellek előtti szűrés – csak az oddsot nézi
+    (hiányzó / ≤ 1.0 odds, odds_band [min, max] sáv).
     """
 
     def __init__(self, config=None):
         self.config = config or {}
+        cfg = self.config.get("odds_filter", {})
+
+        self.min_odds = cfg.get("min_odds", 1.60)
+        self.min_prob = cfg.get("min_prob", 0.78)
+        self.min_conf = cfg.get("min_conf", 0.70)
+        self.min_deep_value = cfg.get("min_deep_value", 0.55)
+        self.max_risk = cfg.get("max_risk", 0.38)
+        self.min_ev_edge = cfg.get("min_ev_edge", 0.07)   # +7%
+
+        # előszűrés: legalább egy kimenet oddsa ebbe a sávba essen
+        band = cfg.get("odds_band", [1.01, 100.0])
+        self.band_min, self.band_max = float(band[0]), float(band[1])
+
+    # -----------------------------------------------------------
+    # ELŐSZŰRÉS (modellek előtt)
+    # -----------------------------------------------------------
+    def precheck(self, odds):
+        """
+        odds: {"1": 1.85, "X": 3.40, "2": 4.20} vagy egyetlen szám.
+        True, ha van érvényes (> 1.0) odds az odds_band sávon belül.
+        """
+        if not odds:
+            return False
+
+        prices = odds.values() if isinstance(odds, dict) else [odds]
+
+        for p in prices:
+            try:
+                p = float(p)
+            except (TypeError, ValueError):
+                continue
+            if p > 1.0 and self.band_min <= p <= self.band_max:
+                return True
 
-        self.min_odds = 1.60
-        self.min_prob = 0.78
-        self.min_conf = 0.70
-        self.min_deep_value = 0.55
-        self.max_risk = 0.38
-        self.min_ev_edge = 0.07   # +7%
+        return False
 
     # -----------------------------------------------------------
     # FŐ LOGIKA
@@ -23,7 +23,7 @@ class TipGeneratorPro:
         self.config = config
         self.bankroll_engine = BankrollEngine(config)
         self.risk_engine = RiskEngine(config)
-        self.tippmixpro = TippmixProScraper()
+        self.tippmixpro = TippmixProScraper(config)
 
         self.max_single = 4
         self.max_kombi = 3
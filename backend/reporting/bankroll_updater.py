@@ -53,3 +53,19 @@ class BankrollUpdater:
                 res["profit"] = 0
 
         return round(current, 2)
+
+    # -----------------------------------------------------------
+    # ELSZÁMOLT REKORDOK (ResultScraper.load_daily_results)
+    # -----------------------------------------------------------
+    def settle_records(self, bankroll, records):
+        """
+        records: tippenkénti elszámolt rekordok (saját result / profit mezővel).
+        Egy meccsre több tipp is eshet – tippenként számolunk, nem
+        match_id szerint.
+        """
+        current = bankroll
+
+        for record in records:
+            current += record.get("profit") or 0.0
+
+        return round(current, 2)
@@ -0,0 +1,59 @@
+# backend/scraper/html_parser.py
+
+import importlib.util
+from bs4 import BeautifulSoup, SoupStrainer
+
+
+# ---------------------------------------------------------------
+# PARSER BACKEND
+# ---------------------------------------------------------------
+# Sorrend: lxml (C, ~5-10x gyorsabb) → html.parser (tiszta Python).
+# A BeautifulSoup API mindkettőnél azonos, a scrapereknek nem kell tudnia,
+# melyik fut.
+_PARSER = None
+
+
+def parser_name():
+    """A leggyorsabb elérhető BeautifulSoup backend neve."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+    return _PARSER
+
+
+# ---------------------------------------------------------------
+# CÉLZOTT PARSE (SoupStrainer)
+# ---------------------------------------------------------------
+def has_class(*names):
+    """
+    SoupStrainer class-szűrő: bármelyik megadott class token egyezik.
+    (Parse közben a class attribútum még nyers string, pl. "odd-button active".)
+    """
+    names = set(names)
+
+    def match(value):
+        if not value:
+            return False
+        tokens = value.split() if isinstance(value, str) else value
+        return bool(names.intersection(tokens))
+
+    return match
+
+
+def only(tags, *classes):
+    """
+    Csak a megadott tag(ek) + class(ok) részfáját építjük fel.
+        only("div", "match-item")
+        only(["div", "button"], "market", "odd-button")
+    """
+    if classes:
+        return SoupStrainer(tags, class_=has_class(*classes))
+    return SoupStrainer(tags)
+
+
+def parse_html(html, parse_only=None, parser=None):
+    """
+    HTML → BeautifulSoup a leggyorsabb elérhető backenddel.
+    parse_only: SoupStrainer (lásd only()) → csak a releváns részfa épül fel.
+    """
+    return BeautifulSoup(html, parser or parser_name(), parse_only=parse_only)
@@ -0,0 +1,258 @@
+# backend/scraper/http_cache.py
+
+import time
+import threading
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+import requests
+from backend.utils.logger import get_logger
+from backend.scraper.rate_limiter import HostGuardRegistry
+
+
+class HttpCache:
+    """
+    HTTP RESPONSE CACHE (megosztott, folyamat-szintű)
+    -------------------------------------------------
+    Feladata:
+        • azonos oldalak újraletöltésének elkerülése (chat API + napi pipeline)
+        • forrásonkénti (host) TTL
+        • ETag / Last-Modified alapú feltételes újravalidálás (304)
+        • LRU kiürítés memória (byte) korláttal
+        • hit / miss / revalidated számlálók a TTL-ek hangolásához
+
+    Config:
+        "http_cache": {
+            "max_bytes": 33554432,
+            "default_ttl": 30,
+            "ttl": {"www.tippmixpro.hu": 30, ...}
+        }
+    """
+
+    # alapértelmezett TTL-ek (mp) – odds frissesség vs. forgalom
+    DEFAULT_TTLS = {
+        "www.tippmixpro.hu": 30,
+        "www.oddsportal.com": 120,
+        "api.sofascore.com": 60,
+    }
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, config=None):
+        self.logger = get_logger()
+        self.configure(config)
+
+        self._entries = OrderedDict()     # key -> entry dict
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.counters = {
+            "hits": 0,
+            "misses": 0,
+            "revalidated": 0,
+            "stores": 0,
+            "evictions": 0,
+        }
+        self.host_counters = {}           # host -> {"hits": .., "misses": ..}
+
+    # ------------------------------------------------------------------
+    # MEGOSZTOTT PÉLDÁNY
+    # ------------------------------------------------------------------
+    @classmethod
+    def shared(cls, config=None):
+        """
+        Folyamat-szintű cache. Ha a config tartalmaz "http_cache" szekciót,
+        a már létező példány beállításai is frissülnek (a scraperek a saját
+        configjukkal hívják, így a cache akkor is hangolható, ha egy config
+        nélküli komponens hozta létre).
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(config)
+            elif config and "http_cache" in config:
+                cls._shared.configure(config)
+            return cls._shared
+
+    def configure(self, config=None):
+        self.config = config or {}
+        c = self.config.get("http_cache", {})
+
+        self.max_bytes = c.get("max_bytes", 32 * 1024 * 1024)
+        self.default_ttl = c.get("default_ttl", 30)
+        self.ttls = {**self.DEFAULT_TTLS, **c.get("ttl", {})}
+
+    # ------------------------------------------------------------------
+    # TTL
+    # ------------------------------------------------------------------
+    def ttl_for(self, url):
+        return self.ttls.get(urlsplit(url).netloc, self.default_ttl)
+
+    # ------------------------------------------------------------------
+    # LEKÉRÉS / MENTÉS
+    # ------------------------------------------------------------------
+    def lookup(self, key):
+        """
+        Vissza: (entry, fresh) vagy (None, False).
+        Lejárt, de validátorral rendelkező bejegyzést is visszaad
+        (fresh=False) a feltételes újravalidáláshoz.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, False
+
+            self._entries.move_to_end(key)
+            fresh = time.monotonic() < entry["expires"]
+
+            if not fresh and not (entry["etag"] or entry["last_modified"]):
+                self._drop(key)
+                return None, False
+
+            return entry, fresh
+
+    def store(self, key, response, ttl):
+        size = len(response.content or b"") + len(key)
+        if size > self.max_bytes:
+            return
+
+        entry = {
+            "response": response,
+            "expires": time.monotonic() + ttl,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "size": size,
+        }
+
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+            self._entries[key] = entry
+            self._bytes += size
+            self.counters["stores"] += 1
+
+            while self._bytes > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.counters["evictions"] += 1
+
+    def refresh(self, key, ttl):
+        """304 után: a tárolt választ újra frissnek jelöljük."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                entry["expires"] = time.monotonic() + ttl
+
+    def _drop(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry["size"]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    # ------------------------------------------------------------------
+    # SZÁMLÁLÓK
+    # ------------------------------------------------------------------
+    def count(self, url, event):
+        host = urlsplit(url).netloc
+        with self._lock:
+            self.counters[event] += 1
+            per_host = self.host_counters.setdefault(
+                host, {"hits": 0, "misses": 0, "revalidated": 0}
+            )
+            if event in per_host:
+                per_host[event] += 1
+
+    def stats(self):
+        with self._lock:
+            lookups = self.counters["hits"] + self.counters["misses"] + self.counters["revalidated"]
+            served = self.counters["hits"] + self.counters["revalidated"]
+            return {
+                **self.counters,
+                "hit_ratio": round(served / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hosts": {h: dict(c) for h, c in self.host_counters.items()},
+            }
+
+
+class CachedSession(requests.Session):
+    """
+    requests.Session, ami a GET kéréseket a megosztott HttpCache-en
+    keresztül szolgálja ki. Minden scraper ezt használja, így ugyanazt
+    az oldalt percen belül csak egyszer töltjük le.
+
+        self.session = CachedSession(config=self.config)
+        self.session.headers.update({...})
+
+    ttl:    forrás-szintű TTL felülírás (None → HttpCache host táblája)
+    config: app config – a megosztott HttpCache és HostGuardRegistry
+            ebből veszi a "http_cache" / "rate_limit" beállításokat
+
+    A hálózatra kimenő kérések a host rate limiterén és circuit breakerén
+    mennek át (HostGuardRegistry): nyitott circuit → azonnali
+    CircuitOpenError a teljes timeout kivárása helyett.
+    """
+
+    def __init__(self, cache=None, ttl=None, guards=None, config=None):
+        super().__init__()
+        self.cache = cache or HttpCache.shared(config)
+        self.ttl = ttl
+        self.guards = guards or HostGuardRegistry.shared(config)
+
+    def _send(self, method, url, **kwargs):
+        if not self.guards.enabled:
+            return super().request(method, url, **kwargs)
+
+        guard = self.guards.guard(urlsplit(url).netloc)
+        guard.before_request()
+
+        try:
+            r = super().request(method, url, **kwargs)
+        except Exception as e:
+            guard.record(error=e)
+            raise
+
+        guard.record(status=r.status_code)
+        return r
+
+    def request(self, method, url, **kwargs):
+        if method.upper() != "GET" or kwargs.get("stream"):
+            return self._send(method, url, **kwargs)
+
+        full_url = requests.Request("GET", url, params=kwargs.get("params")).prepare().url
+        key = f"GET {full_url}"
+        ttl = self.ttl if self.ttl is not None else self.cache.ttl_for(full_url)
+
+        entry, fresh = self.cache.lookup(key)
+
+        if entry is not None and fresh:
+            self.cache.count(full_url, "hits")
+            return entry["response"]
+
+        # lejárt bejegyzés → feltételes kérés
+        if entry is not None:
+            headers = dict(kwargs.pop("headers", None) or {})
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+            kwargs["headers"] = headers
+
+        r = self._send(method, url, **kwargs)
+
+        if entry is not None and r.status_code == 304:
+            self.cache.refresh(key, ttl)
+            self.cache.count(full_url, "revalidated")
+            return entry["response"]
+
+        self.cache.count(full_url, "misses")
+
+        if r.status_code == 200 and ttl > 0:
+            self.cache.store(key, r, ttl)
+
+        return r
@@ -1,7 +1,7 @@
 # backend/scraper/market_odds_aggregator.py
 
-import requests
 from bs4 import BeautifulSoup
+from backend.scraper.http_cache import CachedSession
 import random
 
 class MarketOddsAggregator:
@@ -17,8 +17,9 @@ class MarketOddsAggregator:
         - Player Props (basic: shots, goals)
     """
 
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, config=None):
+        self.config = config or {}
+        self.session = CachedSession(config=self.config)
         self.session.headers.update({"User-Agent": "Mozilla/5.0"})
 
     # ----------------------------------------------------
@@ -1,9 +1,14 @@
 # backend/scraper/odds_aggregator.py
 
-import requests
+import re
+import time
+import threading
 import numpy as np
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from backend.scraper.html_parser import parse_html, only
+from backend.scraper.http_cache import CachedSession
 from backend.utils.logger import get_logger
+from backend.scraper.team_names import match_key
 
 
 class OddsAggregator:
@@ -36,27 +41,73 @@ class OddsAggregator:
                 }
             }
         }
+
+    A fan-out thread pool az első párhuzamos lekéréskor indul;
+    close() (vagy with blokk) állítja le.
     """
 
-    def __init__(self):
+    def __init__(self, config=None):
+        self.config = config or {}
         self.logger = get_logger()
-        self.session = requests.Session()
+        self.session = CachedSession(config=self.config)
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
         })
 
+        c = self.config.get("odds_aggregator", {})
+
+        # egy meccsre jutó teljes határidő (nem forrásonként!)
+        self.deadline = c.get("deadline", 6.0)
+
+        # teljes slate listázásának határideje (bulk mód)
+        self.slate_deadline = c.get("slate_deadline", 30.0)
+
+        # listázás nélküli bukiknál meccsenkénti lekérés bulk módban is
+        self.bulk_fallback = c.get("bulk_fallback", True)
+
+        # ennyi forrás ára után már aggregálunk (None → mindet megvárjuk)
+        self.quorum = c.get("quorum", None)
+
+        self.max_workers = c.get("max_workers", 16)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+        # utolsó lekérés forrásonkénti késleltetése (monitoringhoz)
+        self.last_latency = {}
+
     # ---------------------------------------------------------
-    # PUBLIC INTERFACE
+    # THREAD POOL ÉLETCIKLUS
     # ---------------------------------------------------------
-    def get_aggregated_odds(self, home, away):
-        """
-        Lekéri több bukitól az oddsot és aggregált értéket ad.
-        """
+    @property
+    def executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="odds"
+                )
+            return self._executor
+
+    def close(self):
+        """A fan-out pool leállítása; a még futó scraperekre nem vár."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
 
-        sources = {}
-
-        # 1) több bukméker próbálása
-        for name, func in [
+    # ---------------------------------------------------------
+    # FORRÁSLISTA
+    # ---------------------------------------------------------
+    def _sources(self):
+        return [
             ("bet365", self._scrape_bet365),
             ("bwin", self._scrape_bwin),
             ("unibet", self._scrape_unibet),
@@ -66,20 +117,204 @@ class OddsAggregator:
             ("marathonbet", self._scrape_marathon),
             ("betfair", self._scrape_betfair_exchange),
             ("oddsportal", self._scrape_oddsportal)
-        ]:
-            try:
-                data = func(home, away)
-                if data:
-                    sources[name] = data
-            except:
-                pass
+        ]
+
+    def _listing_sources(self):
+        """
+        Bukinként egy teljes napi kínálat (fixture + odds) listázó.
+        Ugyanazok a nevek, mint a _sources()-ben.
+        """
+        return [
+            ("bet365", self._list_bet365),
+            ("bwin", self._list_bwin),
+            ("unibet", self._list_unibet),
+            ("pinnacle", self._list_pinnacle),
+            ("whill", self._list_whill),
+            ("1xbet", self._list_1xbet),
+            ("marathonbet", self._list_marathon),
+            ("betfair", self._list_betfair_exchange),
+            ("oddsportal", self._list_oddsportal)
+        ]
+
+    # ---------------------------------------------------------
+    # PUBLIC INTERFACE
+    # ---------------------------------------------------------
+    def get_aggregated_odds(self, home, away):
+        """
+        Lekéri több bukitól az oddsot és aggregált értéket ad.
+
+        Minden forrás párhuzamosan fut, egyetlen közös határidővel
+        (self.deadline). A határidőn túl érkező forrásokat eldobjuk,
+        részleges eredménnyel is aggregálunk. Ha quorum be van állítva,
+        az aggregálás annyi ár beérkezése után azonnal indul.
+        """
+
+        sources, latency = self._fan_out(
+            [(name, func, (home, away)) for name, func in self._sources()]
+        )
+
+        self.last_latency = latency
 
         if not sources:
             self.logger.error("OddsAggregator: NO DATA FOUND!")
             return {}
 
-        # 2) aggregálás
-        return self._aggregate(sources)
+        # aggregálás
+        result = self._aggregate(sources)
+        if result:
+            result["latency"] = latency
+        return result
+
+    def get_aggregated_odds_bulk(self, matches):
+        """
+        Teljes slate aggregálása.
+
+        matches = [{"match_id": ..., "home": ..., "away": ...}, ...]
+
+        Minden bukitól EGYSZER kérjük le a napi listát, és a meccseket
+        helyben, normalizált csapatnév-kulcs alapján oldjuk fel
+        → O(bukik) HTTP kérés O(meccsek × bukik) helyett.
+        Ahol a bukinak nincs listázója (None), ott bulk_fallback esetén
+        meccsenkénti lekérés történik – az összes (meccs × buki) job
+        egyetlen fan-outban, közös slate-határidővel.
+
+        Vissza:
+            {match_id: <get_aggregated_odds formátum>}
+        """
+
+        keyed = []
+        for m in matches:
+            match_id = m.get("match_id", m.get("id", f"{m['home']} - {m['away']}"))
+            keyed.append((match_id, m["home"], m["away"], match_key(m["home"], m["away"])))
+
+        # 1) bukinkénti listák párhuzamosan, közös slate-határidővel
+        per_match = {name: func for name, func in self._sources()}
+
+        listings, list_latency = self._fan_out(
+            [(name, func, ()) for name, func in self._listing_sources()],
+            timeout=self.slate_deadline
+        )
+
+        missing = [name for name in per_match if name not in listings]
+
+        # 3) listázó nélküli bukik → meccsenkénti fallback, egy fan-outban
+        extra, extra_latency = {}, {}
+        if self.bulk_fallback and missing:
+            jobs = [
+                ((match_id, name), per_match[name], (home, away))
+                for match_id, home, away, _ in keyed
+                for name in missing
+            ]
+            extra, extra_latency = self._fan_out(
+                jobs, timeout=self.slate_deadline, quorum=len(jobs)
+            )
+
+        results = {}
+
+        for match_id, home, away, key in keyed:
+
+            # 2) helyi feloldás a listákból
+            sources = {}
+            for name, listing in listings.items():
+                data = listing.get(key)
+                if data:
+                    sources[name] = data
+
+            latency = {
+                name: {**list_latency[name], "mode": "listing"}
+                for name in listings
+            }
+
+            for name in missing:
+                if (match_id, name) in extra:
+                    sources[name] = extra[(match_id, name)]
+                if (match_id, name) in extra_latency:
+                    latency[name] = {**extra_latency[(match_id, name)], "mode": "match"}
+
+            if not sources:
+                self.logger.warning(f"OddsAggregator: nincs odds ({home} - {away})")
+                results[match_id] = {}
+                continue
+
+            agg = self._aggregate(sources)
+            if agg:
+                agg["latency"] = latency
+            results[match_id] = agg
+
+        return results
+
+    # ---------------------------------------------------------
+    # PÁRHUZAMOS LEKÉRÉS (fan-out)
+    # ---------------------------------------------------------
+    def _timed_call(self, func, args):
+        start = time.perf_counter()
+        try:
+            data = func(*args)
+            error = None
+        except Exception as e:
+            data, error = None, e
+        return data, error, time.perf_counter() - start
+
+    def _fan_out(self, jobs, timeout=None, quorum=None):
+        """
+        jobs = [(name, func, args), ...]
+        timeout = közös határidő (alapból self.deadline)
+        quorum = ennyi nem üres válasz után nem várunk tovább
+                 (alapból self.quorum, annak híján az összes job)
+
+        Vissza:
+            sources = {name: data}            (csak a nem üres válaszok)
+            latency = {name: {"latency": sec, "status": ...}}
+                status: ok | empty | error
+                        timeout   – a határidőig nem érkezett meg
+                        cancelled – quorum után, el sem indult
+                        skipped   – quorum után, futott, de nem vártuk meg
+        """
+        deadline = time.monotonic() + (timeout or self.deadline)
+        quorum = quorum or self.quorum or len(jobs)
+
+        futures = {
+            self.executor.submit(self._timed_call, func, args): name
+            for name, func, args in jobs
+        }
+
+        sources = {}
+        latency = {}
+        pending = set(futures)
+
+        while pending and len(sources) < quorum:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+
+            for f in done:
+                name = futures[f]
+                data, error, elapsed = f.result()
+
+                if error is not None:
+                    status = "error"
+                    self.logger.warning(f"OddsAggregator: {name} hiba: {error}")
+                elif data:
+                    status = "ok"
+                    sources[name] = data
+                else:
+                    status = "empty"
+
+                latency[name] = {"latency": round(elapsed, 4), "status": status}
+
+        # határidőn túl / quorum után: nem várjuk meg őket
+        quorum_reached = len(sources) >= quorum
+        for f in pending:
+            cancelled = f.cancel()
+            if not quorum_reached:
+                status = "timeout"
+            else:
+                status = "cancelled" if cancelled else "skipped"
+            latency[futures[f]] = {"latency": None, "status": status}
+
+        return sources, latency
 
     # ---------------------------------------------------------
     # AGGREGÁLÁS
@@ -92,7 +327,7 @@ class OddsAggregator:
         def collect(key):
             arr = []
             for s in sources.values():
-                if key in s:
+                if s.get(key) is not None:
                     arr.append(s[key])
             return arr
 
@@ -134,7 +369,7 @@ class OddsAggregator:
         s = p1 + px + p2
 
         p1 /= s
-        px /= s if ox else 0
+        px = px / s if ox else 0
         p2 /= s
 
         fair = {
@@ -173,6 +408,70 @@ class OddsAggregator:
     def _scrape_betfair_exchange(self, home, away):
         return None
 
+    # ---------------------------------------------------------
+    # NAPI LISTÁZÓK (bulk mód)
+    # ---------------------------------------------------------
+    # Vissza: {(home_key, away_key): {"1": .., "X": .., "2": ..}} vagy None,
+    # ha a bukinak (még) nincs listázója → meccsenkénti fallback.
+
+    def _list_bet365(self):
+        return None
+
+    def _list_bwin(self):
+        return None
+
+    def _list_unibet(self):
+        return None
+
+    def _list_pinnacle(self):
+        return None
+
+    def _list_whill(self):
+        return None
+
+    def _list_1xbet(self):
+        return None
+
+    def _list_marathon(self):
+        return None
+
+    def _list_betfair_exchange(self):
+        return None
+
+    # OddsPortal napi meccslista (egy oldal a teljes napra)
+    def _list_oddsportal(self):
+        try:
+            url = "https://www.oddsportal.com/matches/football/"
+
+            r = self.session.get(url, timeout=5)
+            if r.status_code != 200:
+                return None
+
+            soup = parse_html(r.text, only("div", "eventRow"))
+
+            listing = {}
+            for row in soup.find_all("div", class_="eventRow"):
+                names = [
+                    p.get_text(strip=True)
+                    for p in row.find_all("p", class_="participant-name")
+                ]
+                prices = re.findall(r"\b([0-9]+\.[0-9]{2})\b", row.get_text(" ", strip=True))
+
+                if len(names) < 2 or len(prices) < 2:
+                    continue
+
+                if len(prices) >= 3:
+                    odds = {"1": float(prices[0]), "X": float(prices[1]), "2": float(prices[2])}
+                else:
+                    odds = {"1": float(prices[0]), "X": None, "2": float(prices[1])}
+
+                listing[match_key(names[0], names[1])] = odds
+
+            return listing or None
+
+        except:
+            return None
+
     # Fallback: OddsPortal HTML
     def _scrape_oddsportal(self, home, away):
         try:
@@ -183,7 +482,7 @@ class OddsAggregator:
             if r.status_code != 200:
                 return None
 
-            soup = BeautifulSoup(r.text, "html.parser")
+            soup = parse_html(r.text)
 
             odds = soup.text.lower()
             # egyszerű fallback parser
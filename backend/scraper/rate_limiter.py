@@ -0,0 +1,257 @@
+# backend/scraper/rate_limiter.py
+
+import time
+import threading
+
+import requests
+from backend.utils.logger import get_logger
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """A host circuit breakere nyitva → azonnali hiba, nincs hálózati kérés."""
+
+
+class TokenBucket:
+    """
+    Token bucket, AIMD-adaptív rátával:
+        • siker    → rate += increase (max_rate-ig)
+        • throttle → rate *= decrease (min_rate-ig)
+    """
+
+    def __init__(self, rate, burst, min_rate=0.2, max_rate=None, increase=0.1, decrease=0.5):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.min_rate = min_rate
+        self.max_rate = max_rate or rate
+        self.increase = increase
+        self.decrease = decrease
+
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self):
+        """Egy token lefoglalása. Vissza: ennyi mp-et kell várni."""
+        now = time.monotonic()
+        self._refill(now)
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def speed_up(self):
+        self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def slow_down(self):
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+
+
+class CircuitBreaker:
+    """
+    closed → (failure_threshold egymás utáni hiba) → open
+    open   → (reset_timeout után) → half_open: egyetlen próbakérés
+    half_open → siker: closed | hiba: open (újra reset_timeout)
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=3, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.probe_in_flight = False
+
+    def allow(self):
+        if self.state == self.CLOSED:
+            return True
+
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            self.probe_in_flight = False
+
+        # half-open: egyszerre csak egy próba
+        if self.probe_in_flight:
+            return False
+        self.probe_in_flight = True
+        return True
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self.probe_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self.probe_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+
+class HostGuard:
+    """Egy host rate limitere + circuit breakere + számlálói."""
+
+    def __init__(self, host, conf):
+        self.host = host
+        self.bucket = TokenBucket(
+            rate=conf.get("rate", 5.0),
+            burst=conf.get("burst", 10),
+            min_rate=conf.get("min_rate", 0.2),
+            max_rate=conf.get("max_rate"),
+        )
+        self.breaker = CircuitBreaker(
+            failure_threshold=conf.get("failure_threshold", 3),
+            reset_timeout=conf.get("reset_timeout", 30.0),
+        )
+        self.max_wait = conf.get("max_wait", 10.0)
+
+        self.lock = threading.Lock()
+        self.counters = {"requests": 0, "failures": 0, "rejected": 0, "throttled": 0}
+        self.last_error = None
+
+    def apply(self, conf):
+        """
+        Új beállítások a futó guardra: a breaker állapota és a számlálók
+        megmaradnak; az AIMD-vel lecsökkentett ráta is (az új határok közé
+        vágva), vissza nem fogott guard az új rátát kapja.
+        """
+        with self.lock:
+            b = self.bucket
+            backed_off = b.rate < b.max_rate
+
+            rate = float(conf.get("rate", 5.0))
+            b.burst = float(conf.get("burst", 10))
+            b.min_rate = conf.get("min_rate", 0.2)
+            b.max_rate = conf.get("max_rate") or rate
+            b.rate = max(b.min_rate, min(b.max_rate, b.rate if backed_off else rate))
+            b.tokens = min(b.tokens, b.burst)
+
+            self.breaker.failure_threshold = conf.get("failure_threshold", 3)
+            self.breaker.reset_timeout = conf.get("reset_timeout", 30.0)
+            self.max_wait = conf.get("max_wait", 10.0)
+
+    def before_request(self):
+        with self.lock:
+            if not self.breaker.allow():
+                self.counters["rejected"] += 1
+                raise CircuitOpenError(f"Circuit open: {self.host}")
+
+            wait = self.bucket.reserve()
+            if wait > self.max_wait:
+                # nem foglaljuk tovább a tokent, és a próbát sem
+                self.bucket.tokens += 1
+                if self.breaker.state == CircuitBreaker.HALF_OPEN:
+                    self.breaker.probe_in_flight = False
+                self.counters["rejected"] += 1
+                raise CircuitOpenError(f"Rate limit wait too long: {self.host}")
+
+            self.counters["requests"] += 1
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def record(self, status=None, error=None):
+        with self.lock:
+            if error is not None or (status is not None and (status == 429 or status >= 500)):
+                self.counters["failures"] += 1
+                self.last_error = str(error) if error is not None else f"HTTP {status}"
+                self.breaker.record_failure()
+                if status == 429 or status == 503 or isinstance(error, requests.Timeout):
+                    self.counters["throttled"] += 1
+                    self.bucket.slow_down()
+            else:
+                self.breaker.record_success()
+                self.bucket.speed_up()
+
+    def health(self):
+        with self.lock:
+            return {
+                "state": self.breaker.state,
+                "consecutive_failures": self.breaker.failures,
+                "rate": round(self.bucket.rate, 3),
+                "last_error": self.last_error,
+                **self.counters,
+            }
+
+
+class HostGuardRegistry:
+    """
+    HOST GUARD REGISTRY (folyamat-szintű)
+    -------------------------------------
+    Hostonként egy HostGuard. A CachedSession minden hálózati kérés előtt
+    és után ide jelez; a MonitoringSystem innen olvassa a forrásonkénti
+    egészséget.
+
+    Config:
+        "rate_limit": {
+            "enabled": true,          # false → nincs limiter / breaker
+            "default": {"rate": 5, "burst": 10, "failure_threshold": 3,
+                        "reset_timeout": 30, "max_wait": 10},
+            "hosts": {"www.tippmixpro.hu": {"rate": 2, "burst": 4}}
+        }
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, config=None):
+        self.logger = get_logger()
+
+        self._guards = {}
+        self._lock = threading.Lock()
+
+        self.configure(config)
+
+    @classmethod
+    def shared(cls, config=None):
+        """
+        Folyamat-szintű registry. Eltérő "rate_limit" szekciót tartalmazó
+        config a már létező példányt is újrakonfigurálja (a guardok
+        állapota megmarad).
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(config)
+            elif config and "rate_limit" in config and config["rate_limit"] != cls._shared.config.get("rate_limit"):
+                cls._shared.configure(config)
+            return cls._shared
+
+    def configure(self, config=None):
+        self.config = config or {}
+
+        c = self.config.get("rate_limit", {})
+        self.enabled = c.get("enabled", True)
+        self.default = c.get("default", {})
+        self.host_conf = c.get("hosts", {})
+
+        # a meglévő guardok (nyitott breakerek, AIMD ráta) nem vesznek el,
+        # csak az új beállításokat kapják meg
+        with self._lock:
+            for host, g in self._guards.items():
+                g.apply(self._host_config(host))
+
+    def _host_config(self, host):
+        return {**self.default, **self.host_conf.get(host, {})}
+
+    def guard(self, host):
+        with self._lock:
+            g = self._guards.get(host)
+            if g is None:
+                g = HostGuard(host, self._host_config(host))
+                self._guards[host] = g
+            return g
+
+    def health(self):
+        with self._lock:
+            guards = list(self._guards.values())
+        return {g.host: g.health() for g in guards}
@@ -0,0 +1,129 @@
+# backend/scraper/replay_transport.py
+
+import os
+import json
+import time
+import base64
+import random
+import hashlib
+import threading
+
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+
+class ReplayAdapter(HTTPAdapter):
+    """
+    RECORD / REPLAY TRANSPORT
+    -------------------------
+    requests transport adapter a scraperek offline méréséhez (CI, benchmark).
+
+    Módok:
+        • "record" – valódi kérés, a választ lemezre menti (fixture_dir)
+        • "replay" – lemezről szolgál ki, konfigurálható latency + jitter
+                     mellett; hiányzó fixture → 404
+
+    Statisztika (stats()):
+        requests, bytes, missing, recorded
+
+    Használat:
+        install_replay(scraper.session, "backend/data/fixtures/replay",
+                       mode="replay", latency=0.08, jitter=0.04)
+    """
+
+    def __init__(self, fixture_dir, mode="replay", latency=0.0, jitter=0.0, seed=None):
+        super().__init__()
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Ismeretlen replay mód: {mode}")
+
+        self.fixture_dir = fixture_dir
+        self.mode = mode
+        self.latency = latency
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+
+        self._lock = threading.Lock()
+        self.counters = {"requests": 0, "bytes": 0, "missing": 0, "recorded": 0}
+
+        os.makedirs(fixture_dir, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # FIXTURE ÚTVONAL
+    # ------------------------------------------------------------------
+    def _path(self, request):
+        key = hashlib.sha1(f"{request.method} {request.url}".encode("utf-8")).hexdigest()
+        return os.path.join(self.fixture_dir, f"{key}.json")
+
+    def _count(self, **deltas):
+        with self._lock:
+            for k, v in deltas.items():
+                self.counters[k] += v
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counters)
+
+    # ------------------------------------------------------------------
+    # SEND
+    # ------------------------------------------------------------------
+    def send(self, request, **kwargs):
+        path = self._path(request)
+
+        if self.mode == "record":
+            r = super().send(request, **kwargs)
+            self._save(path, request, r)
+            self._count(requests=1, bytes=len(r.content or b""), recorded=1)
+            return r
+
+        with self._lock:
+            delay = max(0.0, self.latency + self.rng.uniform(-self.jitter, self.jitter))
+        time.sleep(delay)
+
+        if not os.path.exists(path):
+            self._count(requests=1, missing=1)
+            return self._build(request, 404, {}, b"", "No fixture")
+
+        with open(path, "r", encoding="utf-8") as f:
+            fx = json.load(f)
+
+        body = base64.b64decode(fx["body_b64"])
+        self._count(requests=1, bytes=len(body))
+
+        return self._build(request, fx["status"], fx["headers"], body, fx.get("reason"), fx.get("encoding"))
+
+    # ------------------------------------------------------------------
+    # SEGÉDEK
+    # ------------------------------------------------------------------
+    def _save(self, path, request, r):
+        fx = {
+            "method": request.method,
+            "url": request.url,
+            "status": r.status_code,
+            "reason": r.reason,
+            "headers": dict(r.headers),
+            "encoding": r.encoding,
+            "body_b64": base64.b64encode(r.content or b"").decode("ascii"),
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(fx, f)
+
+    def _build(self, request, status, headers, body, reason=None, encoding=None):
+        r = Response()
+        r.status_code = status
+        r.reason = reason
+        r.headers = CaseInsensitiveDict(headers)
+        r._content = body
+        r.encoding = encoding
+        r.url = request.url
+        r.request = request
+        r.connection = self
+        return r
+
+
+def install_replay(session, fixture_dir, mode="replay", latency=0.0, jitter=0.0, seed=None):
+    """A session összes http/https forgalmát a ReplayAdapter-re köti."""
+    adapter = ReplayAdapter(fixture_dir, mode=mode, latency=latency, jitter=jitter, seed=seed)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return adapter
@@ -1,7 +1,10 @@
 # backend/scraper/result_scraper.py
 
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from backend.utils.logger import get_logger
+from backend.scraper.http_cache import CachedSession
+from backend.scraper.team_names import MatchIndex
 
 class ResultScraper:
     """
@@ -9,11 +12,42 @@ class ResultScraper:
         1) SofaScore
         2) FlashScore
         3) OddsPortal (closing odds + eredmény)
+
+    Bulk elszámolás (get_results):
+        • napi "finished events" lista → egész nap néhány kéréssel
+        • maradék meccsek: párhuzamos, korlátozott concurrency,
+          keep-alive connection pool
+
+    Tipp elszámolás (load_daily_results):
+        • a nap tárolt tippjei + eredmények → "win" / "loss" / "push"
+        • training rekord: ev, profit, features (DailyTrainingWorkflow,
+          LabelGenerator, BankrollUpdater bemenete)
     """
 
-    def __init__(self):
+    SOFA_API = "https://api.sofascore.com/api/v1"
+
+    # tipp mezők, amelyekből a training feature-ök jönnek (ha nincs "features")
+    FEATURE_FIELDS = (
+        "probability", "odds", "value_score", "deep_value", "confidence",
+        "risk", "clv", "sharp_money", "volatility", "momentum",
+    )
+
+    def __init__(self, config=None):
+        self.config = config or {}
         self.logger = get_logger()
 
+        c = self.config.get("results", {})
+        self.max_workers = c.get("max_workers", 8)
+        self.sport = c.get("sport", "football")
+
+        self.session = CachedSession(config=self.config)
+        self.session.headers.update({"User-Agent": "Mozilla/5.0"})
+
+        # keep-alive pool a párhuzamos lekérésekhez
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     # ---------------------------------------------------
     # Public interface
     # ---------------------------------------------------
@@ -39,6 +73,9 @@ class ResultScraper:
             self.logger.error(f"[ResultScraper] No result for match_id={match_id}")
             return None
 
+        return self._mark_result(data)
+
+    def _mark_result(self, data):
         # eredmény jelölése
         if data["goals_home"] > data["goals_away"]:
             data["result"] = 1
@@ -47,13 +84,229 @@ class ResultScraper:
 
         return data
 
+    # ---------------------------------------------------
+    # Bulk interface
+    # ---------------------------------------------------
+    def get_results(self, match_ids, date=None):
+        """
+        Több meccs elszámolása egyszerre.
+
+        date megadása esetén először a napi befejezett események listájából
+        dolgozunk (1 kérés / nap), csak a hiányzókat kérjük le egyenként,
+        max_workers párhuzamos szálon.
+
+        Vissza: {match_id: get_result formátum vagy None}
+        """
+        results = {}
+        remaining = list(match_ids)
+
+        if date:
+            day = self.get_day_results(date)
+            for mid in list(remaining):
+                data = day.get(str(mid))
+                if data:
+                    results[mid] = {**data, "match_id": mid}
+                    remaining.remove(mid)
+
+        if remaining:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for mid, data in zip(remaining, pool.map(self.get_result, remaining)):
+                    results[mid] = data
+
+        return results
+
+    def get_day_results(self, date):
+        """
+        SofaScore napi lista → az összes befejezett meccs egy kéréssel.
+
+        Vissza: {str(event_id): get_result formátum}
+        """
+        try:
+            url = f"{self.SOFA_API}/sport/{self.sport}/scheduled-events/{date}"
+            r = self.session.get(url, timeout=10)
+            if r.status_code != 200:
+                return {}
+            events = r.json().get("events", [])
+
+        except Exception as e:
+            self.logger.error(f"[ResultScraper] Day listing error ({date}): {e}")
+            return {}
+
+        out = {}
+        for ev in events:
+            try:
+                if ev.get("status", {}).get("type") != "finished":
+                    continue
+
+                out[str(ev["id"])] = self._mark_result({
+                    "match_id": ev["id"],
+                    "home": ev.get("homeTeam", {}).get("name"),
+                    "away": ev.get("awayTeam", {}).get("name"),
+                    "goals_home": ev["homeScore"]["current"],
+                    "goals_away": ev["awayScore"]["current"],
+                    "closing_odds": None,
+                    "final_ev": None
+                })
+            except (KeyError, TypeError):
+                continue
+
+        return out
+
+    # ---------------------------------------------------
+    # Tipp elszámolás → training rekordok
+    # ---------------------------------------------------
+    def load_daily_results(self, date, tips=None):
+        """
+        DailyTrainingWorkflow results_loader interfész:
+            load_daily_results(date) → list(dict)
+
+        tips=None → a nap tárolt tippjei (HistoricalROIAnalyzer history).
+        A tippek match_id alapján párosulnak az eredményekkel (napi lista,
+        majd csapatnév, végül egyenkénti lekérés). Vissza tippenként:
+            {
+                "match_id": "...",
+                "date": "YYYY-MM-DD",
+                "result": "win" / "loss" / "push",
+                "goals_home": 2, "goals_away": 1,
+                "odds": 1.85, "stake": 10.0,
+                "ev": 0.07,
+                "profit": 8.5,
+                "features": {...}
+            }
+        Eredmény nélküli / nem elszámolható tipp kimarad.
+        """
+        if tips is None:
+            tips = self._stored_tips(date)
+        if not tips:
+            return []
+
+        day = self.get_day_results(date)
+
+        by_teams = MatchIndex()
+        for res in day.values():
+            if res.get("home") and res.get("away"):
+                by_teams.add(res["home"], res["away"], None, res)
+
+        matched, missing = [], []
+        for tip in tips:
+            res = day.get(str(tip.get("match_id")))
+            if res is None and tip.get("home") and tip.get("away"):
+                res = by_teams.get(tip["home"], tip["away"])
+            if res is None:
+                missing.append(tip)
+            matched.append((tip, res))
+
+        # egyenkénti lekérés csak azonosítóval rendelkező tippre
+        refetch = {t.get("match_id") for t in missing if t.get("match_id") is not None}
+        if refetch:
+            fetched = self.get_results(refetch)
+            matched = [
+                (tip, res if res is not None else fetched.get(tip.get("match_id")))
+                for tip, res in matched
+            ]
+
+        records = []
+        for tip, res in matched:
+            record = self._training_record(tip, res, date) if res else None
+            if record is None:
+                self.logger.warning(f"[ResultScraper] Nem elszámolható tipp: {tip.get('match_id')}")
+                continue
+            records.append(record)
+
+        return records
+
+    def _stored_tips(self, date):
+        from backend.analysis.historical_roi_analyzer import HistoricalROIAnalyzer
+
+        try:
+            history = HistoricalROIAnalyzer(self.config).load_history()
+        except Exception as e:
+            self.logger.error(f"[ResultScraper] Tipp history olvasási hiba: {e}")
+            return []
+
+        return [tip for day in history if day.get("date") == date for tip in day.get("tips", [])]
+
+    def _training_record(self, tip, res, date):
+        selection = str(tip.get("selection", "1"))
+        outcome = self.settle(tip, res["goals_home"], res["goals_away"])
+        if outcome is None:
+            return None
+
+        odds = tip.get("odds")
+        if isinstance(odds, dict):
+            odds = odds.get(selection)
+        try:
+            odds = float(odds)
+        except (TypeError, ValueError):
+            return None
+
+        stake = float(tip.get("stake", 1.0))
+        source = {**tip.get("data", {}), **tip}
+
+        if "ev" in source:
+            ev = float(source["ev"])
+        else:
+            ev = float(source.get("probability", 1.0 / odds)) * odds - 1.0
+
+        if outcome == "win":
+            profit = round(stake * (odds - 1), 2)
+        elif outcome == "loss":
+            profit = -stake
+        else:
+            profit = 0.0
+
+        features = tip.get("features") or {
+            k: float(source[k]) for k in self.FEATURE_FIELDS
+            if isinstance(source.get(k), (int, float)) and not isinstance(source.get(k), bool)
+        }
+
+        return {
+            "match_id": tip.get("match_id"),
+            "date": date,
+            "result": outcome,
+            "goals_home": res["goals_home"],
+            "goals_away": res["goals_away"],
+            "odds": odds,
+            "stake": stake,
+            "ev": round(ev, 4),
+            "profit": profit,
+            "features": features,
+        }
+
+    @staticmethod
+    def settle(tip, goals_home, goals_away):
+        """
+        Tipp kimenetele a végeredményből: "win" / "loss" / "push" / None.
+            1X2:    selection "1" / "X" / "2" (alapértelmezés: "1")
+            total:  selection "over" / "under", line (pl. 2.5)
+            btts:   selection "yes" / "no"
+        """
+        market = str(tip.get("market_type", "1x2")).lower()
+        selection = str(tip.get("selection", "1")).lower()
+
+        if market == "total":
+            diff = goals_home + goals_away - float(tip.get("line", 2.5))
+            if diff == 0:
+                return "push"
+            won = diff > 0 if selection == "over" else diff < 0
+        elif market == "btts":
+            both = goals_home > 0 and goals_away > 0
+            won = both if selection == "yes" else not both
+        elif selection in ("1", "x", "2"):
+            actual = "1" if goals_home > goals_away else "2" if goals_home < goals_away else "x"
+            won = selection == actual
+        else:
+            return None
+
+        return "win" if won else "loss"
+
     # ---------------------------------------------------
     # SofaScore API
     # ---------------------------------------------------
     def _sofascore(self, match_id):
         try:
-            url = f"https://api.sofascore.com/api/v1/event/{match_id}"
-            r = requests.get(url, timeout=5)
+            url = f"{self.SOFA_API}/event/{match_id}"
+            r = self.session.get(url, timeout=5)
             if r.status_code != 200:
                 return None
             js = r.json()
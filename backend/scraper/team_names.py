@@ -0,0 +1,163 @@
+# backend/scraper/team_names.py
+
+
+def normalize_team(name):
+    """
+    Csapatnév → összehasonlítható kulcs.
+        "Manchester United FC" → "manchesterunited"
+    Ugyanaz a szabályrendszer, mint a MasterDataLoader-ben.
+    """
+    if not name:
+        return ""
+
+    name = str(name).lower()
+    replace = {
+        "fc": "",
+        "sc": "",
+        "cf": "",
+        " ": "",
+        ".": "",
+        "-": "",
+    }
+    for k, v in replace.items():
+        name = name.replace(k, v)
+    return name
+
+
+def match_key(home, away):
+    """(home, away) → normalizált kulcs a slate-szintű kereséshez."""
+    return normalize_team(home), normalize_team(away)
+
+
+def date_key(date):
+    """Dátum → "YYYY-MM-DD" (vagy None, ha nincs dátum)."""
+    if not date:
+        return None
+    return str(date)[:10]
+
+
+def trigrams(key):
+    """Karakter-trigramok a fuzzy kereséshez ("#arsenal#" → {"#ar", "ars", ...})."""
+    padded = f"#{key}#"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class MatchIndex:
+    """
+    Normalizált (home, away, date) kulcs → tetszőleges meccs rekord.
+    O(1) keresés a meccsenkénti végigpásztázás helyett.
+
+    Keresési szintek:
+        1) get()  – pontos normalizált kulcs (+ alias tábla)
+        2) find() – pontos, majd fuzzy: trigram Dice-hasonlóság
+                    invertált trigram indexen keresztül
+
+        idx = MatchIndex(aliases={"Man Utd": "Manchester United"})
+        idx.add("Liverpool FC", "Arsenal", "2025-11-23", {...})
+        idx.get("liverpool", "Arsenal")            → {...}
+        idx.find("Liverpol", "Arsenal FC")         → {...}
+    """
+
+    def __init__(self, aliases=None, fuzzy_threshold=0.6):
+        self.aliases = {
+            normalize_team(k): normalize_team(v) for k, v in (aliases or {}).items()
+        }
+        self.fuzzy_threshold = fuzzy_threshold
+
+        self._by_key = {}       # (home, away, date) -> item
+        self._by_teams = {}     # (home, away) -> [item, ...]
+
+        # fuzzy szint
+        self._grams = {}        # trigram -> {team_key, ...}
+        self._team_grams = {}   # team_key -> trigram set
+        self._by_home = {}      # home_key -> {away_key, ...}
+
+    def _key(self, name):
+        key = normalize_team(name)
+        return self.aliases.get(key, key)
+
+    def _teams(self, home, away):
+        return self._key(home), self._key(away)
+
+    def add(self, home, away, date, item):
+        teams = self._teams(home, away)
+        self._by_key[teams + (date_key(date),)] = item
+        self._by_teams.setdefault(teams, []).append(item)
+
+        self._by_home.setdefault(teams[0], set()).add(teams[1])
+        for team in teams:
+            if team not in self._team_grams:
+                grams = trigrams(team)
+                self._team_grams[team] = grams
+                for g in grams:
+                    self._grams.setdefault(g, set()).add(team)
+
+    def get(self, home, away, date=None):
+        return self._lookup(self._teams(home, away), date)
+
+    def _lookup(self, teams, date):
+        if date:
+            item = self._by_key.get(teams + (date_key(date),))
+            if item is None:
+                # dátum nélkül indexelt rekord
+                item = self._by_key.get(teams + (None,))
+            return item
+
+        items = self._by_teams.get(teams)
+        return items[0] if items else None
+
+    # ------------------------------------------------------------------
+    # FUZZY SZINT
+    # ------------------------------------------------------------------
+    def _similar(self, key):
+        """
+        key → {team_key: dice} a küszöb feletti jelöltekre.
+        Csak a közös trigrammal rendelkező csapatokat pontozzuk.
+        """
+        grams = trigrams(key)
+        shared = {}
+        for g in grams:
+            for team in self._grams.get(g, ()):
+                shared[team] = shared.get(team, 0) + 1
+
+        out = {}
+        for team, n in shared.items():
+            dice = 2 * n / (len(grams) + len(self._team_grams[team]))
+            if dice >= self.fuzzy_threshold:
+                out[team] = dice
+        return out
+
+    def find(self, home, away, date=None):
+        """Pontos keresés, ha nincs találat → legjobb fuzzy páros."""
+        teams = self._teams(home, away)
+
+        item = self._lookup(teams, date)
+        if item is not None:
+            return item
+
+        home_cands = self._similar(teams[0])
+        if not home_cands:
+            return None
+
+        away_cands = self._similar(teams[1])
+
+        best, best_score = None, 0.0
+        for h, h_sim in home_cands.items():
+            for a in self._by_home.get(h, ()):
+                a_sim = 1.0 if a == teams[1] else away_cands.get(a)
+                if not a_sim:
+                    continue
+
+                score = (h_sim + a_sim) / 2
+                if score > best_score:
+                    item = self._lookup((h, a), date)
+                    if item is not None:
+                        best, best_score = item, score
+
+        return best
+
+    def items(self):
+        return list(self._by_key.values())
+
+    def __len__(self):
+        return len(self._by_key)
@@ -1,9 +1,72 @@
 # backend/scraper/tippmixpro_scraper.py
 
 import re
-import requests
-from bs4 import BeautifulSoup
+import time
+import datetime
+import threading
+from backend.scraper.html_parser import parse_html, only
+from backend.scraper.http_cache import CachedSession
 from backend.utils.logger import get_logger
+from backend.scraper.team_names import MatchIndex
+
+
+class TippmixEvent:
+    """
+    Egyszer letöltött és feldolgozott TippmixPro esemény oldal.
+    Az odds, a fogadhatóság és az összes piac ugyanabból a parse-ból jön,
+    így check_match / get_odds / is_available nem tölti le újra az oldalt.
+
+        markets = {"1x2": {"1": 1.85, "X": 3.40, "2": 4.20}, ...}
+    """
+
+    UNAVAILABLE = re.compile("Nincs fogadási lehetőség", re.IGNORECASE)
+
+    # csak a piac blokkok + odds gombok részfája kell
+    TARGETS = only(["div", "button"], "market", "odd-button")
+
+    def __init__(self, url, markets, available):
+        self.url = url
+        self.markets = markets
+        self.available = available
+
+    @property
+    def odds(self):
+        """1X2 / végeredmény piac(ok) összevont oddsai."""
+        odds_map = {}
+        for title, prices in self.markets.items():
+            if "1x2" in title or "végeredmény" in title:
+                odds_map.update(prices)
+        return odds_map
+
+    @classmethod
+    def from_html(cls, url, html):
+        soup = parse_html(html, cls.TARGETS)
+
+        markets = {}
+        for m in soup.find_all("div", class_="market"):
+            title = m.find("div", class_="market-title")
+            if not title:
+                continue
+
+            prices = markets.setdefault(title.get_text(strip=True).lower(), {})
+
+            for b in m.find_all("button"):
+                label = b.find("span", class_="label")
+                value = b.find("span", class_="value")
+                if label and value:
+                    try:
+                        prices[label.get_text(strip=True)] = float(value.get_text(strip=True))
+                    except ValueError:
+                        continue
+
+        # a szöveges jelzés a szűrt részfán kívül is lehet → nyers HTML-ben keressük
+        if cls.UNAVAILABLE.search(html):
+            available = False
+        else:
+            # ha vannak odds gombok
+            available = soup.find("button", {"class": "odd-button"}) is not None
+
+        return cls(url, markets, available)
 
 
 class TippmixProScraper:
@@ -16,17 +79,40 @@ class TippmixProScraper:
         ✓ odds kiolvasása
         ✓ fogadhatóság ellenőrzése
         ✓ piacok beolvasása
+        ✓ napi kínálat index (index_mode) → O(1) meccskeresés
     """
 
     BASE_URL = "https://www.tippmixpro.hu"
 
-    def __init__(self):
+    # keresési / kínálati oldalakon csak az eseménykártyák kellenek
+    CARD_TARGETS = only("div", "match-item")
+
+    def __init__(self, config=None):
+        self.config = config or {}
         self.logger = get_logger()
-        self.session = requests.Session()
+        self.session = CachedSession(config=self.config)
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
         })
 
+        c = self.config.get("tippmixpro", {})
+
+        # feldolgozott esemény oldalak rövid cache-e (url -> (idő, TippmixEvent))
+        self.event_ttl = c.get("event_ttl", 20)
+        self._events = {}
+        self._events_lock = threading.Lock()
+
+        # napi kínálat index: egyszeri crawl, utána helyi keresés
+        self.index_mode = c.get("index_mode", False)
+        self.index_ttl = c.get("index_ttl", 600)
+        self.index_max_pages = c.get("index_max_pages", 50)
+        self.index_retry = c.get("index_retry", 30)
+        self._index = None
+        self._index_built = None          # (dátum, monotonic idő)
+        self._index_retry_at = 0.0        # sikertelen crawl után eddig nincs újabb
+        self._index_lock = threading.Lock()     # állapot olvasás / csere
+        self._build_lock = threading.Lock()     # egyszerre egy crawl
+
     # ---------------------------------------------------------------
     # 1) Meccskeresés (home_team, away_team)
     # ---------------------------------------------------------------
@@ -34,8 +120,13 @@ class TippmixProScraper:
         """
         TippmixPro search oldal HTML szűréssel.
         Visszaadja az esemény linkjét, ha megtalálja.
+        index_mode esetén hálózati kérés nélkül, a napi indexből.
         """
 
+        if self.index_mode:
+            entry = self.find_match(home_team, away_team)
+            return entry["event_url"] if entry else None
+
         q = f"{home_team} {away_team}"
         url = f"{self.BASE_URL}/fogadasi-ajanlat?searchText={q}"
 
@@ -46,7 +137,7 @@ class TippmixProScraper:
             if r.status_code != 200:
                 return None
 
-            soup = BeautifulSoup(r.text, "html.parser")
+            soup = parse_html(r.text, self.CARD_TARGETS)
 
             # eseménykártyák keresése (vannak rejtett div-ek)
             cards = soup.find_all("div", class_="match-item")
@@ -68,72 +159,225 @@ class TippmixProScraper:
             return None
 
     # ---------------------------------------------------------------
-    # 2) Esemény oddsok kinyerése
+    # 1/B) Napi kínálat index
     # ---------------------------------------------------------------
-    def get_odds(self, event_url):
+    def build_daily_index(self, date=None):
         """
-        Esemény oldalról kinyeri az 1X2 és egyéb oddsokat.
+        A teljes napi kínálat (fogadasi-ajanlat) egyszeri bejárása.
+        Minden match-item kártyából: csapatok, dátum, esemény link, odds.
+
+        Vissza: MatchIndex (normalizált (home, away, date) → rekord)
         """
-        try:
-            r = self.session.get(event_url, timeout=5)
-            if r.status_code != 200:
-                return {}
+        return self._crawl_index(date)[0]
+
+    def _crawl_index(self, date=None):
+        """
+        Vissza: (MatchIndex, ok). ok=False, ha a bejárás hálózati hibán
+        vagy nem 200-as válaszon akadt el – a részleges index nem teljes.
+        """
+        date = date or datetime.date.today().isoformat()
+        index = MatchIndex()
+        ok = True
+
+        for page in range(1, self.index_max_pages + 1):
+            url = f"{self.BASE_URL}/fogadasi-ajanlat?date={date}&page={page}"
 
-            soup = BeautifulSoup(r.text, "html.parser")
+            try:
+                r = self.session.get(url, timeout=5)
+                if r.status_code != 200:
+                    # az utolsó utáni oldal lehet 404 – csak az első oldal hibája végzetes
+                    ok = page > 1 and r.status_code == 404
+                    break
 
-            odds_map = {}
+                soup = parse_html(r.text, self.CARD_TARGETS)
+                cards = soup.find_all("div", class_="match-item")
+
+            except Exception as e:
+                self.logger.error(f"[TippmixPro] build_daily_index ERROR: {e}")
+                ok = False
+                break
+
+            if not cards:
+                break
+
+            for c in cards:
+                entry = self._parse_card(c, date)
+                if entry:
+                    index.add(entry["home"], entry["away"], entry["date"], entry)
 
-            # klasszikus 1X2 piac keresése
-            market_blocks = soup.find_all("div", class_="market")
-            for m in market_blocks:
-                title = m.find("div", class_="market-title")
-                if not title:
+        self.logger.info(f"[TippmixPro] Napi index: {len(index)} esemény ({date})")
+        return index, ok
+
+    def _parse_card(self, card, date):
+        link = card.find("a", href=True)
+        if not link:
+            return None
+
+        home = card.find(class_="team-home")
+        away = card.find(class_="team-away")
+
+        if home and away:
+            home, away = home.get_text(strip=True), away.get_text(strip=True)
+        else:
+            # "Hazai - Vendég" formátumú link szöveg
+            parts = re.split(r"\s+[-–]\s+", link.get_text(" ", strip=True), maxsplit=1)
+            if len(parts) != 2:
+                return None
+            home, away = parts
+
+        odds = {}
+        for b in card.find_all("button"):
+            label = b.find("span", class_="label")
+            value = b.find("span", class_="value")
+            if label and value:
+                try:
+                    odds[label.get_text(strip=True)] = float(value.get_text(strip=True))
+                except ValueError:
                     continue
 
-                title_text = title.get_text(strip=True).lower()
+        event_url = self.BASE_URL + link["href"]
 
-                if "1x2" in title_text or "végeredmény" in title_text:
-                    buttons = m.find_all("button")
-                    for b in buttons:
-                        label = b.find("span", class_="label")
-                        value = b.find("span", class_="value")
-                        if label and value:
-                            odds_map[label.get_text(strip=True)] = float(value.get_text(strip=True))
+        return {
+            "home": home,
+            "away": away,
+            "date": card.get("data-date", date),
+            "event_url": event_url,
+            "tmx_id": event_url,
+            "odds": odds
+        }
 
-            return odds_map
+    def _index_state(self, today):
+        """(friss-e, a mai napra használható index vagy None) – _index_lock alatt hívandó."""
+        if self._index is None or self._index_built[0] != today:
+            return False, None
+        return time.monotonic() - self._index_built[1] <= self.index_ttl, self._index
 
-        except Exception as e:
-            self.logger.error(f"[TippmixPro] get_odds ERROR: {e}")
-            return {}
+    def _get_index(self):
+        """
+        Napi index, index_ttl-enként / napváltáskor újraépítve.
+
+        A crawl a lock-on kívül fut: amíg egy szál újraépít, a többi a
+        korábbi (lejárt, de mai) indexet olvassa; mai index híján megvárja
+        az építést. Sikertelen vagy üres crawl nem kerül cache-be – a
+        korábbi index marad, és index_retry mp-ig nincs újabb próbálkozás.
+        """
+        today = datetime.date.today().isoformat()
+
+        with self._index_lock:
+            fresh, current = self._index_state(today)
+            if fresh:
+                return current
+
+        if current is not None:
+            if not self._build_lock.acquire(blocking=False):
+                return current
+        else:
+            self._build_lock.acquire()
+
+        try:
+            with self._index_lock:
+                fresh, current = self._index_state(today)
+                if fresh or time.monotonic() < self._index_retry_at:
+                    return current if current is not None else MatchIndex()
+
+            index, ok = self._crawl_index(today)
+
+            with self._index_lock:
+                if ok and len(index):
+                    self._index = index
+                    self._index_built = (today, time.monotonic())
+                    self._index_retry_at = 0.0
+                    return index
+
+                self._index_retry_at = time.monotonic() + self.index_retry
+                self.logger.warning(
+                    f"[TippmixPro] Napi index crawl sikertelen / üres – "
+                    f"{'a korábbi index marad' if current is not None else 'nincs index'}, "
+                    f"újrapróba {self.index_retry}s múlva"
+                )
+                return current if current is not None else MatchIndex()
+
+        finally:
+            self._build_lock.release()
+
+    def find_match(self, home_team, away_team, date=None):
+        """O(1) keresés a napi indexben. Vissza: index rekord vagy None."""
+        return self._get_index().get(home_team, away_team, date)
+
+    def get_today_matches(self):
+        """
+        A napi kínálat összes eseménye (MasterDataLoader számára).
+        index_mode nélkül nincs crawl → üres lista (a hívó meccsenként keres).
+        """
+        if not self.index_mode:
+            return []
+        return self._get_index().items()
+
+    def exists_on_tippmix(self, home_team, away_team, date=None):
+        """Szerepel-e a meccs a TippmixPro kínálatában."""
+        if self.index_mode:
+            return self.find_match(home_team, away_team, date) is not None
+
+        return self.search_match(home_team, away_team) is not None
 
     # ---------------------------------------------------------------
-    # 3) Fogadhatóság ellenőrzése
+    # 2) Esemény oldal letöltése + feldolgozása (egyszer)
     # ---------------------------------------------------------------
-    def is_available(self, event_url):
+    def fetch_event(self, event_url):
         """
-        Ellenőrzi, hogy az esemény fogadható-e.
+        Esemény oldal → TippmixEvent, event_ttl másodpercig cache-elve.
+        Hiba vagy nem 200-as válasz esetén None.
         """
+        now = time.monotonic()
+
+        with self._events_lock:
+            cached = self._events.get(event_url)
+            if cached and now - cached[0] < self.event_ttl:
+                return cached[1]
+
         try:
             r = self.session.get(event_url, timeout=5)
             if r.status_code != 200:
-                return False
+                return None
 
-            soup = BeautifulSoup(r.text, "html.parser")
+            event = TippmixEvent.from_html(event_url, r.text)
 
-            if soup.find(text=re.compile("Nincs fogadási lehetőség", re.IGNORECASE)):
-                return False
+        except Exception as e:
+            self.logger.error(f"[TippmixPro] fetch_event ERROR: {e}")
+            return None
 
-            # ha vannak odds gombok
-            if soup.find("button", {"class": "odd-button"}):
-                return True
+        with self._events_lock:
+            # lejárt bejegyzések takarítása
+            self._events = {
+                u: v for u, v in self._events.items()
+                if now - v[0] < self.event_ttl
+            }
+            self._events[event_url] = (now, event)
 
-            return False
+        return event
 
-        except:
-            return False
+    # ---------------------------------------------------------------
+    # 3) Esemény oddsok kinyerése
+    # ---------------------------------------------------------------
+    def get_odds(self, event_url):
+        """
+        Esemény oldalról kinyeri az 1X2 és egyéb oddsokat.
+        """
+        event = self.fetch_event(event_url)
+        return event.odds if event else {}
+
+    # ---------------------------------------------------------------
+    # 4) Fogadhatóság ellenőrzése
+    # ---------------------------------------------------------------
+    def is_available(self, event_url):
+        """
+        Ellenőrzi, hogy az esemény fogadható-e.
+        """
+        event = self.fetch_event(event_url)
+        return event.available if event else False
 
     # ---------------------------------------------------------------
-    # 4) FŐ METÓDUS – meccs teljes ellenőrzése
+    # 5) FŐ METÓDUS – meccs teljes ellenőrzése
     # ---------------------------------------------------------------
     def check_match(self, home_team, away_team):
         """
@@ -150,12 +394,13 @@ class TippmixProScraper:
                 "available": False
             }
 
-        odds = self.get_odds(event_url)
-        available = self.is_available(event_url)
+        # egyetlen letöltés + parse
+        event = self.fetch_event(event_url)
 
         return {
             "exists": True,
             "event_url": event_url,
-            "odds": odds,
-            "available": available
+            "odds": event.odds if event else {},
+            "available": event.available if event else False,
+            "markets": event.markets if event else {}
         }
@@ -5,7 +5,7 @@ from fastapi import FastAPI, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
 
 from backend.server.value_query_engine import ValueQueryEngine
-from backend.engine.ocr_engine import OCREngine
+from backend.core.engine_registry import get_engine
 from backend.pipeline.tip_generator_pro import TipGeneratorPro
 from backend.system.system_flow import SystemFlow
 from backend.utils.logger import get_logger
@@ -17,7 +17,6 @@ logger = get_logger()
 # AI modulok
 config = {}
 value_engine = ValueQueryEngine(config)
-ocr = OCREngine(config)
 flow = SystemFlow(config)
 tipper = TipGeneratorPro(config)
 
@@ -77,6 +76,12 @@ async def value_endpoint(home: str, away: str):
 @app.post("/api/ocr")
 async def ocr_endpoint(file: UploadFile = File(...)):
     img = await file.read()
+
+    # OCR (cv2, pytesseract) csak az első képnél töltődik be
+    ocr = get_engine("OCREngine", config)
+    if ocr is None:
+        return {"error": "OCR engine nem elérhető"}
+
     r = ocr.analyze_image(img)
     return r
 
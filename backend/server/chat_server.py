@@ -15,7 +15,7 @@ logger = get_logger()
 # rendszer komponensek
 config = {}
 flow = SystemFlow(config)
-aggregator = OddsAggregator()
+aggregator = OddsAggregator(config)
 tips = TipGeneratorPro(config)
 live_engine = LiveEngine()
 
@@ -26,7 +26,7 @@ class ValueQueryEngine:
         self.config = config or {}
 
         self.logger = get_logger()
-        self.aggregator = OddsAggregator()
+        self.aggregator = OddsAggregator(self.config)
         self.ensemble = EnsemblePipeline(config)
         self.tipgen = TipGeneratorPro(config)
         self.live_engine = LiveEngine(config)
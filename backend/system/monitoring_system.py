@@ -1,8 +1,12 @@
 # backend/system/monitoring_system.py
 
 import time
+import threading
 import traceback
+from contextlib import contextmanager
 from backend.utils.logger import get_logger
+from backend.scraper.rate_limiter import HostGuardRegistry
+from backend.system.tracing import Tracer
 
 class MonitoringSystem:
     """
@@ -38,17 +42,57 @@ class MonitoringSystem:
 
         # performance
         self.exec_times = []
+        self._timers = {}
+        self._local = threading.local()
+        self.tracer = Tracer.shared(self.config)
+
+        # forrásonkénti (host) scraper egészség
+        self.scraper_hosts = {}
 
     # --------------------------------------------------------------
     # PERF MEASUREMENT
     # --------------------------------------------------------------
-    def start_timer(self):
-        self._start = time.time()
+    def start_timer(self, label=None):
+        """
+        Címkénként (és szálanként) külön időmérő – egymásba ágyazott vagy
+        párhuzamos mérések nem írják felül egymást. Címke nélkül a szál
+        saját stackjére kerül, és a következő end_timer zárja le.
+        """
+        start = time.perf_counter()
+        if label is None:
+            self._unlabeled().append(start)
+        else:
+            self._timers[(threading.get_ident(), label)] = start
 
     def end_timer(self, label):
-        elapsed = round(time.time() - self._start, 4)
+        start = self._timers.pop((threading.get_ident(), label), None)
+        if start is None:
+            stack = self._unlabeled()
+            if not stack:
+                self.logger.warning(f"[MONITOR] end_timer({label}) start_timer nélkül")
+                return None
+            start = stack.pop()
+
+        elapsed = round(time.perf_counter() - start, 4)
         self.exec_times.append((label, elapsed))
         self.logger.info(f"[MONITOR] {label} took {elapsed} sec")
+        return elapsed
+
+    @contextmanager
+    def timer(self, label):
+        """with monitor.timer("daily_prediction"): ... – exec_times + tracer span."""
+        self.start_timer(label)
+        try:
+            with self.tracer.span(label, "run"):
+                yield
+        finally:
+            self.end_timer(label)
+
+    def _unlabeled(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
 
     # --------------------------------------------------------------
     # ERROR HANDLING
@@ -76,6 +120,8 @@ class MonitoringSystem:
     # SCRAPER HEALTH CHECK
     # --------------------------------------------------------------
     def check_scraper(self, data):
+        self.check_scraper_hosts()
+
         if data is None or data == {}:
             self.register_error("scrapers", "Scraper returned empty data")
             return False
@@ -83,6 +129,28 @@ class MonitoringSystem:
         self.register_success("scrapers")
         return True
 
+    def check_scraper_hosts(self):
+        """
+        Hostonkénti rate limiter / circuit breaker állapot.
+        Nyitott circuit → "scraper:<host>" hibás státusz.
+        """
+        self.scraper_hosts = HostGuardRegistry.shared().health()
+
+        healthy = True
+        for host, h in self.scraper_hosts.items():
+            component = f"scraper:{host}"
+            was_ok = self.engine_status.get(component, True)
+
+            if h["state"] == "open":
+                healthy = False
+                if was_ok:
+                    self.register_error(component, h["last_error"] or "circuit open")
+                self.engine_status[component] = False
+            else:
+                self.register_success(component)
+
+        return healthy
+
     # --------------------------------------------------------------
     # ENGINE HEALTH CHECK
     # --------------------------------------------------------------
@@ -151,5 +219,7 @@ class MonitoringSystem:
             "last_error": self.last_error,
             "error_count": self.error_count,
             "engine_status": self.engine_status,
-            "performance": self.exec_times
+            "scraper_hosts": self.scraper_hosts,
+            "performance": self.exec_times,
+            "tracing": self.tracer.summary()
         }
@@ -1,11 +1,13 @@
 # backend/system/scheduler.py
 
+import os
 import time
 import threading
 import traceback
 from datetime import datetime
 from backend.system.system_flow import SystemFlow
 from backend.system.monitoring_system import MonitoringSystem
+from backend.system.tracing import Tracer
 from backend.utils.logger import get_logger
 
 
@@ -24,6 +26,10 @@ class Scheduler:
     def __init__(self, config):
         self.config = config
         self.logger = get_logger()
+
+        # tracing indításkor, az engine-ek betöltése előtt
+        Tracer.shared(config)
+
         self.flow = SystemFlow(config)
         self.monitor = MonitoringSystem(config)
 
@@ -46,11 +52,10 @@ class Scheduler:
         try:
             self.logger.info("[SCHEDULER] Running daily prediction...")
 
-            self.monitor.start_timer()
-
-            result = self.flow.run_daily_prediction()
+            with self.monitor.timer("daily_prediction"):
+                result = self.flow.run_daily_prediction()
 
-            self.monitor.end_timer("daily_prediction")
+            self._export_trace("daily_prediction")
 
             if not self.monitor.check_ensemble(result.get("predictions")):
                 self.logger.warning("[SCHEDULER] Prediction failed → fallback")
@@ -65,11 +70,8 @@ class Scheduler:
         try:
             self.logger.info("[SCHEDULER] Running daily training...")
 
-            self.monitor.start_timer()
-
-            ok = self.flow.run_daily_retrain()
-
-            self.monitor.end_timer("daily_training")
+            with self.monitor.timer("daily_training"):
+                ok = self.flow.run_daily_retrain()
 
             if not ok:
                 self.monitor.register_error("scheduler_training", "training failed")
@@ -77,6 +79,21 @@ class Scheduler:
         except Exception as e:
             self.monitor.register_error("scheduler_training", e)
 
+    # -------------------------------------------------------------
+    # TRACE EXPORT (config["tracing"]["export_dir"])
+    # -------------------------------------------------------------
+    def _export_trace(self, label):
+        export_dir = self.config.get("tracing", {}).get("export_dir")
+        if not export_dir:
+            return
+
+        os.makedirs(export_dir, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M")
+        self.monitor.tracer.export_chrome_trace(os.path.join(export_dir, f"trace_{label}_{stamp}.json"))
+
+        # a következő futás külön trace-be kerül
+        self.monitor.tracer.reset()
+
     # -------------------------------------------------------------
     # MAIN LOOP (külön threadben fut)
     # -------------------------------------------------------------
@@ -6,6 +6,8 @@ from backend.pipeline.ensemble_pipeline import EnsemblePipeline
 from backend.pipeline.tip_pipeline import TipPipeline
 from backend.core.training_pipeline import TrainingPipeline
 from backend.core.daily_training_workflow import DailyTrainingWorkflow
+from backend.reporting.bankroll_updater import BankrollUpdater
+from backend.engine.custom_engine_loader import CustomEngineLoader
 from backend.utils.logger import get_logger
 
 class SystemFlow:
@@ -25,12 +27,17 @@ class SystemFlow:
         self.logger = get_logger()
         self.config = config
 
-        self.scraper = ResultScraper()
-        self.tmp = TippmixProScraper()
+        self.scraper = ResultScraper(config)
+        self.tmp = TippmixProScraper(config)
         self.ensemble = EnsemblePipeline(config)
         self.tip = TipPipeline(config)
         self.train_pipe = TrainingPipeline()
-        self.daily = DailyTrainingWorkflow(config)
+        self.daily = DailyTrainingWorkflow(config, results_loader=self.scraper)
+        self.bankroll = BankrollUpdater(config)
+
+        # engine DAG – az első predikciónál épül fel
+        self.engine_loader = CustomEngineLoader(config)
+        self.scheduler = None
 
     # --------------------------------------------------------------------
     # 1) napi odds + mérkőzés adat letöltés — (STUB, később készítjük)
@@ -78,25 +85,17 @@ class SystemFlow:
         }
 
     # --------------------------------------------------------------------
-    # 3) engine output STUB – később implementáljuk
+    # 3) engine outputok – DAG scheduler (független engine-ek párhuzamosan)
     # --------------------------------------------------------------------
     def _get_engine_outputs(self, matches):
-        return {
-            "mc3": {},
-            "lstm": {},
-            "gnn": {},
-            "poisson": {},
-            "rl": {},
-            "gameflow": {},
-            "injury": {},
-            "weather": {},
-            "market": {},
-            "anomaly": {},
-            "scorepredict": {},
-            "temporary": {},
-            "odds_engine": {},
-            "arbitrage": {}
-        }
+        """
+        Vissza: {DAG_OUTPUT név: {match_id: output}}
+        A futás riportja (kritikus út, bottleneck): self.scheduler.last_report
+        """
+        if self.scheduler is None:
+            self.scheduler = self.engine_loader.build_scheduler()
+
+        return self.scheduler.run({"match_data": matches})
 
     # --------------------------------------------------------------------
     # 4) Odds kinyerése
@@ -131,3 +130,32 @@ class SystemFlow:
     # --------------------------------------------------------------------
     def run_daily_retrain(self):
         self.daily.run_daily_training()
+
+    # --------------------------------------------------------------------
+    # 8) Napi elszámolás – tárolt tippek + eredmények
+    # --------------------------------------------------------------------
+    def settle_day(self, date, bankroll):
+        """
+        A nap tippjeinek elszámolása: bankroll frissítés + tanító címkék.
+        Ugyanazok a rekordok mennek a BankrollUpdaterbe és a LabelGeneratorba,
+        mint amiket a DailyTrainingWorkflow a results_loaderből kap.
+        """
+        records = self.scraper.load_daily_results(date)
+
+        # tippenként – egy meccsre több tipp is eshet
+        bankroll_end = self.bankroll.settle_records(bankroll, records)
+        labels = self.daily.label_gen.generate_labels(records)
+
+        self.logger.info(
+            f"[SystemFlow] {date} elszámolva: {len(records)} tipp, "
+            f"bankroll {bankroll} → {bankroll_end}"
+        )
+
+        return {
+            "date": date,
+            "settled": len(records),
+            "bankroll_start": bankroll,
+            "bankroll_end": bankroll_end,
+            "results": records,
+            "labels": labels,
+        }
@@ -0,0 +1,267 @@
+# backend/system/tracing.py
+
+import os
+import json
+import time
+import bisect
+import threading
+import functools
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+from backend.utils.logger import get_logger
+
+
+class Tracer:
+    """
+    TRACER – stage / engine szintű profilozás
+    -----------------------------------------
+    Feladata:
+        • span(name) context manager – egymásba ágyazható, szálanként
+          saját span stackkel (párhuzamos stage-ek nem írják felül egymást)
+        • névenkénti hívásszám, összes / min / max idő, latency hisztogram
+        • memória delta span-enként (tracemalloc, opcionális)
+        • Chrome trace export (chrome://tracing, Perfetto) + összesítő
+
+    Config (config["tracing"]):
+        enabled     – False (bekapcsolás: "enabled": true)
+        memory      – False (tracemalloc lassít, csak célzott méréshez)
+        max_events  – 100000 (gyűrűpuffer: a Chrome trace a legutóbbi
+                      max_events spant tartja meg, a régebbiek kiesnek;
+                      a statisztika minden spanből gyűlik)
+        buckets_ms  – hisztogram felső határok ms-ben
+
+    Indításkor egyszer: Tracer.shared(config). A @traced() dekorátor csak
+    olvassa a megosztott példányt – amíg nincs inicializálva, nem mér.
+
+    Process pool workerekben keletkező spanek a worker folyamatban
+    maradnak; a szülő a teljes pool futást egy spanként látja.
+    """
+
+    BUCKETS_MS = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, config=None):
+        self.logger = get_logger()
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._origin = time.perf_counter()
+
+        self.stats = {}
+        self.dropped = 0
+
+        self.configure(config)
+
+    @classmethod
+    def shared(cls, config=None):
+        """
+        Folyamat-szintű tracer. "tracing" szekciót tartalmazó config
+        a már létező példányt is újrakonfigurálja.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(config)
+            elif config and "tracing" in config and config["tracing"] != cls._shared.config.get("tracing"):
+                cls._shared.configure(config)
+            return cls._shared
+
+    @classmethod
+    def current(cls):
+        """A megosztott tracer, vagy None, ha még nincs inicializálva."""
+        return cls._shared
+
+    def configure(self, config=None):
+        self.config = config or {}
+
+        cfg = self.config.get("tracing", {})
+        self.enabled = cfg.get("enabled", False)
+        self.memory = cfg.get("memory", False)
+        self.max_events = cfg.get("max_events", 100_000)
+        buckets = list(cfg.get("buckets_ms", self.BUCKETS_MS))
+
+        if self.enabled and self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+        with self._lock:
+            # eltérő bucket határokkal a régi hisztogramok nem összevethetők
+            if buckets != getattr(self, "buckets", buckets):
+                self.stats = {}
+            self.buckets = buckets
+            self.events = deque(getattr(self, "events", ()), maxlen=self.max_events)
+
+    # ------------------------------------------------------------------
+    # SPAN
+    # ------------------------------------------------------------------
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name, category="stage", **args):
+        """
+        with tracer.span("models", matches=32):
+            ...
+        A kivétel továbbmegy, a span "error" mezővel rögzül.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        stack = self._stack()
+        parent = stack[-1] if stack else None
+        stack.append(name)
+
+        mem_start = tracemalloc.get_traced_memory()[0] if self.memory else 0
+        start = time.perf_counter()
+        error = None
+
+        try:
+            yield
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            mem_delta = tracemalloc.get_traced_memory()[0] - mem_start if self.memory else 0
+            stack.pop()
+
+            self._record(name, category, start, elapsed, mem_delta, parent, error, args)
+
+    def _record(self, name, category, start, elapsed, mem_delta, parent, error, args):
+        ms = elapsed * 1000.0
+
+        with self._lock:
+            s = self.stats.get(name)
+            if s is None:
+                s = self.stats[name] = {
+                    "category": category,
+                    "count": 0,
+                    "errors": 0,
+                    "total_s": 0.0,
+                    "min_ms": ms,
+                    "max_ms": ms,
+                    "mem_delta_bytes": 0,
+                    "hist": [0] * (len(self.buckets) + 1),
+                }
+
+            s["count"] += 1
+            s["errors"] += error is not None
+            s["total_s"] += elapsed
+            s["min_ms"] = min(s["min_ms"], ms)
+            s["max_ms"] = max(s["max_ms"], ms)
+            s["mem_delta_bytes"] += mem_delta
+            s["hist"][bisect.bisect_left(self.buckets, ms)] += 1
+
+            if len(self.events) == self.events.maxlen:
+                if not self.dropped:
+                    self.logger.warning(
+                        f"[Tracer] max_events ({self.max_events}) elérve – "
+                        f"a Chrome trace innentől a legrégebbi spaneket dobja el"
+                    )
+                self.dropped += 1
+
+            event_args = dict(args)
+            if parent:
+                event_args["parent"] = parent
+            if error:
+                event_args["error"] = error
+            if self.memory:
+                event_args["mem_delta_bytes"] = mem_delta
+
+            self.events.append({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": round((start - self._origin) * 1e6, 1),
+                "dur": round(elapsed * 1e6, 1),
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": event_args,
+            })
+
+    # ------------------------------------------------------------------
+    # ÖSSZESÍTÉS / EXPORT
+    # ------------------------------------------------------------------
+    def summary(self):
+        """{name: {count, errors, total_s, mean_ms, min_ms, max_ms, mem_delta_bytes, hist}}"""
+        labels = [f"<={b}ms" for b in self.buckets] + [f">{self.buckets[-1]}ms"]
+
+        with self._lock:
+            out = {}
+            for name, s in self.stats.items():
+                out[name] = {
+                    "category": s["category"],
+                    "count": s["count"],
+                    "errors": s["errors"],
+                    "total_s": round(s["total_s"], 4),
+                    "mean_ms": round(s["total_s"] * 1000.0 / s["count"], 3),
+                    "min_ms": round(s["min_ms"], 3),
+                    "max_ms": round(s["max_ms"], 3),
+                    "mem_delta_bytes": s["mem_delta_bytes"],
+                    "hist": {l: n for l, n in zip(labels, s["hist"]) if n},
+                }
+
+        return dict(sorted(out.items(), key=lambda kv: -kv[1]["total_s"]))
+
+    def export_chrome_trace(self, path):
+        """Chrome trace JSON (chrome://tracing / ui.perfetto.dev), az összesítővel együtt."""
+        with self._lock:
+            events = list(self.events)
+            dropped = self.dropped
+
+        payload = {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"summary": self.summary(), "dropped_events": dropped},
+        }
+
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            self.logger.info(f"[Tracer] Chrome trace mentve: {path} ({len(events)} span)")
+        except Exception as e:
+            self.logger.error(f"[Tracer] Chrome trace mentési hiba: {e}")
+
+        return path
+
+    def reset(self):
+        with self._lock:
+            self.events = deque(maxlen=self.max_events)
+            self.stats = {}
+            self.dropped = 0
+            self._origin = time.perf_counter()
+
+
+# ======================================================================
+# DEKORÁTOR – engine predict() és egyéb metódusok
+# ======================================================================
+def traced(name=None, category="engine"):
+    """
+    @traced()
+    def predict(self, match_data): ...
+
+    A span neve alapból a metódus qualname-je (pl. "PoissonEngine.predict").
+    A megosztott tracert nem hozza létre: Tracer.shared(config) nélkül
+    (vagy kikapcsolt tracinggel) a hívás mérés nélkül fut.
+    """
+    def wrap(fn):
+        span_name = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            tracer = Tracer.current()
+            if tracer is None or not tracer.enabled:
+                return fn(*args, **kwargs)
+
+            with tracer.span(span_name, category):
+                return fn(*args, **kwargs)
+
+        return inner
+
+    return wrap
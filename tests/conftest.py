@@ -0,0 +1,53 @@
+# tests/conftest.py
+
+import pytest
+
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+
+class FakeTransport(HTTPAdapter):
+    """
+    Hálózat nélküli transport: a respond(request) → (status, headers, body)
+    függvény adja a választ, a kimenő kéréseket a calls lista gyűjti.
+    """
+
+    def __init__(self, respond):
+        super().__init__()
+        self.respond = respond
+        self.calls = []
+
+    def send(self, request, **kwargs):
+        self.calls.append(request)
+        status, headers, body = self.respond(request)
+
+        r = Response()
+        r.status_code = status
+        r.headers = CaseInsensitiveDict(headers or {})
+        r._content = body if isinstance(body, bytes) else str(body).encode("utf-8")
+        r.url = request.url
+        r.request = request
+        return r
+
+
+def mount_fake(session, respond):
+    transport = FakeTransport(respond)
+    session.mount("http://", transport)
+    session.mount("https://", transport)
+    return transport
+
+
+@pytest.fixture(autouse=True)
+def reset_shared():
+    """A folyamat-szintű singletonok tesztenként tiszta állapotból indulnak."""
+    from backend.scraper.http_cache import HttpCache
+    from backend.scraper.rate_limiter import HostGuardRegistry
+    from backend.system.tracing import Tracer
+
+    singletons = (HttpCache, HostGuardRegistry, Tracer)
+    for cls in singletons:
+        cls._shared = None
+    yield
+    for cls in singletons:
+        cls._shared = None
@@ -0,0 +1,75 @@
+# tests/test_closing_line.py
+
+import numpy as np
+import pytest
+
+from backend.engine.closing_line_predictor_engine import ClosingLinePredictor, QUANTILES
+
+
+TIPS = {
+    "a": {"current_odds": 1.82, "drift": 0.06, "sharp_money": 0.3, "volatility": 0.12,
+          "momentum": 0.15, "probability": 0.61},
+    "b": {"current_odds": 2.40, "drift": -0.02, "sharp_money": -0.4, "volatility": 0.05},
+    "c": {"current_odds": 1.05, "drift": 0.30},                  # max_drift + 1.01 padló
+    "d": {"current_odds": 3.10, "drift": -0.50},                 # negatív vágás
+}
+
+
+def predictor(**conf):
+    return ClosingLinePredictor({"closing_line": {"seed": 3, **conf}})
+
+
+def test_noiseless_slate_equals_scalar_reference():
+    clp = predictor(noise=0.0, simulations=50)
+    out = clp.predict_slate(TIPS)
+
+    for tip_id, d in TIPS.items():
+        scalar = clp._simulate_drift(
+            d["current_odds"], d.get("drift", 0), d.get("sharp_money", 0),
+            d.get("volatility", 0), d.get("momentum", 0)
+        )
+        assert out[tip_id]["expected_closing"] == pytest.approx(scalar, abs=1e-4)
+        assert set(out[tip_id]["closing_quantiles"].values()) == {round(scalar, 4)}
+
+
+def test_noisy_slate_mean_matches_scalar_loop():
+    clp = predictor(noise=0.03, simulations=20_000)
+    out = clp.predict_slate(TIPS)
+
+    np.random.seed(5)
+    for tip_id, d in TIPS.items():
+        runs = [
+            clp._simulate_drift(
+                d["current_odds"], d.get("drift", 0), d.get("sharp_money", 0),
+                d.get("volatility", 0), d.get("momentum", 0)
+            )
+            for _ in range(5_000)
+        ]
+        assert out[tip_id]["expected_closing"] == pytest.approx(np.mean(runs), abs=4e-3)
+
+
+def test_chunking_does_not_change_result():
+    whole = predictor(simulations=400).predict_slate(TIPS)
+    chunked = predictor(simulations=400, chunk_elems=400).predict_slate(TIPS)
+
+    assert whole == chunked
+
+
+def test_parallel_shards_match_serial_shards():
+    serial = predictor(parallel=True, workers=1, shard_size=1).predict_slate(TIPS)
+    parallel = predictor(parallel=True, workers=2, shard_size=1).predict_slate(TIPS)
+
+    assert serial == parallel
+
+
+def test_predict_is_single_tip_slate():
+    clp = predictor()
+    assert clp.predict(TIPS["a"]) == predictor().predict_slate({"x": TIPS["a"]})["x"]
+
+
+def test_quantiles_are_ordered_and_clv_consistent():
+    out = predictor(simulations=2_000).predict_slate(TIPS)["a"]
+
+    q = [out["closing_quantiles"][f"p{p}"] for p in QUANTILES]
+    assert q == sorted(q)
+    assert out["clv"] == pytest.approx((out["expected_closing"] - 1.82) / 1.82, abs=1e-4)
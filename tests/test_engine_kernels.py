@@ -0,0 +1,94 @@
+# tests/test_engine_kernels.py
+
+import numpy as np
+import pytest
+
+from backend.core import engine_kernels as kernels
+from backend.engine.injury_engine import InjuryEngine
+from backend.engine.gameflow_engine import GameflowEngine
+from backend.engine.public_money_engine import PublicMoneyEngine
+from backend.engine.psychological_bias_engine import PsychologicalBiasEngine
+from backend.engine.quantum_synth_engine import QuantumSynthEngine
+
+
+@pytest.fixture
+def slate():
+    rng = np.random.default_rng(11)
+    prob = rng.uniform(-0.2, 1.2, 500)     # a tartományon kívüli értékek is
+    quality = rng.uniform(0.0, 1.0, 500)
+    return prob, quality
+
+
+# ----------------------------------------------------------------------
+# TÖMB ≡ ELEMENKÉNTI SKALÁR KÉPLET
+# ----------------------------------------------------------------------
+def test_normalize_matches_scalar(slate):
+    prob, _ = slate
+    out = kernels.normalize(prob, 1.15)
+
+    expected = [max(0.01, min(0.99, p * 1.15)) for p in prob]
+    assert out == pytest.approx(expected, abs=0)
+
+
+def test_confidence_matches_scalar(slate):
+    prob, quality = slate
+    weights = {"quality": 0.55, "stability": 0.3, "prob": 0.15}
+    out = kernels.confidence(prob, quality, weights, 0.58)
+
+    expected = [
+        max(0.58, min(1.0, q * 0.55 + (1 - abs(p - 0.5)) * 0.3 + p * 0.15))
+        for p, q in zip(prob, quality)
+    ]
+    assert out == pytest.approx(expected, rel=1e-12)
+
+
+def test_risk_matches_scalar(slate):
+    prob, quality = slate
+    out = kernels.risk(prob, quality, {"prob": 0.6, "conf": 0.4})
+
+    expected = [min(1.0, max(0.0, (1 - p) * 0.6 + (1 - c) * 0.4)) for p, c in zip(prob, quality)]
+    assert out == pytest.approx(expected, rel=1e-12)
+
+
+def test_missing_weights():
+    # confidence: hiányzó súly 0; risk: hiányzó súly 0.5
+    assert kernels.confidence(0.7, 0.9, {"quality": 1.0}) == pytest.approx(0.9)
+    assert kernels.risk(0.7, 0.9, {}) == pytest.approx(0.3 * 0.5 + 0.1 * 0.5)
+
+
+def test_scalar_input_and_broadcast_quality():
+    assert float(kernels.normalize(1.5)) == 0.99
+    assert float(kernels.stability(0.8)) == pytest.approx(0.7)
+
+    prob = np.array([0.2, 0.5, 0.9])
+    out = kernels.confidence(prob, 0.8, {"quality": 0.5, "stability": 0.5})
+    assert out.shape == (3,)
+    assert out[1] == pytest.approx(0.9)
+
+
+# ----------------------------------------------------------------------
+# ENGINE EGYÜTTHATÓK ≡ a korábbi privát _confidence / _risk
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("engine_cls, quality_key, quality_default, scalar_conf", [
+    (InjuryEngine, "injury_data_quality", 0.75, lambda p, q: q * 0.6 + (1 - abs(p - 0.5)) * 0.4),
+    (GameflowEngine, "data_quality", 0.85, lambda p, q: (1 - abs(p - 0.5)) * 0.3 + q * 0.7),
+    (PublicMoneyEngine, "public_data_quality", 0.75, lambda p, q: q * 0.6 + (1 - abs(p - 0.5)) * 0.4),
+    (PsychologicalBiasEngine, "bias_data_quality", 0.8, lambda p, q: q * 0.55 + (1 - abs(p - 0.5)) * 0.45),
+    (QuantumSynthEngine, "data_quality", 0.8, lambda p, q: p * 0.6 + q * 0.4),
+])
+def test_engine_weights_match_previous_scalar(slate, engine_cls, quality_key, quality_default, scalar_conf):
+    engine = engine_cls({})
+    assert engine.QUALITY_KEY == quality_key
+    assert engine.QUALITY_DEFAULT == quality_default
+
+    prob = kernels.normalize(slate[0])
+    quality = slate[1]
+
+    conf = kernels.confidence(prob, quality, engine.CONF_WEIGHTS, engine.min_conf)
+    risk = kernels.risk(prob, conf, engine.RISK_WEIGHTS)
+
+    for i in range(len(prob)):
+        c = max(engine.min_conf, min(1.0, scalar_conf(prob[i], quality[i])))
+        r = min(1.0, max(0.0, (1 - prob[i]) * 0.5 + (1 - c) * 0.5))
+        assert conf[i] == pytest.approx(c, rel=1e-12)
+        assert risk[i] == pytest.approx(r, rel=1e-12)
@@ -0,0 +1,123 @@
+# tests/test_engine_registry.py
+
+import sys
+import types
+
+import pytest
+
+from backend.core import engine_registry
+from backend.core.engine_registry import EngineRegistry
+from backend.engine.custom_engine_loader import CustomEngineLoader
+
+
+class StubEngine:
+    def __init__(self, config):
+        self.config = config
+
+
+class OtherEngine(StubEngine):
+    pass
+
+
+class HeavyEngine(StubEngine):
+    pass
+
+
+class BrokenEngine:
+    def __init__(self, config):
+        raise RuntimeError("nincs modell fájl")
+
+
+MANIFEST = {
+    "StubEngine": ("stub_engines", "StubEngine", "stub"),
+    "OtherEngine": ("stub_engines", "OtherEngine", "other"),
+    "HeavyEngine": ("stub_engines", "HeavyEngine", "heavy"),
+    "BrokenEngine": ("stub_engines", "BrokenEngine", None),
+    "MissingEngine": ("stub_engines_nincs_ilyen", "MissingEngine", None),
+}
+
+
+@pytest.fixture(autouse=True)
+def stub_modules(monkeypatch):
+    module = types.ModuleType("stub_engines")
+    for cls in (StubEngine, OtherEngine, HeavyEngine, BrokenEngine):
+        setattr(module, cls.__name__, cls)
+
+    monkeypatch.setitem(sys.modules, "stub_engines", module)
+    monkeypatch.setattr(engine_registry, "ON_DEMAND", frozenset({"HeavyEngine"}))
+    monkeypatch.setattr(EngineRegistry, "_shared", EngineRegistry(MANIFEST))
+
+
+@pytest.fixture
+def registry():
+    return EngineRegistry.shared()
+
+
+# ----------------------------------------------------------------------
+# PÉLDÁNYOK / UJJLENYOMAT
+# ----------------------------------------------------------------------
+def test_same_section_shares_instance(registry):
+    a = registry.get("StubEngine", {"stub": {"x": 1}, "other": {"y": 1}})
+    b = registry.get("StubEngine", {"stub": {"x": 1}, "other": {"y": 2}})
+
+    # csak a saját config szekció számít
+    assert a is b
+
+
+def test_different_section_gets_separate_instance(registry):
+    a = registry.get("StubEngine", {"stub": {"x": 1}})
+    b = registry.get("StubEngine", {"stub": {"x": 2}})
+
+    assert a is not b
+    assert b.config["stub"]["x"] == 2
+    assert registry.get("StubEngine", {"stub": {"x": 1}}) is a
+
+
+def test_unknown_name_returns_none(registry):
+    assert registry.get("NincsIlyenEngine", {}) is None
+
+
+# ----------------------------------------------------------------------
+# LOAD_ALL / HIBÁK
+# ----------------------------------------------------------------------
+def test_load_all_skips_on_demand_and_broken(registry):
+    engines = registry.load_all({})
+
+    assert set(engines) == {"StubEngine", "OtherEngine"}
+    assert "HeavyEngine" in registry.load_all({}, include_on_demand=True)
+
+
+def test_load_failures_recorded_and_none_returned(registry):
+    assert registry.get("BrokenEngine", {}) is None
+    assert registry.get("MissingEngine", {}) is None
+
+    assert "nincs modell fájl" in registry.errors["BrokenEngine"]
+    assert "stub_engines_nincs_ilyen" in registry.errors["MissingEngine"]
+
+
+def test_nothing_imported_until_requested(registry):
+    assert registry.loaded() == []
+
+    registry.get("OtherEngine", {})
+    assert registry.loaded() == ["OtherEngine"]
+
+
+# ----------------------------------------------------------------------
+# CUSTOM ENGINE LOADER
+# ----------------------------------------------------------------------
+def test_loader_get_engine_loads_only_requested(registry):
+    loader = CustomEngineLoader({"stub": {"x": 1}})
+
+    engine = loader.get_engine("StubEngine")
+
+    assert isinstance(engine, StubEngine)
+    assert registry.loaded() == ["StubEngine"]
+    assert loader.get_engine("StubEngine") is engine
+    assert CustomEngineLoader({"stub": {"x": 1}}).get_engine("StubEngine") is engine
+
+
+def test_loader_records_missing_engine(registry):
+    loader = CustomEngineLoader({})
+
+    assert loader.get_engine("BrokenEngine") is None
+    assert "nincs modell fájl" in loader.get_errors()["BrokenEngine"]
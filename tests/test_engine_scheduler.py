@@ -0,0 +1,118 @@
+# tests/test_engine_scheduler.py
+
+import time
+
+import pytest
+
+from backend.core.engine_scheduler import EngineScheduler
+from backend.core.match_frame import MatchFrame
+from backend.engine.temporary_engine import TemporaryEngine
+
+
+MATCHES = {
+    "m1": {"xg_home": 1.4, "xg_away": 0.9},
+    "m2": {"xg_home": 1.1, "xg_away": 1.3},
+}
+
+
+def scheduler(parallel=True, fallback=None):
+    config = {"engine_scheduler": {"parallel": parallel, "workers": 4}}
+    return EngineScheduler(config, fallback=fallback or TemporaryEngine())
+
+
+def goals(frame):
+    assert isinstance(frame, MatchFrame)
+    total = frame.col("xg_home", 0.0) + frame.col("xg_away", 0.0)
+    return {match_id: float(total[i]) for match_id, i in frame.index.items()}
+
+
+def build(s):
+    s.add("goals", goals, ("match_frame",))
+    s.add("double", lambda g: {k: 2 * v for k, v in g.items()}, ("goals",))
+    s.add("combo", lambda d: {k: d["goals"][k] + d["double"][k] for k in d["goals"]},
+          ("goals", "double"))
+    return s
+
+
+def test_output_contains_only_engine_outputs():
+    out = build(scheduler()).run({"match_data": MATCHES})
+
+    assert set(out) == {"goals", "double", "combo"}
+    assert out["combo"]["m1"] == pytest.approx(3 * 2.3)
+
+
+def test_source_named_like_node_is_not_returned():
+    frame = MatchFrame.from_dict(MATCHES)
+    s = build(scheduler())
+
+    out = s.run({"match_data": MATCHES, "match_frame": frame})
+    assert "match_frame" not in out and "match_data" not in out
+
+
+def test_shared_intermediate_computed_once():
+    calls = []
+    s = scheduler()
+    s.add("a", lambda f: calls.append(f) or {}, ("match_frame",))
+    s.add("b", lambda f: calls.append(f) or {}, ("match_frame",))
+
+    s.run({"match_data": MATCHES})
+    assert len(calls) == 2 and calls[0] is calls[1]
+
+
+def test_raising_node_falls_back_and_dependents_run():
+    def boom(frame):
+        raise RuntimeError("engine down")
+
+    s = scheduler()
+    s.add("goals", boom, ("match_frame",))
+    s.add("after", lambda g: sorted(g), ("goals",))
+
+    out = s.run({"match_data": MATCHES})
+
+    assert set(out["goals"]) == {"m1", "m2"}
+    assert out["goals"]["m1"]["source"] == "TemporaryEngine"
+    assert out["after"] == ["m1", "m2"]
+    assert s.last_report["fallbacks"] == ["goals"]
+    assert s.last_report["nodes"]["goals"]["status"] == "fallback"
+
+
+def test_missing_input_uses_fallback():
+    s = scheduler()
+    s.add("weather", lambda w: w, ("weather_feed",))
+
+    out = s.run({"match_data": MATCHES})
+
+    assert s.last_report["missing_inputs"] == ["weather_feed"]
+    assert out["weather"]["m2"]["source"] == "TemporaryEngine"
+    assert "weather_feed" not in out
+
+
+def test_cycle_raises():
+    s = scheduler()
+    s.add("a", lambda x: x, ("b",))
+    s.add("b", lambda x: x, ("a",))
+
+    with pytest.raises(ValueError):
+        s.run({"match_data": MATCHES})
+
+
+def test_parallel_matches_serial():
+    serial = build(scheduler(parallel=False)).run({"match_data": MATCHES})
+    parallel = build(scheduler(parallel=True)).run({"match_data": MATCHES})
+
+    assert serial == parallel
+
+
+def test_independent_nodes_overlap_and_report_critical_path():
+    s = scheduler()
+    s.add("slow_a", lambda f: time.sleep(0.1) or {}, ("match_frame",))
+    s.add("slow_b", lambda f: time.sleep(0.1) or {}, ("match_frame",))
+    s.add("tail", lambda d: {}, ("slow_a", "slow_b"))
+
+    s.run({"match_data": MATCHES})
+    report = s.last_report
+
+    assert report["wall_s"] < report["serial_s"]
+    assert report["critical_path"][0] == "match_frame"
+    assert report["critical_path"][-1] == "tail"
+    assert report["bottleneck"] in ("slow_a", "slow_b")
@@ -0,0 +1,106 @@
+# tests/test_http_cache.py
+
+import time
+
+from backend.scraper.http_cache import HttpCache, CachedSession
+from backend.scraper.rate_limiter import HostGuardRegistry
+from backend.scraper.odds_aggregator import OddsAggregator
+
+from conftest import mount_fake
+
+
+URL = "http://example.test/page"
+
+
+def _session(config, respond):
+    session = CachedSession(cache=HttpCache(config), guards=HostGuardRegistry({}))
+    return session, mount_fake(session, respond)
+
+
+def test_configured_ttl_is_respected():
+    config = {"http_cache": {"ttl": {"example.test": 0.2}}}
+    session, transport = _session(config, lambda req: (200, {}, "body"))
+
+    assert session.get(URL).text == "body"
+    assert session.get(URL).text == "body"
+    assert len(transport.calls) == 1
+
+    time.sleep(0.25)
+    session.get(URL)
+    assert len(transport.calls) == 2
+
+
+def test_zero_ttl_disables_caching():
+    config = {"http_cache": {"ttl": {"example.test": 0}}}
+    session, transport = _session(config, lambda req: (200, {}, "body"))
+
+    session.get(URL)
+    session.get(URL)
+    assert len(transport.calls) == 2
+
+
+def test_scraper_config_reaches_shared_cache():
+    # egy config nélküli komponens hozza létre előbb a megosztott cache-t
+    HttpCache.shared()
+
+    OddsAggregator({"http_cache": {"default_ttl": 7, "ttl": {"example.test": 3}, "max_bytes": 1024}})
+
+    cache = HttpCache.shared()
+    assert cache.ttl_for(URL) == 3
+    assert cache.ttl_for("http://other.test/") == 7
+    assert cache.max_bytes == 1024
+
+
+def test_configless_scraper_keeps_existing_settings():
+    HttpCache.shared({"http_cache": {"default_ttl": 7}})
+    OddsAggregator()
+    assert HttpCache.shared().default_ttl == 7
+
+
+def test_etag_revalidation_serves_cached_body_on_304():
+    def respond(req):
+        if req.headers.get("If-None-Match") == '"v1"':
+            return 304, {}, b""
+        return 200, {"ETag": '"v1"'}, "original"
+
+    session, transport = _session({"http_cache": {"ttl": {"example.test": 0.05}}}, respond)
+
+    session.get(URL)
+    time.sleep(0.08)
+    r = session.get(URL)
+
+    assert r.status_code == 200
+    assert r.text == "original"
+    assert transport.calls[-1].headers["If-None-Match"] == '"v1"'
+    assert session.cache.stats()["revalidated"] == 1
+
+    # a 304 újra frissnek jelöli a bejegyzést
+    session.get(URL)
+    assert len(transport.calls) == 2
+
+
+def test_expired_entry_without_validator_is_refetched():
+    bodies = iter(["first", "second"])
+    session, transport = _session(
+        {"http_cache": {"ttl": {"example.test": 0.05}}},
+        lambda req: (200, {}, next(bodies))
+    )
+
+    session.get(URL)
+    time.sleep(0.08)
+    assert session.get(URL).text == "second"
+    assert "If-None-Match" not in transport.calls[-1].headers
+
+
+def test_lru_eviction_respects_max_bytes():
+    session, _ = _session(
+        {"http_cache": {"max_bytes": 300, "default_ttl": 60}},
+        lambda req: (200, {}, "x" * 100)
+    )
+
+    for i in range(5):
+        session.get(f"http://example.test/{i}")
+
+    stats = session.cache.stats()
+    assert stats["bytes"] <= 300
+    assert stats["evictions"] >= 2
@@ -0,0 +1,164 @@
+# tests/test_match_frame.py
+
+import numpy as np
+import pytest
+
+from backend.core.match_frame import MatchFrame, as_frame
+from backend.engine.injury_engine import InjuryEngine
+from backend.engine.gameflow_engine import GameflowEngine
+from backend.engine.public_money_engine import PublicMoneyEngine
+from backend.engine.psychological_bias_engine import PsychologicalBiasEngine
+from backend.engine.quantum_synth_engine import QuantumSynthEngine
+
+
+MATCHES = {
+    "a": {"injury_home_weight": 0.4, "missing_key_home": 2, "depth_away": 0.5,
+          "pace": 1.2, "momentum_home": 0.7, "press_away": 0.3,
+          "public_pct": 0.8, "odds_open": 2.4, "odds_now": 2.1,
+          "fav_popularity": 0.9, "hype_factor": 0.2, "data_quality": 0.6},
+    "b": {"injury_away_weight": 0.9, "missing_key_away": 3, "injury_data_quality": 0.95,
+          "momentum_away": 0.9, "sharp_pct": 0.2, "bookmaker_shift": 0.4,
+          "longshot_popularity": 0.1, "recency_strength": 0.7, "form_factor": 0.8},
+    "c": {"name": "nem szám", "pace": None, "xg_ratio": 0.6},   # nem numerikus → default
+    "d": {},                                                     # üres sor
+}
+
+
+def _clip(p):
+    return float(max(0.01, min(0.99, p)))
+
+
+def _conf_risk(prob, quality, w_quality, w_stability, min_conf):
+    """A predict_frame előtti skalár _confidence / _risk."""
+    conf = quality * w_quality + (1 - abs(prob - 0.5)) * w_stability
+    conf = float(max(min_conf, min(1.0, conf)))
+    risk = float(min(1.0, max(0.0, (1 - prob) * 0.5 + (1 - conf) * 0.5)))
+    return conf, risk
+
+
+# ----------------------------------------------------------------------
+# SKALÁR REFERENCIÁK (a dict alapú, soronkénti implementáció)
+# ----------------------------------------------------------------------
+def _injury_ref(engine, data):
+    home_drop = (data.get("injury_home_weight", 0.0) * 0.5 + data.get("missing_key_home", 0) * 0.2
+                 - data.get("depth_home", 0.8) * engine.depth_scaling)
+    away_drop = (data.get("injury_away_weight", 0.0) * 0.5 + data.get("missing_key_away", 0) * 0.2
+                 - data.get("depth_away", 0.8) * engine.depth_scaling)
+    prob = _clip(0.5 + (away_drop - home_drop) * engine.scaling)
+    return (prob, *_conf_risk(prob, data.get("injury_data_quality", 0.75), 0.6, 0.4, engine.min_conf))
+
+
+def _gameflow_ref(engine, data):
+    flow = (
+        (data.get("momentum_home", 0.5) - data.get("momentum_away", 0.5)) * engine.momentum_weight +
+        (data.get("press_home", 0.5) - data.get("press_away", 0.5)) * engine.press_weight +
+        (data.get("pace", 1.0) - 1.0) * engine.pace_weight
+    )
+    prob = _clip(0.5 + flow * engine.flow_scaling)
+    return (prob, *_conf_risk(prob, data.get("data_quality", 0.85), 0.7, 0.3, engine.min_conf))
+
+
+def _public_ref(engine, data):
+    shift = (
+        (data.get("public_pct", 0.5) - 0.5) * -engine.public_scaling +
+        (data.get("sharp_pct", 0.5) - 0.5) * engine.sharp_scaling +
+        (data.get("odds_open", 2.0) - data.get("odds_now", 2.0)) * engine.odds_move_scaling +
+        data.get("bookmaker_shift", 0.0) * 0.10
+    )
+    prob = _clip(0.5 + shift)
+    return (prob, *_conf_risk(prob, data.get("public_data_quality", 0.75), 0.6, 0.4, engine.min_conf))
+
+
+def _psybias_ref(engine, data):
+    shift = (
+        (0.5 - data.get("fav_popularity", 0.5)) * engine.fav_scaling +
+        (0.5 - data.get("longshot_popularity", 0.5)) * engine.longshot_scaling +
+        (0.5 - data.get("recency_strength", 0.5)) * engine.recency_scaling +
+        (0.5 - data.get("herding_strength", 0.5)) * engine.herding_scaling +
+        (0.5 - data.get("hype_factor", 0.5)) * engine.hype_scaling
+    )
+    prob = _clip(0.5 + shift)
+    return (prob, *_conf_risk(prob, data.get("bias_data_quality", 0.8), 0.55, 0.45, engine.min_conf))
+
+
+def _numeric(data):
+    return {k: v for k, v in data.items() if isinstance(v, (int, float))}
+
+
+REFERENCES = [
+    (InjuryEngine, _injury_ref),
+    (GameflowEngine, _gameflow_ref),
+    (PublicMoneyEngine, _public_ref),
+    (PsychologicalBiasEngine, _psybias_ref),
+]
+
+
+# ----------------------------------------------------------------------
+# MATCH FRAME
+# ----------------------------------------------------------------------
+def test_from_dict_columns_and_defaults():
+    frame = MatchFrame.from_dict(MATCHES)
+
+    assert frame.ids == ["a", "b", "c", "d"]
+    assert not frame.has("name")
+    assert list(frame.empty) == [False, False, False, True]
+
+    pace = frame.col("pace", 1.0)
+    assert list(pace) == [1.2, 1.0, 1.0, 1.0]
+    assert np.isnan(frame.raw("pace")[2])
+    assert list(frame.col("nincs_ilyen", 0.3)) == [0.3] * 4
+
+
+def test_row_returns_numeric_fields_only():
+    frame = MatchFrame.from_dict(MATCHES)
+
+    assert frame.row("c") == {"xg_ratio": 0.6}
+    assert frame.row("d") == {}
+
+
+def test_as_frame_reuses_existing_frame():
+    frame = MatchFrame.from_dict(MATCHES)
+    assert as_frame(frame) is frame
+
+
+# ----------------------------------------------------------------------
+# predict_frame ≡ soronkénti dict implementáció
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("engine_cls, reference", REFERENCES)
+def test_predict_matches_scalar_reference(engine_cls, reference):
+    engine = engine_cls({})
+    out = engine.predict(MATCHES)
+
+    assert list(out) == list(MATCHES)
+    for match_id, data in MATCHES.items():
+        prob, conf, risk = reference(engine, _numeric(data))
+        assert out[match_id]["probability"] == round(prob, 4)
+        assert out[match_id]["confidence"] == round(conf, 3)
+        assert out[match_id]["risk"] == round(risk, 3)
+
+
+@pytest.mark.parametrize("engine_cls", [cls for cls, _ in REFERENCES])
+def test_dict_and_frame_inputs_agree(engine_cls):
+    engine = engine_cls({})
+    assert engine.predict(MATCHES) == engine.predict(MatchFrame.from_dict(MATCHES))
+
+
+def test_quantum_dict_and_frame_agree_with_same_seed():
+    engine = QuantumSynthEngine({})
+
+    np.random.seed(7)
+    from_dict = engine.predict(MATCHES)
+    np.random.seed(7)
+    from_frame = engine.predict(MatchFrame.from_dict(MATCHES))
+
+    assert from_dict == from_frame
+    # üres sor → fallback, a zajtól függetlenül
+    assert from_dict["d"]["probability"] == round(_clip(engine.fallback_prob * engine.scaling), 4)
+
+
+def test_core_error_falls_back_for_whole_slate(monkeypatch):
+    engine = InjuryEngine({})
+    monkeypatch.setattr(engine, "_injury_core", lambda frame: 1 / 0)
+
+    out = engine.predict(MATCHES)
+    assert {o["probability"] for o in out.values()} == {engine.fallback_prob}
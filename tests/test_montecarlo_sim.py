@@ -0,0 +1,188 @@
+# tests/test_montecarlo_sim.py
+
+import math
+
+import numpy as np
+import pytest
+
+from backend.core.mc_parallel import shard_ranges, split_count
+from backend.core.montecarlo_sim import (
+    ci_half_width, counts_to_probs, simulate_adaptive, simulate_counts, simulate_parallel
+)
+
+
+LAM_H = np.array([0.4, 1.3, 2.2, 3.5])
+LAM_A = np.array([1.9, 1.1, 0.7, 3.0])
+MAX_GOALS = 6
+
+
+def clipped_pmf(lam, max_goals):
+    """P(min(X, max_goals) = k) – a szimuláció levágott gólszáma."""
+    p = [math.exp(-lam) * lam ** k / math.factorial(k) for k in range(max_goals)]
+    return np.array(p + [1.0 - sum(p)])
+
+
+def exact(lam_h, lam_a, max_goals):
+    """Skalár referencia: a levágott Poisson párok pontos eloszlása."""
+    m = np.outer(clipped_pmf(lam_h, max_goals), clipped_pmf(lam_a, max_goals))
+    hg, ag = np.indices(m.shape)
+    goals = np.bincount((hg + ag).ravel(), weights=m.ravel(), minlength=2 * max_goals + 1)
+    return m[hg > ag].sum(), m[hg == ag].sum(), m[hg < ag].sum(), goals
+
+
+def assert_close_to_exact(probs, sims):
+    for i, (lh, la) in enumerate(zip(LAM_H, LAM_A)):
+        home, draw, away, goals = exact(lh, la, MAX_GOALS)
+        for key, p in (("home", home), ("draw", draw), ("away", away)):
+            sigma = math.sqrt(p * (1 - p) / sims)
+            assert abs(probs[key][i] - p) < 5 * sigma + 1e-9, (i, key)
+        np.testing.assert_allclose(probs["total_goals"][i], goals, atol=5 / math.sqrt(sims))
+
+
+def test_vectorised_slate_matches_exact_distribution():
+    sims = 40_000
+    counts = simulate_counts(LAM_H, LAM_A, sims, np.random.default_rng(1), max_goals=MAX_GOALS)
+
+    assert_close_to_exact(counts_to_probs(counts), sims)
+
+
+def test_chunked_draws_match_exact_distribution():
+    sims = 40_000
+    counts = simulate_counts(
+        LAM_H, LAM_A, sims, np.random.default_rng(2), max_goals=MAX_GOALS, chunk_elems=3_000
+    )
+
+    assert_close_to_exact(counts_to_probs(counts), sims)
+
+
+def test_counts_are_conserved():
+    sims = 5_000
+    counts = simulate_counts(
+        LAM_H, LAM_A, sims, np.random.default_rng(3), max_goals=MAX_GOALS, chunk_elems=1_000
+    )
+
+    np.testing.assert_array_equal(counts["home"] + counts["draw"] + counts["away"], sims)
+    np.testing.assert_array_equal(counts["goals"].sum(axis=1), sims)
+    np.testing.assert_array_equal(counts["simulations"], sims)
+
+
+def test_per_match_scalar_loop_agrees():
+    """Meccsenkénti skalár szimuláció vs egyetlen slate-szintű húzás."""
+    sims = 20_000
+    rng = np.random.default_rng(4)
+    slate = counts_to_probs(simulate_counts(LAM_H, LAM_A, sims, rng, max_goals=MAX_GOALS))
+
+    rng = np.random.default_rng(5)
+    for i, (lh, la) in enumerate(zip(LAM_H, LAM_A)):
+        home = 0
+        for _ in range(sims):
+            hg = min(rng.poisson(lh), MAX_GOALS)
+            ag = min(rng.poisson(la), MAX_GOALS)
+            home += hg > ag
+        p = home / sims
+        sigma = math.sqrt(max(p * (1 - p), 1e-4) * 2 / sims)
+        assert abs(slate["home"][i] - p) < 5 * sigma
+
+
+def test_same_seed_reproduces_slate():
+    a = simulate_counts(LAM_H, LAM_A, 2_000, np.random.default_rng(9))
+    b = simulate_counts(LAM_H, LAM_A, 2_000, np.random.default_rng(9))
+
+    for key in a:
+        np.testing.assert_array_equal(a[key], b[key])
+
+
+def test_empty_slate():
+    counts = simulate_counts([], [], 1_000, np.random.default_rng(0))
+    assert counts["home"].shape == (0,)
+
+
+# ----------------------------------------------------------------------
+# ADAPTÍV LEÁLLÁS
+# ----------------------------------------------------------------------
+def test_ci_half_width_matches_binomial_formula():
+    counts = {"home": np.array([300]), "draw": np.array([500]), "away": np.array([200]),
+              "simulations": np.array([1000])}
+
+    assert ci_half_width(counts)[0] == pytest.approx(1.96 * math.sqrt(0.5 * 0.5 / 1000))
+    assert ci_half_width({k: np.array([0]) for k in counts})[0] == np.inf
+
+
+def test_adaptive_stops_when_ci_is_tight():
+    # egyoldalú meccs hamar konvergál, a kiegyenlített később
+    lam_h, lam_a = [5.0, 1.2], [0.2, 1.2]
+    counts = simulate_adaptive(
+        lam_h, lam_a, 200_000, np.random.default_rng(6), tolerance=0.01, step=1_000,
+        max_goals=MAX_GOALS
+    )
+
+    sims = counts["simulations"]
+    assert sims[0] < sims[1] <= 200_000
+    assert (ci_half_width(counts) <= 0.01).all()
+
+    # a leállás előtt egy lépéssel még nem volt elég szűk
+    for i in range(2):
+        n = sims[i] - 1_000
+        p = max(counts["home"][i], counts["draw"][i], counts["away"][i]) / sims[i]
+        assert 1.96 * math.sqrt(p * (1 - p) / max(n, 1)) > 0.01 * 0.8
+
+
+def test_adaptive_respects_min_and_max_simulations():
+    counts = simulate_adaptive(
+        [5.0], [0.2], 3_000, np.random.default_rng(7), tolerance=0.5, step=1_000,
+        min_simulations=2_000
+    )
+    assert counts["simulations"][0] == 2_000
+
+    counts = simulate_adaptive(
+        [1.2], [1.2], 3_000, np.random.default_rng(7), tolerance=1e-6, step=1_000
+    )
+    assert counts["simulations"][0] == 3_000
+
+
+def test_adaptive_estimates_match_exact_distribution():
+    counts = simulate_adaptive(
+        LAM_H, LAM_A, 100_000, np.random.default_rng(8), tolerance=0.004, step=5_000,
+        max_goals=MAX_GOALS
+    )
+    probs = counts_to_probs(counts)
+
+    for i, (lh, la) in enumerate(zip(LAM_H, LAM_A)):
+        home, draw, away, _ = exact(lh, la, MAX_GOALS)
+        assert abs(probs["home"][i] - home) < 0.004 * 2.6
+        assert abs(probs["away"][i] - away) < 0.004 * 2.6
+
+
+# ----------------------------------------------------------------------
+# SHARDOK / PROCESS POOL
+# ----------------------------------------------------------------------
+def test_shard_helpers():
+    assert shard_ranges(5, 2) == [(0, 2), (2, 4), (4, 5)]
+    assert split_count(10, 4) == [4, 4, 2]
+    assert split_count(10, None) == [10]
+
+
+@pytest.mark.parametrize("adaptive", [False, True])
+def test_parallel_is_bit_identical_to_serial(adaptive):
+    lam_h = np.tile(LAM_H, 5)
+    lam_a = np.tile(LAM_A, 5)
+    opts = dict(seed=11, shard_size=3, sim_shard=2_000, adaptive=adaptive, max_goals=MAX_GOALS)
+    if adaptive:
+        opts.update(tolerance=0.02, step=500)
+
+    serial = simulate_parallel(lam_h, lam_a, 5_000, workers=1, **opts)
+    parallel = simulate_parallel(lam_h, lam_a, 5_000, workers=2, **opts)
+
+    for key in serial:
+        np.testing.assert_array_equal(serial[key], parallel[key])
+
+
+def test_sharded_counts_add_up_and_match_exact_distribution():
+    sims = 40_000
+    counts = simulate_parallel(
+        LAM_H, LAM_A, sims, seed=12, shard_size=1, sim_shard=7_000, max_goals=MAX_GOALS
+    )
+
+    np.testing.assert_array_equal(counts["simulations"], sims)
+    np.testing.assert_array_equal(counts["home"] + counts["draw"] + counts["away"], sims)
+    assert_close_to_exact(counts_to_probs(counts), sims)
@@ -0,0 +1,133 @@
+# tests/test_odds_aggregator.py
+
+import threading
+import time
+
+from backend.scraper.odds_aggregator import OddsAggregator
+
+
+PRICE = {"1": 2.0, "X": 3.4, "2": 3.8}
+
+
+def aggregator(**conf):
+    return OddsAggregator({"odds_aggregator": conf})
+
+
+def job(delay, data=PRICE, error=None):
+    def func(*args):
+        time.sleep(delay)
+        if error:
+            raise error
+        return data
+    return func
+
+
+def test_fan_out_statuses():
+    with aggregator(deadline=0.3) as agg:
+        sources, latency = agg._fan_out([
+            ("ok", job(0), ()),
+            ("empty", job(0, data=None), ()),
+            ("error", job(0, error=RuntimeError("down")), ()),
+            ("slow", job(1.0), ()),
+        ])
+
+    assert set(sources) == {"ok"}
+    assert {n: l["status"] for n, l in latency.items()} == {
+        "ok": "ok", "empty": "empty", "error": "error", "slow": "timeout",
+    }
+
+
+def test_leftovers_after_quorum_are_skipped_or_cancelled_not_timeout():
+    release = threading.Event()
+
+    with aggregator(deadline=5, quorum=1, max_workers=2) as agg:
+        start = time.monotonic()
+        sources, latency = agg._fan_out([
+            ("fast", job(0), ()),
+            ("running", lambda: release.wait(2) and PRICE, ()),
+            ("queued_1", job(0.5), ()),
+            ("queued_2", job(0.5), ()),
+        ])
+        elapsed = time.monotonic() - start
+        release.set()
+
+    assert elapsed < 1.0
+    assert latency["fast"]["status"] == "ok"
+    assert latency["running"]["status"] == "skipped"
+    statuses = {latency[n]["status"] for n in ("queued_1", "queued_2")}
+    assert statuses <= {"cancelled", "skipped"} and "timeout" not in statuses
+
+
+def test_close_shuts_down_pool_and_is_reusable():
+    agg = aggregator()
+    agg._fan_out([("a", job(0), ())])
+    pool = agg._executor
+
+    agg.close()
+    assert pool._shutdown
+    assert agg._executor is None
+
+    # újra használható: új pool indul
+    sources, _ = agg._fan_out([("a", job(0), ())])
+    assert sources == {"a": PRICE}
+    agg.close()
+
+
+def test_no_pool_until_first_fan_out():
+    agg = aggregator()
+    assert agg._executor is None
+    agg.close()
+
+
+def test_bulk_fallback_runs_all_matches_in_one_fan_out():
+    slate = [{"match_id": str(i), "home": f"Home{i}", "away": f"Away{i}"} for i in range(6)]
+
+    with aggregator(max_workers=16, slate_deadline=5) as agg:
+        calls = []
+
+        def slow_bet365(home, away):
+            calls.append(home)
+            time.sleep(0.2)
+            return PRICE
+
+        agg._scrape_bet365 = slow_bet365
+        agg._list_oddsportal = lambda: None
+
+        fan_outs = []
+        original = agg._fan_out
+
+        def counting(jobs, **kw):
+            fan_outs.append(len(jobs))
+            return original(jobs, **kw)
+
+        agg._fan_out = counting
+
+        start = time.monotonic()
+        results = agg.get_aggregated_odds_bulk(slate)
+        elapsed = time.monotonic() - start
+
+    # 1 listázó kör + 1 közös fallback kör (6 meccs × 9 buki)
+    assert fan_outs == [9, 54]
+    assert len(calls) == 6
+    assert elapsed < 0.2 * 6
+
+    for m in slate:
+        res = results[m["match_id"]]
+        assert set(res["sources"]) == {"bet365"}
+        assert res["latency"]["bet365"] == {**res["latency"]["bet365"], "status": "ok", "mode": "match"}
+        assert res["latency"]["pinnacle"]["status"] == "empty"
+
+
+def test_bulk_uses_listing_without_fallback_requests():
+    from backend.scraper.team_names import match_key
+
+    with aggregator(bulk_fallback=False) as agg:
+        agg._list_pinnacle = lambda: {match_key("Liverpool", "Arsenal"): PRICE}
+        agg._list_oddsportal = lambda: None
+
+        results = agg.get_aggregated_odds_bulk([
+            {"match_id": "1", "home": "Liverpool FC", "away": "Arsenal"},
+        ])
+
+    assert set(results["1"]["sources"]) == {"pinnacle"}
+    assert results["1"]["latency"]["pinnacle"]["mode"] == "listing"
@@ -0,0 +1,77 @@
+# tests/test_poisson_engine.py
+
+import numpy as np
+import pytest
+
+from backend.core.match_frame import MatchFrame
+from backend.engine.poisson_engine import PoissonEngine
+
+
+MATCHES = {
+    "a": {"xg_home": 1.6, "xg_away": 0.8},
+    "b": {"xg_home": 0.9, "xg_away": 2.1, "attack_home": 1.1, "defense_away": 0.9, "pace": 1.05},
+    "c": {"xg_away": 1.3},                                   # hiányzó xG → fallback λ
+    "d": {"xg_home": 6.0, "xg_away": 0.01},                   # λ vágás [0.1, 5.0]
+    "e": {},
+}
+
+
+@pytest.fixture
+def engine():
+    return PoissonEngine({"poisson": {"max_goals": 10}})
+
+
+def test_batch_lambdas_match_scalar(engine):
+    frame = MatchFrame.from_dict(MATCHES)
+    lam_h, lam_a = engine._lambdas_frame(frame)
+
+    for i, match_id in enumerate(frame.ids):
+        assert (lam_h[i], lam_a[i]) == pytest.approx(engine._lambdas(MATCHES[match_id]))
+
+
+def test_batch_home_prob_matches_scalar_loop(engine):
+    frame = MatchFrame.from_dict(MATCHES)
+    batch = engine.predict_batch(*engine._lambdas_frame(frame))
+
+    for i, match_id in enumerate(frame.ids):
+        assert batch["home"][i] == pytest.approx(
+            engine._calculate_poisson_prob(MATCHES[match_id]), rel=1e-10
+        )
+
+    total = batch["home"] + batch["draw"] + batch["away"]
+    np.testing.assert_allclose(total, 1.0)
+
+
+def test_predict_matches_scalar_pipeline(engine):
+    out = engine.predict(MATCHES)
+
+    for match_id, data in MATCHES.items():
+        prob = engine._calculate_poisson_prob(data)
+        expected = min(0.99, max(0.01, prob * engine.scaling))
+        assert out[match_id]["probability"] == pytest.approx(expected, abs=1e-4)
+        assert out[match_id]["source"] == "Poisson"
+
+
+def test_dict_and_frame_inputs_agree(engine):
+    by_dict = engine.predict(MATCHES)
+    by_frame = engine.predict(MatchFrame.from_dict(MATCHES))
+
+    assert by_dict == by_frame
+
+
+def test_markets_share_the_same_matrix(engine):
+    data = MATCHES["b"]
+    markets = engine.markets(data)
+
+    assert markets["1x2"]["home"] == pytest.approx(engine._calculate_poisson_prob(data))
+
+
+def test_invalid_row_falls_back_alone(engine):
+    matches = {**MATCHES, "bad": {"xg_home": float("inf"), "attack_home": 0.0}}
+    out = engine.predict(matches)
+    clean = engine.predict(MATCHES)
+
+    assert out["bad"]["probability"] == round(min(0.99, 0.50 * engine.scaling), 4)
+    assert np.isnan(out["bad"]["meta"]["draw_prob"])
+    for match_id in MATCHES:
+        assert out[match_id] == clean[match_id]
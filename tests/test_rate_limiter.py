@@ -0,0 +1,197 @@
+# tests/test_rate_limiter.py
+
+import time
+
+import pytest
+
+from backend.scraper.http_cache import HttpCache, CachedSession
+from backend.scraper.rate_limiter import (
+    CircuitBreaker, CircuitOpenError, HostGuard, HostGuardRegistry, TokenBucket
+)
+from backend.scraper.odds_aggregator import OddsAggregator
+
+from conftest import mount_fake
+
+
+URL = "http://example.test/page"
+
+
+# ----------------------------------------------------------------------
+# CIRCUIT BREAKER
+# ----------------------------------------------------------------------
+def test_breaker_opens_after_threshold():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+
+def test_success_resets_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_allows_single_probe():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+
+
+def test_half_open_success_closes():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow() and breaker.allow()
+
+
+def test_half_open_failure_reopens():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0.05)
+    for _ in range(3):
+        breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow()
+
+    # egyetlen hiba elég, a küszöbtől függetlenül
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+
+# ----------------------------------------------------------------------
+# TOKEN BUCKET / HOST GUARD
+# ----------------------------------------------------------------------
+def test_bucket_burst_then_wait():
+    bucket = TokenBucket(rate=10, burst=2)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+
+
+def test_bucket_aimd():
+    bucket = TokenBucket(rate=4, burst=4, min_rate=1, increase=1, decrease=0.5)
+
+    bucket.slow_down()
+    assert bucket.rate == 2
+    bucket.slow_down()
+    bucket.slow_down()
+    assert bucket.rate == 1
+
+    for _ in range(10):
+        bucket.speed_up()
+    assert bucket.rate == 4
+
+
+def test_guard_rejects_when_wait_exceeds_max_wait():
+    guard = HostGuard("example.test", {"rate": 1, "burst": 1, "max_wait": 0.5})
+
+    guard.before_request()
+    with pytest.raises(CircuitOpenError):
+        guard.before_request()
+    assert guard.counters["rejected"] == 1
+
+
+def test_guard_throttle_status_slows_down_and_opens():
+    guard = HostGuard("example.test", {"rate": 4, "failure_threshold": 2})
+
+    guard.record(status=429)
+    assert guard.bucket.rate == 2
+    guard.record(status=503)
+
+    assert guard.health()["state"] == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        guard.before_request()
+
+
+# ----------------------------------------------------------------------
+# CONFIG
+# ----------------------------------------------------------------------
+def test_registry_applies_default_and_host_config():
+    registry = HostGuardRegistry({"rate_limit": {
+        "default": {"rate": 7, "burst": 3},
+        "hosts": {"slow.test": {"rate": 1}},
+    }})
+
+    assert registry.guard("fast.test").bucket.rate == 7
+    slow = registry.guard("slow.test")
+    assert slow.bucket.rate == 1
+    assert slow.bucket.burst == 3
+
+
+def test_scraper_config_reaches_shared_registry():
+    HostGuardRegistry.shared()
+    OddsAggregator({"rate_limit": {"default": {"rate": 42}}})
+
+    assert HostGuardRegistry.shared().guard("example.test").bucket.rate == 42
+
+
+def test_configless_session_keeps_registry_settings():
+    HostGuardRegistry.shared({"rate_limit": {"default": {"rate": 42}}})
+    CachedSession(config={"http_cache": {}})
+
+    assert HostGuardRegistry.shared().guard("example.test").bucket.rate == 42
+
+
+def test_new_session_keeps_open_breakers():
+    config = {"rate_limit": {"default": {"rate": 4, "failure_threshold": 1}}}
+    guard = HostGuardRegistry.shared(config).guard("example.test")
+    guard.record(status=503)
+
+    CachedSession(config=config)
+    CachedSession(config={"rate_limit": {"default": {"rate": 4, "failure_threshold": 1}}})
+
+    health = HostGuardRegistry.shared().health()
+    assert health["example.test"]["state"] == CircuitBreaker.OPEN
+    assert health["example.test"]["rate"] == 2
+
+
+def test_changed_config_applies_to_existing_guards():
+    registry = HostGuardRegistry.shared({"rate_limit": {"default": {"rate": 4, "failure_threshold": 1}}})
+    backed_off = registry.guard("slow.test")
+    backed_off.record(status=429)
+    fresh = registry.guard("fast.test")
+
+    HostGuardRegistry.shared({"rate_limit": {"default": {"rate": 8, "failure_threshold": 5, "max_wait": 2}}})
+
+    # ugyanazok a guard objektumok, az állapot megmarad
+    assert registry.guard("slow.test") is backed_off
+    assert backed_off.breaker.state == CircuitBreaker.OPEN
+    assert backed_off.bucket.rate == 2
+    assert backed_off.breaker.failure_threshold == 5
+    assert backed_off.max_wait == 2
+
+    assert fresh.bucket.rate == 8
+
+
+def test_disabled_limiter_bypasses_guard():
+    guards = HostGuardRegistry({"rate_limit": {
+        "enabled": False,
+        "default": {"rate": 1, "burst": 1, "max_wait": 0},
+    }})
+    session = CachedSession(cache=HttpCache({"http_cache": {"ttl": {"example.test": 0}}}), guards=guards)
+    transport = mount_fake(session, lambda req: (500, {}, "err"))
+
+    for _ in range(5):
+        session.get(URL)
+
+    assert len(transport.calls) == 5
+    assert guards.health() == {}
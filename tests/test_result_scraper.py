@@ -0,0 +1,143 @@
+# tests/test_result_scraper.py
+
+import json
+
+import pytest
+
+from backend.core.label_generator import LabelGenerator
+from backend.reporting.bankroll_updater import BankrollUpdater
+from backend.scraper.result_scraper import ResultScraper
+
+from conftest import mount_fake
+
+
+DATE = "2025-11-23"
+
+DAY = {"events": [
+    {"id": 101, "status": {"type": "finished"},
+     "homeTeam": {"name": "Liverpool"}, "awayTeam": {"name": "Arsenal"},
+     "homeScore": {"current": 2}, "awayScore": {"current": 1}},
+    {"id": 102, "status": {"type": "finished"},
+     "homeTeam": {"name": "Chelsea"}, "awayTeam": {"name": "Everton"},
+     "homeScore": {"current": 0}, "awayScore": {"current": 0}},
+    {"id": 103, "status": {"type": "inprogress"},
+     "homeTeam": {"name": "Leeds"}, "awayTeam": {"name": "Fulham"},
+     "homeScore": {"current": 1}, "awayScore": {"current": 0}},
+]}
+
+EVENT_201 = {"event": {"homeScore": {"current": 1}, "awayScore": {"current": 3}}}
+
+
+def respond(req):
+    if "scheduled-events" in req.url:
+        return 200, {}, json.dumps(DAY)
+    if req.url.endswith("/event/201"):
+        return 200, {}, json.dumps(EVENT_201)
+    return 404, {}, ""
+
+
+@pytest.fixture
+def scraper():
+    s = ResultScraper({
+        "http_cache": {"ttl": {"api.sofascore.com": 0}},
+        "rate_limit": {"enabled": False},
+    })
+    mount_fake(s.session, respond)
+    return s
+
+
+TIPS = [
+    {"match_id": "101", "odds": 1.8, "stake": 10, "probability": 0.6, "value_score": 0.3},
+    {"match_id": "x-chelsea", "home": "Chelsea FC", "away": "Everton",
+     "selection": "2", "odds": {"1": 2.0, "X": 3.3, "2": 4.0}, "stake": 5, "ev": 0.05},
+    {"match_id": "201", "market_type": "total", "selection": "over", "line": 2.5,
+     "odds": 1.9, "stake": 4, "features": {"xg_total": 2.9}},
+    {"match_id": "103", "odds": 2.0, "stake": 1},
+]
+
+
+def test_joins_tips_by_id_team_names_and_single_fetch(scraper):
+    records = {r["match_id"]: r for r in scraper.load_daily_results(DATE, tips=TIPS)}
+
+    # 103 még nem fejeződött be → kimarad
+    assert set(records) == {"101", "x-chelsea", "201"}
+
+    assert records["101"]["result"] == "win"
+    assert records["101"]["profit"] == 8.0
+    assert records["x-chelsea"]["result"] == "loss"
+    assert records["x-chelsea"]["odds"] == 4.0
+    assert records["x-chelsea"]["profit"] == -5.0
+    assert records["201"]["result"] == "win"
+    assert records["201"]["goals_away"] == 3
+
+
+def test_record_carries_ev_and_features(scraper):
+    records = {r["match_id"]: r for r in scraper.load_daily_results(DATE, tips=TIPS)}
+
+    assert records["101"]["ev"] == pytest.approx(0.6 * 1.8 - 1, abs=1e-4)
+    assert records["101"]["features"] == {"probability": 0.6, "odds": 1.8, "value_score": 0.3}
+    assert records["x-chelsea"]["ev"] == 0.05
+    assert records["201"]["features"] == {"xg_total": 2.9}
+    assert records["101"]["date"] == DATE
+
+
+def test_no_tips_no_requests(scraper):
+    assert scraper.load_daily_results(DATE, tips=[]) == []
+
+
+@pytest.mark.parametrize("tip, score, expected", [
+    ({"selection": "1"}, (2, 1), "win"),
+    ({"selection": "X"}, (1, 1), "win"),
+    ({"selection": "2"}, (1, 1), "loss"),
+    ({"market_type": "total", "selection": "under", "line": 2.5}, (1, 1), "win"),
+    ({"market_type": "total", "selection": "over", "line": 2}, (1, 1), "push"),
+    ({"market_type": "btts", "selection": "yes"}, (1, 0), "loss"),
+    ({"market_type": "btts", "selection": "no"}, (0, 0), "win"),
+    ({"selection": "corner"}, (0, 0), None),
+])
+def test_settle(tip, score, expected):
+    assert ResultScraper.settle(tip, *score) == expected
+
+
+def test_records_feed_bankroll_updater_and_labels(scraper):
+    records = scraper.load_daily_results(DATE, tips=TIPS)
+    results = {r["match_id"]: r for r in records}
+
+    bankroll = BankrollUpdater({}).update_bankroll(100.0, records, results)
+    assert bankroll == pytest.approx(100 + 8.0 - 5.0 + 3.6)
+
+    labels = LabelGenerator({}).generate_labels(records)
+    assert labels["101"]["label"] > labels["x-chelsea"]["label"]
+    assert labels["201"]["features"] == {"xg_total": 2.9}
+
+
+def test_two_tips_on_one_match_settle_separately(scraper):
+    tips = [
+        {"match_id": "101", "selection": "1", "odds": 2.0, "stake": 10},
+        {"match_id": "101", "selection": "2", "odds": 3.0, "stake": 10},
+    ]
+    records = scraper.load_daily_results(DATE, tips=tips)
+
+    assert [r["result"] for r in records] == ["win", "loss"]
+    assert [r["profit"] for r in records] == [10.0, -10.0]
+    assert BankrollUpdater({}).settle_records(100.0, records) == 100.0
+
+
+def test_tip_without_match_id_does_not_abort_day(scraper):
+    tips = [
+        {"home": "Liverpool", "away": "Arsenal", "odds": 1.8, "stake": 10},
+        {"home": "Ismeretlen", "away": "Csapat", "odds": 2.0, "stake": 5},
+        {"match_id": "201", "market_type": "total", "selection": "over", "line": 2.5,
+         "odds": 1.9, "stake": 4},
+    ]
+    records = scraper.load_daily_results(DATE, tips=tips)
+
+    assert [r["match_id"] for r in records] == [None, "201"]
+    assert records[0]["result"] == "win"
+
+
+def test_label_generator_accepts_outcome_strings():
+    assert LabelGenerator.result_value("win") == 1.0
+    assert LabelGenerator.result_value("loss") == 0.0
+    assert LabelGenerator.result_value("push") == 0.5
+    assert LabelGenerator.result_value(1) == 1.0
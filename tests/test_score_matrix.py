@@ -0,0 +1,95 @@
+# tests/test_score_matrix.py
+
+import math
+
+import numpy as np
+import pytest
+
+from backend.core import score_matrix
+from backend.core.score_matrix import (
+    markets_from_matrix, match_markets, outcome_probs, poisson_pmf_table, score_matrices
+)
+
+
+def pmf(k, lam):
+    return math.exp(-lam) * lam ** k / math.factorial(k)
+
+
+def scalar_1x2(lam_h, lam_a, max_goals):
+    home = draw = away = total = 0.0
+    for hg in range(max_goals + 1):
+        for ag in range(max_goals + 1):
+            p = pmf(hg, lam_h) * pmf(ag, lam_a)
+            total += p
+            if hg > ag:
+                home += p
+            elif hg == ag:
+                draw += p
+            else:
+                away += p
+    return home / total, draw / total, away / total
+
+
+def test_pmf_table_matches_scalar_poisson():
+    lams = [0.1, 0.7, 1.35, 2.9, 5.0]
+    table = poisson_pmf_table(lams, 10)
+
+    expected = [[pmf(k, lam) for k in range(11)] for lam in lams]
+    np.testing.assert_allclose(table, expected, rtol=1e-12)
+
+
+def test_pmf_table_zero_lambda_is_point_mass():
+    table = poisson_pmf_table([0.0, 1.2], 6)
+
+    assert not np.isnan(table).any()
+    np.testing.assert_array_equal(table[0], [1, 0, 0, 0, 0, 0, 0])
+
+
+def test_zero_lambda_markets_are_finite():
+    m = match_markets(0.0, 1.5)
+
+    assert m["1x2"]["home"] == 0.0
+    assert m["1x2"]["draw"] == pytest.approx(math.exp(-1.5) / sum(pmf(k, 1.5) for k in range(11)))
+    assert m["btts"]["yes"] == 0.0
+
+
+def test_outcome_probs_match_scalar_loop():
+    rng = np.random.default_rng(7)
+    lam_h = rng.uniform(0.1, 4.0, 50)
+    lam_a = rng.uniform(0.1, 4.0, 50)
+
+    home, draw, away = outcome_probs(lam_h, lam_a, max_goals=10, chunk_size=16)
+
+    for i in range(50):
+        np.testing.assert_allclose(
+            (home[i], draw[i], away[i]), scalar_1x2(lam_h[i], lam_a[i], 10), rtol=1e-10
+        )
+
+
+def test_markets_consistent_with_outcome_probs():
+    home, draw, away = outcome_probs([1.6], [0.9])
+    m = markets_from_matrix(score_matrices([1.6], [0.9], 10)[0])
+
+    assert m["1x2"]["home"] == pytest.approx(home[0])
+    assert m["1x2"]["draw"] == pytest.approx(draw[0])
+    assert sum(m["correct_score"].values()) == pytest.approx(1.0)
+    assert m["totals"][2.5]["over"] + m["totals"][2.5]["under"] == pytest.approx(1.0)
+
+
+def test_cache_key_is_exact_lambda():
+    score_matrix._cached_markets.cache_clear()
+
+    a = match_markets(1.2341, 1.0)
+    b = match_markets(1.2344, 1.0)
+
+    assert a["1x2"]["home"] != b["1x2"]["home"]
+    assert a == markets_from_matrix(score_matrices([1.2341], [1.0], 10)[0])
+    assert score_matrix.cache_info().misses == 2
+
+
+def test_cached_result_is_a_private_copy():
+    a = match_markets(1.5, 1.1)
+    a["1x2"]["home"] = -1
+
+    assert match_markets(1.5, 1.1)["1x2"]["home"] > 0
+    assert score_matrix.cache_info().hits >= 1
@@ -0,0 +1,58 @@
+# tests/test_team_names.py
+
+from backend.scraper.team_names import MatchIndex, normalize_team, trigrams
+
+
+def dice(a, b):
+    ga, gb = trigrams(normalize_team(a)), trigrams(normalize_team(b))
+    return 2 * len(ga & gb) / (len(ga) + len(gb))
+
+
+def index(threshold=0.6, aliases=None):
+    idx = MatchIndex(aliases=aliases, fuzzy_threshold=threshold)
+    idx.add("Liverpool FC", "Arsenal", "2025-11-23", {"id": 1})
+    idx.add("Manchester United", "Chelsea", "2025-11-23", {"id": 2})
+    return idx
+
+
+def test_exact_normalised_key():
+    idx = index()
+    assert idx.get("liverpool", "Arsenal FC")["id"] == 1
+    assert idx.find("LIVERPOOL", "arsenal", "2025-11-23T15:00")["id"] == 1
+
+
+def test_alias_table():
+    idx = index(aliases={"Man Utd": "Manchester United"})
+    assert idx.get("Man Utd", "Chelsea")["id"] == 2
+
+
+def test_fuzzy_match_above_threshold():
+    assert dice("Liverpol", "Liverpool") >= 0.6
+    assert index().find("Liverpol", "Arsenal")["id"] == 1
+
+
+def test_fuzzy_rejects_below_threshold():
+    score = dice("Liverpol", "Liverpool")
+
+    assert index(threshold=score).find("Liverpol", "Arsenal")["id"] == 1
+    assert index(threshold=score + 0.01).find("Liverpol", "Arsenal") is None
+
+
+def test_both_teams_must_clear_threshold():
+    # a hazai jó, a vendég teljesen más
+    assert index().find("Liverpool", "Tottenham") is None
+    assert index().find("Liverpol", "Tottenham") is None
+
+
+def test_fuzzy_respects_date():
+    idx = index()
+    assert idx.find("Liverpol", "Arsenal", "2025-11-23")["id"] == 1
+    assert idx.find("Liverpol", "Arsenal", "2025-12-01") is None
+
+
+def test_best_candidate_wins():
+    idx = MatchIndex(fuzzy_threshold=0.3)
+    idx.add("Real Madrid", "Getafe", None, {"id": "real"})
+    idx.add("Real Betis", "Getafe", None, {"id": "betis"})
+
+    assert idx.find("Real Madri", "Getafe")["id"] == "real"
@@ -0,0 +1,142 @@
+# tests/test_tippmixpro_index.py
+
+import datetime
+import threading
+import time
+
+from backend.core.master_data_loader import MasterDataLoader
+from backend.scraper.tippmixpro_scraper import TippmixProScraper
+
+from conftest import mount_fake
+
+
+TODAY = datetime.date.today().isoformat()
+
+CARD = (
+    '<div class="match-item" data-date="{date}">'
+    '<a href="/esemeny/{n}"><span class="team-home">{home}</span> - '
+    '<span class="team-away">{away}</span></a>'
+    '<button class="odd-button"><span class="label">1</span><span class="value">1.9</span></button>'
+    '</div>'
+)
+
+
+def page(*teams):
+    cards = "".join(
+        CARD.format(date=TODAY, n=n, home=h, away=a) for n, (h, a) in enumerate(teams)
+    )
+    return f"<html><body>{cards}</body></html>"
+
+
+def scraper(respond, **tmx):
+    config = {
+        "tippmixpro": {"index_mode": True, **tmx},
+        "http_cache": {"ttl": {"www.tippmixpro.hu": 0}},
+        "rate_limit": {"enabled": False},
+    }
+    s = TippmixProScraper(config)
+    return s, mount_fake(s.session, respond)
+
+
+def offer(pages):
+    """pages: [html, ...] → page=N kérésre az N. oldal, utána üres oldal."""
+    def respond(req):
+        n = int(req.url.rsplit("page=", 1)[1])
+        return 200, {}, pages[n - 1] if n <= len(pages) else "<html></html>"
+    return respond
+
+
+def test_index_built_once_and_reused():
+    s, transport = scraper(offer([page(("Liverpool", "Arsenal"))]))
+
+    assert s.find_match("Liverpool FC", "Arsenal")["event_url"].endswith("/esemeny/0")
+    assert s.find_match("Liverpool", "Arsenal") is not None
+    assert len(transport.calls) == 2          # 1 oldal + üres lezáró oldal
+
+
+def test_failed_crawl_keeps_previous_index():
+    state = {"fail": False}
+    good = offer([page(("Liverpool", "Arsenal"))])
+
+    def respond(req):
+        return (500, {}, "") if state["fail"] else good(req)
+
+    s, transport = scraper(respond, index_ttl=0, index_retry=60)
+    assert s.find_match("Liverpool", "Arsenal") is not None
+
+    state["fail"] = True
+    time.sleep(0.01)
+    assert s.find_match("Liverpool", "Arsenal") is not None
+
+    # a backoff alatt nincs újabb crawl
+    calls = len(transport.calls)
+    assert s.find_match("Liverpool", "Arsenal") is not None
+    assert len(transport.calls) == calls
+
+
+def test_empty_index_is_not_cached():
+    pages = []
+    s, transport = scraper(offer(pages), index_retry=0)
+
+    assert s.find_match("Liverpool", "Arsenal") is None
+    assert s._index is None
+
+    pages.append(page(("Liverpool", "Arsenal")))
+    assert s.find_match("Liverpool", "Arsenal") is not None
+
+
+def test_failed_first_crawl_backs_off():
+    s, transport = scraper(lambda req: (503, {}, ""), index_retry=60)
+
+    assert s.get_today_matches() == []
+    assert s.get_today_matches() == []
+    assert len(transport.calls) == 1
+
+
+def test_readers_not_blocked_by_rebuild():
+    release = threading.Event()
+    good = offer([page(("Liverpool", "Arsenal"))])
+    state = {"slow": False}
+
+    def respond(req):
+        if state["slow"]:
+            release.wait(2)
+        return good(req)
+
+    s, _ = scraper(respond, index_ttl=0)
+    s.get_today_matches()
+
+    state["slow"] = True
+    builder = threading.Thread(target=s.get_today_matches)
+    builder.start()
+    time.sleep(0.05)
+
+    start = time.monotonic()
+    assert s.find_match("Liverpool", "Arsenal") is not None
+    assert time.monotonic() - start < 0.5
+
+    release.set()
+    builder.join()
+
+
+def test_get_today_matches_without_index_mode_does_not_crawl():
+    s, transport = scraper(offer([page(("Liverpool", "Arsenal"))]), index_mode=False)
+
+    assert s.get_today_matches() == []
+    assert transport.calls == []
+
+
+def test_data_loader_falls_back_to_search_without_index():
+    search = (
+        '<html><div class="match-item"><a href="/esemeny/7">Liverpool - Arsenal</a></div></html>'
+    )
+
+    def respond(req):
+        return 200, {}, search if "searchText" in req.url else "<html></html>"
+
+    s, transport = scraper(respond, index_mode=False)
+    loader = MasterDataLoader({}, s, None, None, None)
+
+    match = loader._find_tmx_match({"home": "Liverpool", "away": "Arsenal"})
+    assert match["tmx_id"].endswith("/esemeny/7")
+    assert all("searchText" in r.url for r in transport.calls)
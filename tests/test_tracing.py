@@ -0,0 +1,101 @@
+# tests/test_tracing.py
+
+import json
+
+import pytest
+
+from backend.system.tracing import Tracer, traced
+
+
+class Engine:
+    @traced()
+    def predict(self, x):
+        return x * 2
+
+
+def test_disabled_by_default():
+    tracer = Tracer.shared({})
+
+    with tracer.span("stage"):
+        pass
+
+    assert not tracer.enabled
+    assert tracer.summary() == {}
+
+
+def test_traced_does_not_create_tracer():
+    assert Engine().predict(2) == 4
+    assert Tracer.current() is None
+
+
+def test_traced_records_when_enabled_at_startup():
+    Tracer.shared({"tracing": {"enabled": True}})
+
+    Engine().predict(1)
+    Engine().predict(2)
+
+    stats = Tracer.current().summary()["Engine.predict"]
+    assert stats["count"] == 2
+    assert stats["category"] == "engine"
+
+
+def test_configless_caller_keeps_startup_config():
+    Tracer.shared({"tracing": {"enabled": True}})
+    Tracer.shared({"pipeline": {}})
+
+    assert Tracer.current().enabled
+
+
+def test_nested_spans_and_errors():
+    tracer = Tracer.shared({"tracing": {"enabled": True}})
+
+    with pytest.raises(ValueError):
+        with tracer.span("outer"):
+            with tracer.span("inner"):
+                raise ValueError("x")
+
+    inner = next(e for e in tracer.events if e["name"] == "inner")
+    assert inner["args"] == {"parent": "outer", "error": "ValueError"}
+    assert tracer.summary()["outer"]["errors"] == 1
+
+
+class Recorder:
+    def __init__(self):
+        self.warnings = []
+
+    def warning(self, msg):
+        self.warnings.append(msg)
+
+    def __getattr__(self, name):
+        return lambda *a, **k: None
+
+
+def test_event_cap_keeps_latest_and_warns(tmp_path):
+    tracer = Tracer({"tracing": {"enabled": True, "max_events": 3}})
+    tracer.logger = Recorder()
+
+    for i in range(5):
+        with tracer.span(f"s{i}"):
+            pass
+
+    assert [e["name"] for e in tracer.events] == ["s2", "s3", "s4"]
+    assert tracer.dropped == 2
+    assert len(tracer.logger.warnings) == 1
+
+    # a statisztika a kiesett spaneket is tartalmazza
+    assert sum(s["count"] for s in tracer.summary().values()) == 5
+
+    path = tracer.export_chrome_trace(str(tmp_path / "trace.json"))
+    payload = json.loads(open(path, encoding="utf-8").read())
+    assert len(payload["traceEvents"]) == 3
+    assert payload["otherData"]["dropped_events"] == 2
+
+
+def test_reset_clears_events_and_drop_counter():
+    tracer = Tracer({"tracing": {"enabled": True, "max_events": 1}})
+    for _ in range(3):
+        with tracer.span("s"):
+            pass
+
+    tracer.reset()
+    assert len(tracer.events) == 0 and tracer.dropped == 0 and tracer.summary() == {}